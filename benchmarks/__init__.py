@@ -0,0 +1 @@
+"""Benchmarks of the hdforce parsing and fetch paths. Run with `python -m benchmarks`."""
@@ -0,0 +1,117 @@
+# Dependencies -----
+import json
+from urllib.parse import urlsplit
+import numpy as np
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+# Package imports
+from hdforce.MockServer import MockData
+
+# -------------------- #
+# Synthetic Payloads
+
+# Distinct records cloned to build large test payloads
+_templates = 500
+
+
+def testsPayload(n: int, seed: int = 0, metrics: int = 0) -> bytes:
+    """JSON body of a tests response with `n` trials.
+
+    A few hundred `MockData` trials are cloned with new ids and timestamps, so a million trials are built in
+    seconds while keeping the same nesting, tags and athletes as the generated data. `metrics` adds that many
+    metric values to each trial, for the width of real test types (a CMJ has over a hundred).
+    """
+    data = MockData(trials=min(int(n), _templates), seed=seed)
+    templates = data.tests
+    if metrics:
+        templates = [dict(t, **{f"Metric {j}(N)": round(t["System Weight(N)"] * (1 + j / 100), 2) for j in range(int(metrics))}) for t in templates]
+    start = templates[0]["timestamp"]
+    tests = []
+    for i in range(int(n)):
+        record = dict(templates[i % len(templates)])
+        record["id"] = f"bench{i:015d}"
+        record["timestamp"] = start + 60 * i
+        tests.append(record)
+    last = tests[-1]["timestamp"] if tests else 0
+    return json.dumps({"data": tests, "count": len(tests), "lastSyncTime": last + 60, "lastTestTime": last}).encode("utf-8")
+
+
+def metricsPayload(n: int, seed: int = 0) -> bytes:
+    """JSON body of a metrics response with `n` metrics, spread over the test types."""
+    data = MockData(trials=0, seed=seed)
+    types = data.metrics
+    per_type = -(-int(n) // len(types))
+    payload = []
+    left = int(n)
+    for t in types:
+        template = t["metrics"]
+        count = min(per_type, left)
+        left -= count
+        metrics = []
+        for i in range(count):
+            metric = dict(template[i % len(template)])
+            metric["id"] = f"{metric['id']}{i}"
+            metrics.append(metric)
+        payload.append({"canonicalTestTypeId": t["canonicalTestTypeId"], "testTypeName": t["testTypeName"], "metrics": metrics})
+    return json.dumps(payload).encode("utf-8")
+
+
+def forceTimePayload(n: int, seed: int = 0) -> bytes:
+    """JSON body of a force-time response with `n` samples at 1000 Hz."""
+    rng = np.random.default_rng(seed)
+    x = np.arange(int(n)) / max(int(n), 1)
+    wave = np.where((x > 0.4) & (x < 0.8), np.sin(np.pi * x) ** 2, 0.0)
+    weight = 800.0
+    left = np.round(weight / 2 * (1 + 1.2 * wave) + rng.uniform(-3, 3, len(x)), 1)
+    right = np.round(weight / 2 * (1 + 1.1 * wave) + rng.uniform(-3, 3, len(x)), 1)
+    combined = left + right
+    velocity = np.cumsum((combined - weight) / (weight / 9.81) / 1000)
+    displacement = np.cumsum(velocity / 1000)
+    payload = {
+        "id": "bench000000000000000", "timestamp": 1690000000, "rsi": 0.42,
+        "testType": {"id": "7nNduHeM5zETPjHxvm7s", "name": "Countermovement Jump"},
+        "athlete": {"id": "benchathlete00000000", "name": "Athlete 1"},
+        "Time(s)": np.round((np.arange(len(x)) + 1) / 1000, 3).tolist(),
+        "LeftForce(N)": left.tolist(), "RightForce(N)": right.tolist(), "CombinedForce(N)": np.round(combined, 1).tolist(),
+        "Velocity(m/s)": np.round(velocity, 6).tolist(), "Displacement(m)": np.round(displacement, 6).tolist(),
+        "Power(W)": np.round(combined * velocity, 6).tolist()
+    }
+    return json.dumps(payload).encode("utf-8")
+
+
+# -------------------- #
+# Static Transport
+
+
+class StaticAdapter(BaseAdapter):
+    """Transport answering every request with a fixed body, so benchmarks measure parsing without a network.
+
+    Parameters
+    ----------
+    routes : dict
+        URL path (e.g. "/api/dev/metrics") to JSON body bytes. Token requests are always answered.
+    """
+    def __init__(self, routes: dict):
+        super().__init__()
+        self.routes = routes
+
+    def send(self, request, **kwargs):
+        path = urlsplit(request.url).path
+        if path == "/api/token":
+            body = json.dumps({"access_token": "bench-access-token", "expires_at": 4102444800}).encode("utf-8")
+        else:
+            body = self.routes.get(path)
+        response = requests.Response()
+        response.status_code = 200 if body is not None else 404
+        response.reason = "OK" if body is not None else "Not Found"
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        response._content = body if body is not None else b'{"message": "Not Found"}'
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
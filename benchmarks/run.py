@@ -0,0 +1,410 @@
+"""Benchmarks of the hdforce parsing and fetch paths.
+
+Every case runs in its own Python process, so its peak memory is not mixed with other cases. Each case
+reports:
+
+- seconds: best wall time of `--repeat` runs.
+- rss_mb / rss_peak_mb: resident memory before the runs and at its peak during them.
+- alloc_peak_mb: peak of Python allocations during one more run, traced with `tracemalloc`.
+
+Import cases time one import statement in a new process per run, and list the heavy dependencies it loaded.
+
+Usage
+-----
+    python -m benchmarks                         # 100 to 100k trials
+    python -m benchmarks --full                  # adds 1M trials
+    python -m benchmarks --cases parse --sizes 1000 10000
+    python -m benchmarks --cases import --repeat 5
+    python -m benchmarks --save benchmarks/baseline.json
+    python -m benchmarks --compare benchmarks/baseline.json
+"""
+# Dependencies -----
+import argparse
+import datetime
+import fnmatch
+import gc
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# -------------------- #
+# Cases
+
+# Root of the repository, so `hdforce` is imported from the source tree
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000]
+
+# Extra metrics of each trial in the wide cases
+WIDE = 120
+FULL_SIZES = DEFAULT_SIZES + [1_000_000]
+
+
+def _client(routes: dict):
+    # Client answered by a static transport, with the endpoint cache off
+    from hdforce import HawkinClient, SessionManager, CacheManager
+    from benchmarks.payloads import StaticAdapter
+    CacheManager.configure(enabled=False)
+    SessionManager.configure(transport=StaticAdapter(routes))
+    return HawkinClient(refreshToken="benchmark", region="http://bench.local")
+
+
+def parse_responseHandler(n: int):
+    """`responseHandler` on a decoded tests response of `n` trials."""
+    from hdforce.utils import responseHandler
+    from benchmarks.payloads import testsPayload
+    data = json.loads(testsPayload(n))
+    return lambda: responseHandler(data)
+
+
+def parse_responseHandler_wide(n: int):
+    """`responseHandler` on `n` trials of 120 metrics each."""
+    from hdforce.utils import responseHandler
+    from benchmarks.payloads import testsPayload
+    data = json.loads(testsPayload(n, metrics=WIDE))
+    return lambda: responseHandler(data)
+
+
+def parse_responseHandler_columns(n: int):
+    """`responseHandler` on `n` trials of 120 metrics each, building 5 metric columns."""
+    from hdforce.utils import responseHandler
+    from benchmarks.payloads import testsPayload
+    data = json.loads(testsPayload(n, metrics=WIDE))
+    columns = ["Jump Height(m)", "mRSI", "Metric 0(N)", "Metric 50(N)", "Metric 100(N)"]
+    return lambda: responseHandler(data, columns)
+
+
+def _decode(body: bytes, decoder: str):
+    # Time `responseJson` decoding a body with one of the `DecoderManager` decoders
+    import requests
+    from hdforce.utils import DecoderManager, responseJson
+    DecoderManager.configure(decoder)
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.encoding = "utf-8"
+    return lambda: responseJson(response)
+
+
+def decode_json(n: int):
+    """Standard library decoding of a tests response of `n` trials, the `response.json()` path."""
+    from benchmarks.payloads import testsPayload
+    return _decode(testsPayload(n), "json")
+
+
+def decode_orjson(n: int):
+    """orjson decoding of a tests response of `n` trials."""
+    from benchmarks.payloads import testsPayload
+    return _decode(testsPayload(n), "orjson")
+
+
+def parse_GetMetrics(n: int):
+    """`GetMetrics` decoding and normalizing `n` metrics from a static transport."""
+    from hdforce import GetMetrics
+    from benchmarks.payloads import metricsPayload
+    client = _client({"/api/dev/metrics": metricsPayload(n)})
+    return lambda: GetMetrics(client=client)
+
+
+def parse_GetForceTime(n: int):
+    """`GetForceTime` decoding `n` samples into a DataFrame from a static transport."""
+    from hdforce import GetForceTime
+    from benchmarks.payloads import forceTimePayload
+    client = _client({"/api/dev/forcetime/bench000000000000000": forceTimePayload(n)})
+    return lambda: GetForceTime("bench000000000000000", client=client)
+
+
+def parse_GetForceTime_json(n: int):
+    """`GetForceTime` of `n` samples as `parse.GetForceTime`, decoded with the standard library."""
+    from hdforce import DecoderManager
+    call = parse_GetForceTime(n)
+    DecoderManager.configure("json")
+    return call
+
+
+def e2e_GetTests(n: int):
+    """`GetTests` of `n` trials from a `MockServer`."""
+    from hdforce import GetTests, HawkinClient, MockServer, CacheManager
+    CacheManager.configure(enabled=False)
+    server = MockServer(trials=n).start()
+    client = HawkinClient(refreshToken="benchmark", region=server.url)
+    return lambda: GetTests(client=client)
+
+
+def e2e_GetTests_stream(n: int):
+    """`GetTests(stream=True)` of `n` trials from a `MockServer`, parsing while the response is read."""
+    from hdforce import GetTests, HawkinClient, MockServer, CacheManager
+    CacheManager.configure(enabled=False)
+    server = MockServer(trials=n).start()
+    client = HawkinClient(refreshToken="benchmark", region=server.url)
+    return lambda: GetTests(stream=True, client=client)
+
+
+def e2e_GetForceTime(n: int):
+    """`GetForceTime` of one trial with `n` samples from a `MockServer`."""
+    from hdforce import GetForceTime, HawkinClient, MockServer, MockData, CacheManager
+
+    class Data(MockData):
+        # Generate the trace once, so runs time the request rather than the synthetic data
+        def makeForceTime(self, test, _traces={}):
+            if test["id"] not in _traces:
+                _traces[test["id"]] = super().makeForceTime(test)
+            return _traces[test["id"]]
+
+    CacheManager.configure(enabled=False)
+    data = Data(trials=1, samples=n)
+    testId = data.tests[0]["id"]
+    data.makeForceTime(data.tests[0])
+    server = MockServer(data=data).start()
+    client = HawkinClient(refreshToken="benchmark", region=server.url)
+    return lambda: GetForceTime(testId, client=client)
+
+
+# Import case name: statement timed in a fresh process
+IMPORTS = {
+    "import.hdforce": "import hdforce",
+    "import.AuthManager": "from hdforce import AuthManager",
+    "import.HawkinClient": "from hdforce import HawkinClient",
+    "import.GetTests": "from hdforce import GetTests",
+}
+
+# Dependencies reported as loaded by an import case
+HEAVY = ("pandas", "numpy", "pydantic", "requests", "dotenv")
+
+# Case name: (setup, largest size). Setup builds the input outside the measurement and returns the call to time.
+CASES = {
+    "parse.responseHandler": (parse_responseHandler, None),
+    "parse.responseHandler.wide": (parse_responseHandler_wide, 100_000),
+    "parse.responseHandler.columns": (parse_responseHandler_columns, 100_000),
+    "parse.GetMetrics": (parse_GetMetrics, None),
+    "parse.GetForceTime": (parse_GetForceTime, None),
+    "parse.GetForceTime.json": (parse_GetForceTime_json, None),
+    "decode.json": (decode_json, None),
+    "decode.orjson": (decode_orjson, None),
+    # The mock server builds and encodes its responses in Python, which limits the practical sizes
+    "e2e.GetTests": (e2e_GetTests, 100_000),
+    "e2e.GetTests.stream": (e2e_GetTests_stream, 100_000),
+    "e2e.GetForceTime": (e2e_GetForceTime, 1_000_000),
+}
+
+# Cases needing an optional package, skipped when it is not installed
+OPTIONAL = {"decode.orjson": "orjson"}
+
+# -------------------- #
+# Measurement
+
+
+def _memory() -> tuple:
+    # Current and peak resident memory of this process in bytes, where the platform reports them
+    try:
+        with open("/proc/self/status") as f:
+            status = dict(line.split(":", 1) for line in f if ":" in line)
+        return int(status["VmRSS"].split()[0]) * 1024, int(status["VmHWM"].split()[0]) * 1024
+    except (OSError, KeyError, ValueError):
+        pass
+    if resource is None:
+        return None, None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak = peak if sys.platform == "darwin" else peak * 1024
+    return None, peak
+
+
+def _reset_peak() -> bool:
+    # Reset the peak resident memory to the current value (Linux only)
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _mb(value):
+    return None if value is None else round(value / 2**20, 2)
+
+
+def measure_import(case: str) -> dict:
+    """Time the import statement of an import case, in this (fresh) process."""
+    rss, _ = _memory()
+    modules = len(sys.modules)
+    start = time.perf_counter()
+    exec(IMPORTS[case], {})
+    seconds = time.perf_counter() - start
+    _, peak = _memory()
+    return {
+        "case": case,
+        "size": 1,
+        "seconds": round(seconds, 6),
+        "rss_mb": _mb(rss),
+        "rss_peak_mb": _mb(peak),
+        "alloc_peak_mb": None,
+        "modules": len(sys.modules) - modules,
+        "loaded": [name for name in HEAVY if name in sys.modules],
+    }
+
+
+def measure(case: str, n: int, repeat: int) -> dict:
+    """Run one case in this process and return its measurements."""
+    if case in IMPORTS:
+        return measure_import(case)
+    setup, _ = CASES[case]
+    call = setup(n)
+    gc.collect()
+    rss, _ = _memory()
+    peak_reset = _reset_peak()
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    _, peak = _memory()
+
+    gc.collect()
+    tracemalloc.start()
+    call()
+    _, alloc_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "case": case,
+        "size": n,
+        "seconds": round(min(times), 6),
+        "mean_seconds": round(sum(times) / len(times), 6),
+        "rss_mb": _mb(rss),
+        "rss_peak_mb": _mb(peak),
+        "peak_includes_setup": not peak_reset,
+        "alloc_peak_mb": _mb(alloc_peak),
+    }
+
+
+def run(case: str, n: int, repeat: int) -> dict:
+    """Run one case in a new Python process, or an import case in `repeat` new processes."""
+    results = []
+    for _ in range(repeat if case in IMPORTS else 1):
+        command = [sys.executable, "-m", "benchmarks.run", "--child", case, str(n), str(repeat)]
+        proc = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+        if proc.returncode != 0:
+            return {"case": case, "size": n, "error": proc.stderr.strip().splitlines()[-1:] or ["failed"]}
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return min(results, key=lambda r: r["seconds"])
+
+
+# -------------------- #
+# Reports
+
+
+def environment() -> dict:
+    """Versions and platform the results were measured on."""
+    versions = {}
+    for name in ("hdforce", "pandas", "numpy", "requests", "orjson"):
+        try:
+            from importlib.metadata import version
+            versions[name] = version(name)
+        except Exception:
+            versions[name] = None
+    return {
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "versions": versions,
+    }
+
+
+def compare(results: list, baseline: dict, threshold: float) -> list:
+    """Results slower or allocating more than `threshold` times the baseline."""
+    previous = {(r["case"], r["size"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        before = previous.get((result["case"], result["size"]))
+        if before is None or "error" in result or "error" in before:
+            continue
+        for key in ("seconds", "alloc_peak_mb"):
+            if before.get(key) and result.get(key) and result[key] > before[key] * threshold:
+                regressions.append((result["case"], result["size"], key, before[key], result[key]))
+    return regressions
+
+
+def _row(result: dict) -> str:
+    if "error" in result:
+        return f"{result['case']:<32}{result['size']:>10,}  error: {' '.join(result['error'])}"
+    peak = "-" if result["rss_peak_mb"] is None else f"{result['rss_peak_mb']:.1f}"
+    alloc = "-" if result["alloc_peak_mb"] is None else f"{result['alloc_peak_mb']:.1f}"
+    row = f"{result['case']:<32}{result['size']:>10,}{result['seconds']:>12.4f}{peak:>14}{alloc:>14}"
+    if "loaded" in result:
+        row += f"  loads: {', '.join(result['loaded']) or '-'}"
+    return row
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark hdforce parsing and fetch paths.")
+    parser.add_argument("--cases", nargs="*", default=["*"], help="Case names or patterns, e.g. parse.* or e2e.GetTests")
+    parser.add_argument("--sizes", nargs="*", type=int, help="Trials (samples for force-time, metrics for GetMetrics). Default 100 to 100k")
+    parser.add_argument("--full", action="store_true", help="Include 1M")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs of each case. Default 3")
+    parser.add_argument("--save", help="Write the results to a JSON file")
+    parser.add_argument("--compare", help="Compare with a saved JSON baseline and exit 1 on a regression")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Slowdown ratio counted as a regression. Default 1.25")
+    parser.add_argument("--child", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        case, n, repeat = args.child
+        print(json.dumps(measure(case, int(n), int(repeat))))
+        return 0
+
+    patterns = [p if any(c in p for c in "*?[") else p + "*" for p in args.cases]
+    cases = [c for c in list(IMPORTS) + list(CASES) if any(fnmatch.fnmatch(c, p) for p in patterns)]
+    sizes = args.sizes or (FULL_SIZES if args.full else DEFAULT_SIZES)
+
+    print(f"{'case':<32}{'size':>10}{'seconds':>12}{'rss peak MB':>14}{'alloc MB':>14}")
+    results = []
+    for case in cases:
+        if case in OPTIONAL and importlib.util.find_spec(OPTIONAL[case]) is None:
+            print(f"{case:<32}  skipped: {OPTIONAL[case]} is not installed", flush=True)
+            continue
+        if case in IMPORTS:
+            result = run(case, 1, max(int(args.repeat), 1))
+            results.append(result)
+            print(_row(result), flush=True)
+            continue
+        limit = CASES[case][1]
+        for n in sizes:
+            if limit is not None and n > limit:
+                continue
+            result = run(case, n, max(int(args.repeat), 1))
+            results.append(result)
+            print(_row(result), flush=True)
+
+    report = {"environment": environment(), "repeat": args.repeat, "results": results}
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=1)
+        print(f"Saved {args.save}")
+
+    failed = any("error" in r for r in results)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for case, n, key, before, after in regressions:
+            print(f"Regression {case}[{n:,}] {key}: {before} -> {after} ({after / before:.2f}x)")
+        if not regressions:
+            print(f"No regressions against {args.compare} (threshold {args.threshold}x)")
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,7 @@
-import os
-from dotenv import load_dotenv, set_key
+from dotenv import load_dotenv
 # Package imports
 from .LoggerConfig import LoggerConfig
-from .utils import TokenManager, varsManager, ConfigManager
+from .utils import TokenProvider, varsManager, ConfigManager
 
 # Get a logger specific to this module
 logger = LoggerConfig.get_logger(__name__)
@@ -11,14 +10,14 @@ logger = LoggerConfig.get_logger(__name__)
 # Authenticator
 
 
-def AuthManager(authMethod: str = "env", refreshToken_name: str = "HD_REFRESH_TOKEN", refreshToken: str = None, env_file_name: str = None, region: str = "Americas") -> None:
+def AuthManager(authMethod: str = "env", refreshToken_name: str = "HD_REFRESH_TOKEN", refreshToken: str = None, env_file_name: str = None, region: str = "Americas", renewBefore: int = None) -> None:
     """ Choose the authentication settings
 
 
     Parameters
     ----------
     region : str required
-        The region that designates the url prefix.
+        The region that designates the url prefix. A server URL (e.g. of a `MockServer`) sends requests to that server.
 
     authMethod : str required
         Determine method of storing authentication variables, including refresh token. One of 'env', 'file', 'manual'. env = use of system environment. file = use of .env file. manual = no stored refresh token.
@@ -32,6 +31,9 @@ def AuthManager(authMethod: str = "env", refreshToken_name: str = "HD_REFRESH_TO
     env_file_name : str
         Required with authMethod='file'. Provides file name for variable storage.
 
+    renewBefore : int
+        Optional. Renew the access token in the background this many seconds before it expires, so calls never wait on a refresh.
+
 
     Raises
     ------
@@ -74,62 +76,15 @@ def AuthManager(authMethod: str = "env", refreshToken_name: str = "HD_REFRESH_TO
         kabrv = key[0:6]
         logger.debug(f"Refresh token: {kabrv}xxxx method: {authMethod}")
 
-    # Setup session assuming TokenManager handles authentication
-    session = TokenManager(refreshToken=key, region=region, fileName=env_file_name)
+    # Request access token, held in memory and stored with the selected method
+    provider = TokenProvider(refreshToken=key, region=region, method=authMethod, fileName=env_file_name, renewBefore=renewBefore)
+    provider.refresh()
 
     # Create objects of classes
-    accessToken = str(session.accessToken)
-    tokenExpiration = str(session.ExpirationVal)
-    expirationStr = str(session.ExpirationStr)
-    cloudURL = str(session.url_cloud)
-    fileName = str(session.fileName)
-
-    if authMethod == 'file':
-        load_dotenv(str(fileName), override=True)
-
-        # Set environment variables
-        set_key(fileName, "ACCESS_TOKEN", accessToken)
-        # Environment variable debugging: Access Token
-        if accessToken == os.getenv("ACCESS_TOKEN"):
-            logger.debug(f"New Access Token Set")
-        else:
-            logger.debug(f"Error: new token not found")
-
-        # Environment variable debugging: Token Expiration
-        set_key(fileName, "TOKEN_EXPIRATION", tokenExpiration)
-        if tokenExpiration == os.getenv("TOKEN_EXPIRATION"):
-            logger.debug(f"New expiration Set")
-        else:
-            logger.debug(f"Error: new expiration not passed")
-
-        # Environment variable debugging: Cloud URL
-        set_key(fileName, "CLOUD_URL", cloudURL)
-        if cloudURL == os.getenv("CLOUD_URL"):
-            logger.debug(f"New URL set")
-        else:
-            logger.debug(f"Error: new URL not passed")
-
-    else:
-        # Environment variable debugging: Access Token
-        os.environ['ACCESS_TOKEN'] = accessToken
-        if accessToken == os.getenv("ACCESS_TOKEN"):
-            logger.debug(f"New Access Token Set")
-        else:
-            logger.debug(f"Error: new token not found")
-
-        # Environment variable debugging: Token Expiration
-        os.environ['TOKEN_EXPIRATION'] = tokenExpiration
-        if tokenExpiration == os.getenv("TOKEN_EXPIRATION"):
-            logger.debug(f"New expiration Set")
-        else:
-            logger.debug(f"Error: new expiration not passed")
-
-        # Environment variable debugging: Cloud URL
-        os.environ['CLOUD_URL'] = cloudURL
-        if cloudURL == os.getenv("CLOUD_URL"):
-            logger.debug(f"New URL set")
-        else:
-            logger.debug(f"Error: new URL not passed")
+    accessToken = str(provider.accessToken)
+    tokenExpiration = str(provider.ExpirationVal)
+    cloudURL = str(provider.url_cloud)
+    fileName = str(env_file_name)
 
     # Set environment source in ConfigManager based on authMethod
     if authMethod == 'file':
@@ -141,12 +96,14 @@ def AuthManager(authMethod: str = "env", refreshToken_name: str = "HD_REFRESH_TO
         load_dotenv(str(fileName), override=True)
         # run configuration manager
         ConfigManager.set_env_source(region=region, method=authMethod, fileName=fileName, token_name=refreshToken_name, token=key)
+        ConfigManager.set_token_provider(provider)
         logger.debug(f"ConfigManager methods passed with file env: {fileName}")
 
     # Using environment variables
     elif authMethod == 'env' or 'manual':
         # run configuration manager
         ConfigManager.set_env_source(region=region, method=authMethod, fileName=fileName, token_name=refreshToken_name, token=key)
+        ConfigManager.set_token_provider(provider)
         logger.debug(f"ConfigManager methods passed with {authMethod} method")
 
     # Alert of missing variables
@@ -0,0 +1,171 @@
+# Dependencies -----
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+import numpy as np
+# Package imports
+from .utils import logger, ConfigManager
+from .ForceTimeTrace import ForceTimeTrace, CHANNELS
+
+# -------------------- #
+# Force-Time Archive
+
+# Test ids are used as file names
+_valid_id = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+class ForceTimeArchive:
+    """An on-disk archive of force-time traces, keyed by test id.
+
+    Force-time data does not change once a test is recorded, so each trace is written once as a raw `.npy`
+    array of its channels with its trial details alongside. Traces are read back through memory-mapped arrays,
+    so working through thousands of archived trials only loads the samples that are used. When the archive
+    grows beyond `maxBytes`, the least recently used traces are removed.
+
+    Parameters
+    ----------
+    path : str, optional
+        Folder of the archive. Default is None, using `forcetime` in `ConfigManager.cache_dir`.
+
+    maxBytes : int, optional
+        Size limit of the archive in bytes. Default is None (no limit).
+
+    Attributes
+    ----------
+    path : str
+        Stores the archive folder.
+
+    maxBytes : int
+        Stores the size limit.
+    """
+    def __init__(self, path: str = None, maxBytes: int = None):
+        if path is None:
+            path = os.path.join(ConfigManager.cache_dir, "forcetime")
+        if maxBytes is not None and int(maxBytes) < 1:
+            logger.error("maxBytes must be at least 1")
+            raise ValueError("maxBytes must be at least 1.")
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.maxBytes = maxBytes
+        self._lock = threading.Lock()
+        self._index = self._scan()
+        self._nbytes = sum(self._index.values())
+        logger.debug(f"Force-time archive opened: {path} ({len(self._index)} traces)")
+
+    def _files(self, testId: str) -> tuple:
+        # Channel array, trial details and (uneven sampling only) time array of a test
+        if not isinstance(testId, str) or not _valid_id.match(testId):
+            logger.error(f"Invalid test id for archive: {testId}")
+            raise ValueError(f"Invalid test id: {testId!r}")
+        base = os.path.join(self.path, testId[:2], testId)
+        return base + ".npy", base + ".json", base + ".time.npy"
+
+    def _scan(self) -> OrderedDict:
+        # Archived traces with their size, least recently used first
+        entries = []
+        for folder in os.scandir(self.path):
+            if not folder.is_dir():
+                continue
+            for entry in os.scandir(folder.path):
+                testId = entry.name[:-len(".json")]
+                if entry.name.endswith(".json") and _valid_id.match(testId):
+                    size = sum(os.path.getsize(f) for f in self._files(testId) if os.path.exists(f))
+                    entries.append((entry.stat().st_mtime, testId, size))
+        entries.sort()
+        return OrderedDict((testId, size) for _, testId, size in entries)
+
+    def __contains__(self, testId: str) -> bool:
+        return testId in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self):
+        return f"ForceTimeArchive(path={self.path!r}, traces={len(self)}, nbytes={self.nbytes})"
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the archived traces on disk in bytes."""
+        return self._nbytes
+
+    def get(self, testId: str):
+        """Read an archived trace with memory-mapped channel arrays.
+
+        Returns
+        -------
+        ForceTimeTrace or None
+            The trace, or None if the test is not archived.
+        """
+        array_file, details_file, time_file = self._files(testId)
+        with self._lock:
+            if testId not in self._index:
+                return None
+            self._index.move_to_end(testId)
+        try:
+            with open(details_file) as f:
+                details = json.load(f)
+            arrays = np.load(array_file, mmap_mode="r")
+            time = np.load(time_file, mmap_mode="r") if details.get("time") else None
+            os.utime(details_file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Archived force-time for test {testId} could not be read: {e}")
+            self.remove(testId)
+            return None
+        channels = {name: arrays[i] for i, name in enumerate(CHANNELS.values())}
+        logger.debug(f"Force-Time data for test {testId} read from archive")
+        return ForceTimeTrace.from_arrays(channels, details, sample_rate=details["sample_rate"], start=details["start"], time=time)
+
+    def put(self, trace: ForceTimeTrace):
+        """Archive a trace, removing the least recently used traces if the size limit is passed."""
+        array_file, details_file, time_file = self._files(trace.test_id)
+        os.makedirs(os.path.dirname(array_file), exist_ok=True)
+
+        # Write to temporary files and move into place, so readers never see partial files
+        details = trace.details()
+        details.update({"sample_rate": trace.sample_rate, "start": trace.start, "time": trace.sample_rate is None})
+        arrays = np.stack([getattr(trace, name) for name in CHANNELS.values()])
+        written = [(array_file, arrays)]
+        if trace.sample_rate is None:
+            written.append((time_file, np.asarray(trace.time, dtype=np.float64)))
+        for file, array in written:
+            with open(file + ".tmp", "wb") as f:
+                np.save(f, array)
+            os.replace(file + ".tmp", file)
+        with open(details_file + ".tmp", "w") as f:
+            json.dump(details, f)
+        os.replace(details_file + ".tmp", details_file)
+        size = sum(os.path.getsize(f) for f, _ in written) + os.path.getsize(details_file)
+
+        with self._lock:
+            self._nbytes += size - self._index.get(trace.test_id, 0)
+            self._index[trace.test_id] = size
+            self._index.move_to_end(trace.test_id)
+            evict = []
+            while self.maxBytes is not None and self._nbytes > self.maxBytes and len(self._index) > 1:
+                testId, old = self._index.popitem(last=False)
+                self._nbytes -= old
+                evict.append(testId)
+        for testId in evict:
+            self._delete(testId)
+        if evict:
+            logger.debug(f"Removed {len(evict)} least recently used traces from archive")
+
+    def remove(self, testId: str):
+        """Remove a trace from the archive."""
+        with self._lock:
+            self._nbytes -= self._index.pop(testId, 0)
+        self._delete(testId)
+
+    def clear(self):
+        """Remove every trace from the archive."""
+        for testId in list(self._index):
+            self.remove(testId)
+
+    def _delete(self, testId: str):
+        for file in self._files(testId):
+            try:
+                os.remove(file)
+            except OSError:
+                pass
@@ -0,0 +1,202 @@
+# Dependencies -----
+import numpy as np
+import pandas as pd
+# Package imports
+from .utils import logger, checkOutput, tableOutput
+
+# -------------------- #
+# Force-Time Trace
+
+# Response key and attribute name of each force-time channel
+CHANNELS = {
+    "LeftForce(N)": "left_force",
+    "RightForce(N)": "right_force",
+    "CombinedForce(N)": "combined_force",
+    "Velocity(m/s)": "velocity",
+    "Displacement(m)": "displacement",
+    "Power(W)": "power"
+}
+
+
+def _channel(values, dtype) -> np.ndarray:
+    # Contiguous array of one channel, with missing values as NaN
+    try:
+        return np.ascontiguousarray(values, dtype=dtype)
+    except (TypeError, ValueError):
+        return np.array([np.nan if v is None else v for v in values], dtype=dtype)
+
+
+class ForceTimeTrace:
+    """Force-time data of one test trial held as NumPy arrays.
+
+    Each channel is one contiguous array. When every time point is on an even grid (up to float rounding),
+    time is kept as a sample rate and the index of the first sample rather than a column; otherwise the
+    time array is kept as it is. Trial details such as RSI are stored once. Use `to_frame()` for the same
+    DataFrame as `GetForceTime`.
+
+    Parameters
+    ----------
+    data : dict
+        The decoded force-time response of a test trial.
+
+    dtype : str, optional
+        NumPy float type of the channel arrays, "float64" or "float32". Default is "float64".
+
+    Attributes
+    ----------
+    left_force, right_force, combined_force, velocity, displacement, power : np.ndarray
+        Force-time channels, one value per sample.
+
+    sample_rate : float
+        Samples per second.
+
+    start : int
+        Index of the first sample, so the first time point is `start / sample_rate` seconds.
+
+    rsi : float
+        Reactive Strength Index of the trial (if applicable).
+
+    test_id, test_name, athlete_id, athlete_name : str
+        Trial details.
+
+    timestamp : pd.Timestamp
+        Recording time of the trial.
+    """
+    __slots__ = (
+        "left_force", "right_force", "combined_force", "velocity", "displacement", "power",
+        "sample_rate", "start", "_time", "rsi", "test_id", "test_name", "athlete_id", "athlete_name", "timestamp"
+    )
+
+    def __init__(self, data: dict, dtype: str = "float64"):
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            logger.error("dtype must be 'float32' or 'float64'")
+            raise ValueError("dtype must be 'float32' or 'float64'.")
+        for key, name in CHANNELS.items():
+            setattr(self, name, _channel(data[key], dtype))
+
+        # Keep time as a sample rate only when it gives back the same times, up to float rounding
+        time = np.asarray(data["Time(s)"], dtype=np.float64)
+        self._time = None
+        self.sample_rate = None
+        self.start = 0
+        if len(time) > 1:
+            rate = round((len(time) - 1) / (time[-1] - time[0])) if time[-1] != time[0] else 0
+            start = round(time[0] * rate)
+            if rate > 0 and np.allclose(time, (start + np.arange(len(time))) / rate, rtol=1e-12, atol=0):
+                self.sample_rate = float(rate)
+                self.start = int(start)
+        if self.sample_rate is None:
+            self._time = time
+
+        self.rsi = data["rsi"]
+        self.test_id = data["id"]
+        self.test_name = data["testType"]["name"]
+        self.athlete_id = data["athlete"]["id"]
+        self.athlete_name = data["athlete"]["name"]
+        self.timestamp = pd.to_datetime(data["timestamp"], unit="s")
+
+    @classmethod
+    def from_arrays(cls, channels: dict, details: dict, sample_rate: float = None, start: int = 0, time: np.ndarray = None):
+        """Create a trace from existing channel arrays without copying them.
+
+        Parameters
+        ----------
+        channels : dict
+            Attribute name (e.g. "combined_force") to array, for every channel.
+
+        details : dict
+            Trial details as returned by `details()`.
+
+        sample_rate : float, optional
+            Samples per second of evenly spaced samples.
+
+        start : int, optional
+            Index of the first sample. Default is 0.
+
+        time : np.ndarray, optional
+            Time of each sample, when samples are not evenly spaced.
+        """
+        trace = cls.__new__(cls)
+        for name in CHANNELS.values():
+            setattr(trace, name, channels[name])
+        trace.sample_rate = sample_rate
+        trace.start = int(start)
+        trace._time = time
+        trace.rsi = details["rsi"]
+        trace.test_id = details["test_id"]
+        trace.test_name = details["test_name"]
+        trace.athlete_id = details["athlete_id"]
+        trace.athlete_name = details["athlete_name"]
+        trace.timestamp = pd.Timestamp(details["timestamp"])
+        return trace
+
+    def details(self) -> dict:
+        """Trial details as a JSON serializable dictionary."""
+        return {
+            "test_id": self.test_id,
+            "test_name": self.test_name,
+            "athlete_id": self.athlete_id,
+            "athlete_name": self.athlete_name,
+            "timestamp": self.timestamp.isoformat(),
+            "rsi": self.rsi
+        }
+
+    def __len__(self) -> int:
+        return len(self.combined_force)
+
+    def __repr__(self):
+        rate = f"{self.sample_rate:g} Hz" if self.sample_rate else "uneven"
+        return f"ForceTimeTrace(test_id={self.test_id!r}, samples={len(self)}, sample_rate={rate})"
+
+    @property
+    def time(self) -> np.ndarray:
+        """Time of each sample in seconds."""
+        if self._time is not None:
+            return self._time
+        return (self.start + np.arange(len(self))) / self.sample_rate
+
+    @property
+    def duration(self) -> float:
+        """Length of the trial in seconds."""
+        return float(self.time[-1] - self.time[0]) if len(self) else 0.0
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the trace arrays in bytes."""
+        arrays = [getattr(self, name) for name in CHANNELS.values()]
+        if self._time is not None:
+            arrays.append(self._time)
+        return sum(a.nbytes for a in arrays)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Force-time DataFrame with the same columns and attributes as `GetForceTime`."""
+        columns = {"Time(s)": self.time}
+        for key, name in CHANNELS.items():
+            columns[key] = getattr(self, name)
+        columns["rsi"] = [self.rsi] * len(self)
+        df = pd.DataFrame(columns)
+
+        # Setting attributes
+        df.attrs['Test ID'] = self.test_id
+        df.attrs['Test Name'] = self.test_name
+        df.attrs['Athlete Name'] = self.athlete_name
+        df.attrs['Athlete ID'] = self.athlete_id
+        df.attrs['Timestamp'] = self.timestamp
+        df.attrs['RSI'] = self.rsi
+        return df
+
+    def to_table(self, output: str = "arrow"):
+        """Force-time `pyarrow.Table` (or `polars.DataFrame` with `output="polars"`) with the columns of `to_frame()`.
+
+        The channel arrays are handed to Arrow without copying. The attributes of `to_frame()` are stored as
+        JSON schema metadata. Needs the optional `pyarrow` (and `polars`) packages.
+        """
+        checkOutput(output)
+        columns = {"Time(s)": self.time}
+        for key, name in CHANNELS.items():
+            columns[key] = getattr(self, name)
+        columns["rsi"] = [self.rsi] * len(self)
+        attrs = {'Test ID': self.test_id, 'Test Name': self.test_name, 'Athlete Name': self.athlete_name,
+                 'Athlete ID': self.athlete_id, 'Timestamp': self.timestamp, 'RSI': self.rsi}
+        return tableOutput(columns, output, attrs)
@@ -1,11 +1,7 @@
 # Dependencies -----
-import requests
-import os
-import datetime
 import pandas as pd
 # Package imports
-from .AuthManager import AuthManager
-from .utils import ConfigManager
+from .utils import clientContext, cachedRequest, instrumented, responseJson
 from .LoggerConfig import LoggerConfig
 
 # Get a logger specific to this module
@@ -15,7 +11,8 @@ logger = LoggerConfig.get_logger(__name__)
 # Get Athletes
 
 
-def GetAthletes(includeInactive: bool = False) -> pd.DataFrame:
+@instrumented
+def GetAthletes(includeInactive: bool = False, client=None) -> pd.DataFrame:
     """Get the athlete information from an account.
 
     Parameters
@@ -23,6 +20,9 @@ def GetAthletes(includeInactive: bool = False) -> pd.DataFrame:
     includeInactive : bool, optional
         A boolean that specifies whether to include inactive athletes in the results. Default is False, meaning by default inactive athletes are not included.
 
+    client : HawkinClient, optional
+        Client to send the request with. Default is None, using the authentication set by `AuthManager`.
+
     Returns
     -------
     pd.DataFrame
@@ -40,50 +40,11 @@ def GetAthletes(includeInactive: bool = False) -> pd.DataFrame:
         If the HTTP response status is not 200, indicating an unsuccessful API request, or if there is a failure in parsing the JSON response.
     """
     # Retrieve Access Token and check expiration
-    a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-    tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-
-    # get current time in timestamp
-    now = datetime.datetime.now()
-    nowtime = datetime.datetime.timestamp(now)
-
-    # Validate refresh token and expiration
-    if a_token is None:
-        logger.error("No Access Token found.")
-        raise Exception("No Access Token found.")
-    elif int(nowtime) >= tokenExp:
-        logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-        # authenticate
-        try:
-            AuthManager(
-                region=ConfigManager.region,
-                authMethod=ConfigManager.env_method,
-                refreshToken_name=ConfigManager.token_name,
-                refreshToken=ConfigManager.refresh_token,
-                env_file_name=ConfigManager.file_name
-            )
-            # Retrieve Access Token and check expiration
-            a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-            logger.debug("New ACCESS_TOKEN retrieved")
-            tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-            logger.debug("TOKEN_EXPIRATION retrieved")
-            if a_token is None:
-                logger.error("No Access Token found.")
-                raise Exception("No Access Token found.")
-            elif int(nowtime) >= tokenExp:
-                logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-                raise Exception("Token expired")
-            else:
-                logger.debug(f"New Access Token valid through: {datetime.datetime.fromtimestamp(tokenExp)}")
-                pass
-        except ValueError:
-            logger.error("Failed to authenticate. Try AuthManager")
-            raise Exception("Failed to authenticate. Try AuthManage")
-    else:
-        logger.debug(f"Access Token retrieved. expires {datetime.datetime.fromtimestamp(tokenExp)}")
+    provider, session = clientContext(client)
+    a_token = provider.get_token()
 
     # API Cloud URL
-    url_cloud = os.getenv("CLOUD_URL")
+    url_cloud = provider.url_cloud
 
     # Create URL for request
     url = f"{url_cloud}/athletes?inactive={includeInactive}"
@@ -97,7 +58,7 @@ def GetAthletes(includeInactive: bool = False) -> pd.DataFrame:
     else:
         logger.debug("GET Request: Athletes (inactive = false)")
     # GET Request
-    response = requests.get(url, headers=headers)
+    response = cachedRequest("athletes", url, provider, headers=headers, session=session)
 
     # Response Handling
     # If Error show error
@@ -107,7 +68,7 @@ def GetAthletes(includeInactive: bool = False) -> pd.DataFrame:
 
     # If successful
     try:
-        data = response.json()['data']
+        data = responseJson(response)['data']
         df = pd.json_normalize(data, meta=['count'], errors='ignore')
 
         # Setting attributes
@@ -1,17 +1,15 @@
 # Dependencies -----
-import requests
 import pandas as pd
-import os
-import datetime
 # Package imports
-from .utils import logger, ConfigManager
-from .AuthManager import AuthManager
+from .utils import logger, clientContext, apiRequest, instrumented, responseJson, phase, checkOutput, tableOutput
+from .ForceTimeTrace import ForceTimeTrace, CHANNELS
 
 # -------------------- #
 # Get Force Time
 
 
-def GetForceTime(testId: str) -> pd.DataFrame:
+@instrumented
+def GetForceTime(testId: str, asTrace: bool = False, dtype: str = "float64", archive=None, output: str = "pandas", client=None) -> pd.DataFrame:
     """Get force-time data for an individual test trial from an account.
 
     Parameters
@@ -19,6 +17,21 @@ def GetForceTime(testId: str) -> pd.DataFrame:
     testId : str
         The unique ID given to each test trial.
 
+    asTrace : bool, optional
+        If True, return a `ForceTimeTrace` holding each channel as a NumPy array, with a sample rate instead of a time column and RSI stored once. Default is False, returning a DataFrame.
+
+    dtype : str, optional
+        NumPy float type of the trace arrays when `asTrace=True`, "float64" or "float32". Default is "float64".
+
+    archive : ForceTimeArchive, optional
+        Archive checked before requesting the trial. Trials not yet archived are added after they are fetched, and keep the dtype they were archived with. Default is None.
+
+    output : str, optional
+        "pandas" (default), "arrow" for a `pyarrow.Table`, or "polars" for a `polars.DataFrame`, with the same columns. Arrow and polars results are built straight from the response arrays, without an intermediate pandas DataFrame, and need the optional `pyarrow` (and `polars`) packages. The DataFrame attributes are stored as JSON schema metadata of an Arrow table.
+
+    client : HawkinClient, optional
+        Client to send the request with. Default is None, using the authentication set by `AuthManager`.
+
     Returns
     -------
     pd.DataFrame
@@ -32,60 +45,22 @@ def GetForceTime(testId: str) -> pd.DataFrame:
         - Power (W): Calculated power of mass at each time point.
         - RSI: Calculated Reactive Strength Index (if applicable).
 
+    pyarrow.Table or polars.DataFrame
+        If `output` is "arrow" or "polars", with the columns above.
+
+    ForceTimeTrace
+        If `asTrace=True`. `to_frame()` returns the DataFrame above.
+
     Raises
     ------
     Exception
         If the HTTP response status is not 200, indicating an unsuccessful API request,
         or if there is a failure in parsing the JSON response.
     ValueError
-        If the 'testId' parameter is not a string.
+        If the 'testId' parameter is not a string, 'dtype' is not "float32" or "float64", or 'output' is unknown or used with `asTrace`.
+    ImportError
+        If `output` is "arrow" or "polars" and pyarrow or polars is not installed.
     """
-    # Retrieve Access Token and check expiration
-    a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-    tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-
-    # get current time in timestamp
-    now = datetime.datetime.now()
-    nowtime = datetime.datetime.timestamp(now)
-
-    # Validate refresh token and expiration
-    if a_token is None:
-        logger.error("No Access Token found.")
-        raise Exception("No Access Token found.")
-    elif int(nowtime) >= tokenExp:
-        logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-        # authenticate
-        try:
-            AuthManager(
-                region=ConfigManager.region,
-                authMethod=ConfigManager.env_method,
-                refreshToken_name=ConfigManager.token_name,
-                refreshToken=ConfigManager.refresh_token,
-                env_file_name=ConfigManager.file_name
-            )
-            # Retrieve Access Token and check expiration
-            a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-            logger.debug("New ACCESS_TOKEN retrieved")
-            tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-            logger.debug("TOKEN_EXPIRATION retrieved")
-            if a_token is None:
-                logger.error("No Access Token found.")
-                raise Exception("No Access Token found.")
-            elif int(nowtime) >= tokenExp:
-                logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-                raise Exception("Token expired")
-            else:
-                logger.debug(f"New Access Token valid through: {datetime.datetime.fromtimestamp(tokenExp)}")
-                pass
-        except ValueError:
-            logger.error("Failed to authenticate. Try AuthManager")
-            raise Exception("Failed to authenticate. Try AuthManage")
-    else:
-        logger.debug(f"Access Token retrieved. expires {datetime.datetime.fromtimestamp(tokenExp)}")
-
-    # API Cloud URL
-    url_cloud = os.getenv("CLOUD_URL")
-
     # Test ID
     if isinstance(testId, str):
         tid = testId
@@ -93,13 +68,39 @@ def GetForceTime(testId: str) -> pd.DataFrame:
         logger.error("TestId must be a string")
         raise Exception("Error: TestId must be a string")
 
+    # Trace dtype
+    if asTrace and str(dtype) not in ("float32", "float64"):
+        logger.error("dtype must be 'float32' or 'float64'")
+        raise ValueError("dtype must be 'float32' or 'float64'.")
+
+    # Result type
+    checkOutput(output)
+    if asTrace and output != "pandas":
+        logger.error("output cannot be used with asTrace")
+        raise ValueError("output cannot be used with asTrace. Use ForceTimeTrace.to_table() instead.")
+
+    # Archived trial
+    if archive is not None:
+        trace = archive.get(tid)
+        if trace is not None:
+            if asTrace:
+                return trace
+            return trace.to_frame() if output == "pandas" else trace.to_table(output)
+
+    # Retrieve Access Token and check expiration
+    provider, session = clientContext(client)
+    a_token = provider.get_token()
+
+    # API Cloud URL
+    url_cloud = provider.url_cloud
+
     # Create URL for request
     url = f"{url_cloud}/forcetime/{tid}"
 
     # GET Request
     logger.debug(f"GET Force-Time data for test: {tid}")
     headers = {"Authorization": f"Bearer {a_token}"}
-    response = requests.get(url, headers=headers)
+    response = apiRequest("GET", url, headers=headers, session=session)
 
     # Check response status and handle data accordingly
     if response.status_code != 200:
@@ -107,20 +108,41 @@ def GetForceTime(testId: str) -> pd.DataFrame:
         raise Exception(f"Error {response.status_code}: {response.reason}")
 
     try:
-        # Flatten test data from response
-        data = response.json()
+        # Decode the response, with the channels as NumPy arrays
+        data = responseJson(response, arrays=("Time(s)", *CHANNELS))
+
+        if asTrace or archive is not None:
+            with phase("parse"):
+                trace = ForceTimeTrace(data, dtype=dtype if asTrace else "float64")
+            if archive is not None:
+                archive.put(trace)
+        if asTrace:
+            logger.info(f"Request successful: {trace.test_name} - {trace.test_id} - {trace.timestamp}")
+            return trace
+
+        if output != "pandas":
+            # Build the table from the response arrays
+            with phase("parse"):
+                columns = {key: data[key] for key in ("Time(s)", "LeftForce(N)", "RightForce(N)", "CombinedForce(N)", "Velocity(m/s)", "Displacement(m)", "Power(W)")}
+                columns["rsi"] = [data["rsi"]] * len(data["Time(s)"])
+                attrs = {'Test ID': data['id'], 'Test Name': data['testType']['name'], 'Athlete Name': data['athlete']['name'],
+                         'Athlete ID': data['athlete']['id'], 'Timestamp': pd.to_datetime(data['timestamp'], unit='s'), 'RSI': data['rsi']}
+                table = tableOutput(columns, output, attrs)
+            logger.info(f"Request successful: {attrs['Test Name']} - {attrs['Test ID']} - {attrs['Timestamp']}")
+            return table
 
         # Create DataFrame from the array data
-        df = pd.DataFrame({
-            "Time(s)": data["Time(s)"],
-            "LeftForce(N)": data["LeftForce(N)"],
-            "RightForce(N)": data["RightForce(N)"],
-            "CombinedForce(N)": data["CombinedForce(N)"],
-            "Velocity(m/s)": data["Velocity(m/s)"],
-            "Displacement(m)": data["Displacement(m)"],
-            "Power(W)": data["Power(W)"],
-            "rsi": [data["rsi"]] * len(data["Time(s)"])  # Assuming rsi is a constant value
-        })
+        with phase("parse"):
+            df = pd.DataFrame({
+                "Time(s)": data["Time(s)"],
+                "LeftForce(N)": data["LeftForce(N)"],
+                "RightForce(N)": data["RightForce(N)"],
+                "CombinedForce(N)": data["CombinedForce(N)"],
+                "Velocity(m/s)": data["Velocity(m/s)"],
+                "Displacement(m)": data["Displacement(m)"],
+                "Power(W)": data["Power(W)"],
+                "rsi": [data["rsi"]] * len(data["Time(s)"])  # Assuming rsi is a constant value
+            })
 
         # Setting attributes
         df.attrs['Test ID'] = data['id']
@@ -0,0 +1,94 @@
+# Dependencies -----
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextvars
+from typing import List
+import pandas as pd
+# Package imports
+from .utils import logger, SessionManager, instrumented
+from .GetForceTime import GetForceTime
+
+# -------------------- #
+# Get Force Time in Bulk
+
+
+@instrumented
+def GetForceTimeBulk(testIds: List[str], max_workers: int = 8, longFormat: bool = False, archive=None, client=None) -> dict:
+    """Get force-time data for many test trials at once, fetching them in parallel.
+
+    Parameters
+    ----------
+    testIds : list[str]
+        A list or tuple of unique test trial IDs. Duplicates are fetched once.
+
+    max_workers : int, optional
+        Maximum number of trials fetched at the same time. Default is 8.
+
+    longFormat : bool, optional
+        If True, all trials are returned in one long-format DataFrame with a `testId` column. Default is False, returning a dictionary of DataFrames keyed by test ID.
+
+    archive : ForceTimeArchive, optional
+        Archive checked before requesting each trial, as in `GetForceTime`. Default is None.
+
+    client : HawkinClient, optional
+        Client to send the requests with. Default is None, using the authentication set by `AuthManager`.
+
+    Returns
+    -------
+    dict
+        A dictionary with:
+        - data: A dictionary of test ID to force-time DataFrame (as returned by `GetForceTime`), or a single long-format DataFrame if `longFormat=True`.
+        - failures: A dictionary of test ID to error message for every trial that could not be retrieved.
+
+    Raises
+    ------
+    ValueError
+        If 'testIds' is not a list or tuple of strings, or 'max_workers' is less than 1.
+    """
+    # Check test IDs
+    if isinstance(testIds, str) or not isinstance(testIds, (list, tuple)):
+        logger.error("testIds must be a list or tuple of strings.")
+        raise ValueError("testIds must be a list or tuple of strings.")
+    if not all(isinstance(tid, str) for tid in testIds):
+        logger.error("testIds must be a list or tuple of strings.")
+        raise ValueError("testIds must be a list or tuple of strings.")
+    if int(max_workers) < 1:
+        logger.error("max_workers must be at least 1")
+        raise ValueError("max_workers must be at least 1.")
+
+    # Remove duplicates, keeping the order given
+    ids = list(dict.fromkeys(testIds))
+
+    # Workers share the default session (see SessionManager.check_pool)
+    if client is None:
+        SessionManager.check_pool(int(max_workers), "max_workers")
+
+    # Fetch trials in parallel, recording failures without stopping the batch
+    results = {}
+    failures = {}
+    logger.debug(f"GET Force-Time data for {len(ids)} tests with {max_workers} workers")
+    with ThreadPoolExecutor(max_workers=int(max_workers), thread_name_prefix="hdforce-ft") as executor:
+        # Workers run in a copy of this context, so their requests count in this call, not as separate calls
+        futures = {executor.submit(contextvars.copy_context().run, GetForceTime, tid, archive=archive, client=client): tid for tid in ids}
+        for future in as_completed(futures):
+            tid = futures[future]
+            try:
+                results[tid] = future.result()
+            except Exception as e:
+                logger.warning(f"Force-Time request failed for test {tid}: {e}")
+                failures[tid] = str(e)
+
+    # Return trials in the order requested
+    data = {tid: results[tid] for tid in ids if tid in results}
+    logger.info(f"Request successful. Force-Time returned: {len(data)}. Failed: {len(failures)}")
+
+    if longFormat:
+        frames = [df.assign(testId=tid) for tid, df in data.items()]
+        if frames:
+            long_df = pd.concat(frames, ignore_index=True)
+            long_df = long_df[['testId'] + [col for col in long_df.columns if col != 'testId']]
+        else:
+            long_df = pd.DataFrame(columns=['testId'])
+        long_df.attrs['Count'] = len(data)
+        return {"data": long_df, "failures": failures}
+
+    return {"data": data, "failures": failures}
@@ -1,19 +1,21 @@
 # Dependencies -----
-import requests
-import os
-import datetime
 import pandas as pd
 # Package imports
-from .utils import logger, ConfigManager
-from .AuthManager import AuthManager
+from .utils import logger, clientContext, cachedRequest, instrumented, responseJson
 
 # -------------------- #
 # Get Groups -----
 
 
-def GetGroups() -> pd.DataFrame:
+@instrumented
+def GetGroups(client=None) -> pd.DataFrame:
     """Get group for an account. This function is designed to retrieve all groups within your organization.
 
+    Parameters
+    ----------
+    client : HawkinClient, optional
+        Client to send the request with. Default is None, using the authentication set by `AuthManager`.
+
     Returns
     -------
     pd.DataFrame
@@ -27,50 +29,11 @@ def GetGroups() -> pd.DataFrame:
         If the HTTP response status is not 200, indicating an unsuccessful API request, or if there is a failure in parsing the JSON response.
     """
     # Retrieve Access Token and check expiration
-    a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-    tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-
-    # get current time in timestamp
-    now = datetime.datetime.now()
-    nowtime = datetime.datetime.timestamp(now)
-
-    # Validate refresh token and expiration
-    if a_token is None:
-        logger.error("No Access Token found.")
-        raise Exception("No Access Token found.")
-    elif int(nowtime) >= tokenExp:
-        logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-        # authenticate
-        try:
-            AuthManager(
-                region=ConfigManager.region,
-                authMethod=ConfigManager.env_method,
-                refreshToken_name=ConfigManager.token_name,
-                refreshToken=ConfigManager.refresh_token,
-                env_file_name=ConfigManager.file_name
-            )
-            # Retrieve Access Token and check expiration
-            a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-            logger.debug("New ACCESS_TOKEN retrieved")
-            tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-            logger.debug("TOKEN_EXPIRATION retrieved")
-            if a_token is None:
-                logger.error("No Access Token found.")
-                raise Exception("No Access Token found.")
-            elif int(nowtime) >= tokenExp:
-                logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-                raise Exception("Token expired")
-            else:
-                logger.debug(f"New Access Token valid through: {datetime.datetime.fromtimestamp(tokenExp)}")
-                pass
-        except ValueError:
-            logger.error("Failed to authenticate. Try AuthManager")
-            raise Exception("Failed to authenticate. Try AuthManage")
-    else:
-        logger.debug(f"Access Token retrieved. expires {datetime.datetime.fromtimestamp(tokenExp)}")
+    provider, session = clientContext(client)
+    a_token = provider.get_token()
 
     # API Cloud URL
-    url_cloud = os.getenv("CLOUD_URL")
+    url_cloud = provider.url_cloud
 
     # Create URL for request
     url = f"{url_cloud}/groups"
@@ -80,7 +43,7 @@ def GetGroups() -> pd.DataFrame:
 
     # Create Response
     logger.debug("GET Request: Groups")
-    response = requests.get(url, headers=headers)
+    response = cachedRequest("groups", url, provider, headers=headers, session=session)
 
     # Response Handling
     # If Error show error
@@ -91,7 +54,7 @@ def GetGroups() -> pd.DataFrame:
     # If successful
     try:
         # Flatten test data from response
-        data = response.json()
+        data = responseJson(response)
         df = pd.json_normalize(data['data'], meta=['count'], errors='ignore')
 
         df.attrs['Count'] = int(len(df.index))
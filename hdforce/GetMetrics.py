@@ -1,20 +1,22 @@
 # Dependencies -----
-import requests
-import os
-import datetime
 import pandas as pd
 # Package imports
-from .utils import logger, ConfigManager
-from .AuthManager import AuthManager
+from .utils import logger, clientContext, cachedRequest, CacheManager, instrumented, responseJson, phase
 
 # ----------------- #
 # Get Metrics
 
 
-def GetMetrics() -> pd.DataFrame:
+@instrumented
+def GetMetrics(client=None) -> pd.DataFrame:
     """
     Get the metrics and ids for all the metrics in the system
 
+    Parameters
+    ----------
+    client : HawkinClient, optional
+        Client to send the request with. Default is None, using the authentication set by `AuthManager`.
+
     Returns
     -------
     pd.DataFrame
@@ -32,50 +34,11 @@ def GetMetrics() -> pd.DataFrame:
         If the HTTP response status is not 200, indicating an unsuccessful API request, or if there is a failure in parsing the JSON response.
     """
     # Retrieve Access Token and check expiration
-    a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-    tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-
-    # get current time in timestamp
-    now = datetime.datetime.now()
-    nowtime = datetime.datetime.timestamp(now)
-
-    # Validate refresh token and expiration
-    if a_token is None:
-        logger.error("No Access Token found.")
-        raise Exception("No Access Token found.")
-    elif int(nowtime) >= tokenExp:
-        logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-        # authenticate
-        try:
-            AuthManager(
-                region=ConfigManager.region,
-                authMethod=ConfigManager.env_method,
-                refreshToken_name=ConfigManager.token_name,
-                refreshToken=ConfigManager.refresh_token,
-                env_file_name=ConfigManager.file_name
-            )
-            # Retrieve Access Token and check expiration
-            a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-            logger.debug("New ACCESS_TOKEN retrieved")
-            tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-            logger.debug("TOKEN_EXPIRATION retrieved")
-            if a_token is None:
-                logger.error("No Access Token found.")
-                raise Exception("No Access Token found.")
-            elif int(nowtime) >= tokenExp:
-                logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-                raise Exception("Token expired")
-            else:
-                logger.debug(f"New Access Token valid through: {datetime.datetime.fromtimestamp(tokenExp)}")
-                pass
-        except ValueError:
-            logger.error("Failed to authenticate. Try AuthManager")
-            raise Exception("Failed to authenticate. Try AuthManage")
-    else:
-        logger.debug(f"Access Token retrieved. expires {datetime.datetime.fromtimestamp(tokenExp)}")
+    provider, session = clientContext(client)
+    a_token = provider.get_token()
 
     # API Cloud URL
-    url_cloud = os.getenv("CLOUD_URL")
+    url_cloud = provider.url_cloud
 
     # Create URL for request
     url = f"{url_cloud}/metrics" 
@@ -85,28 +48,36 @@ def GetMetrics() -> pd.DataFrame:
 
     # Create Response
     logger.debug("GET Request: Metrics.")
-    response = requests.get(url, headers=headers)
+    response = cachedRequest("metrics", url, provider, headers=headers, session=session)
 
     # Response Handling
     # If Error show error
     if response.status_code != 200:
         logger.error(f"Error {response.status_code}: {response.reason}")
         raise Exception(f"Error {response.status_code}: {response.reason}")
-    
+
+    # Previously parsed metrics, if unchanged since
+    result_df = CacheManager.frame(response)
+    if result_df is not None:
+        logger.info("Request for Metrics successful (cached)")
+        return result_df
+
     # If successful
     try:
         # Flatten test data from response
-        data = response.json()
-        # Create DataFrame from JSON
-        df = pd.DataFrame(data)
-        # Explode 'metrics' column to expand each list element into a row
-        df = df.explode('metrics')
-        # Normalize 'metrics' column
-        metrics_df = pd.json_normalize(df['metrics'])
-        # Concatenate the original DataFrame with the normalized metrics DataFrame
-        result_df = pd.concat([df.drop('metrics', axis=1).reset_index(drop=True), metrics_df], axis=1)
+        data = responseJson(response)
+        with phase("parse"):
+            # Create DataFrame from JSON
+            df = pd.DataFrame(data)
+            # Explode 'metrics' column to expand each list element into a row
+            df = df.explode('metrics')
+            # Normalize 'metrics' column
+            metrics_df = pd.json_normalize(df['metrics'].tolist())
+            # Concatenate the original DataFrame with the normalized metrics DataFrame
+            result_df = pd.concat([df.drop('metrics', axis=1).reset_index(drop=True), metrics_df], axis=1)
 
         result_df.attrs['Count'] = int(len(result_df))
+        CacheManager.set_frame(response, result_df)
         logger.info("Request for Metrics successful")
         return result_df
 
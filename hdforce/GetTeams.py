@@ -1,19 +1,21 @@
 # Dependencies -----
-import requests
-import os
-import datetime
 import pandas as pd
 # Package imports
-from .utils import logger, ConfigManager
-from .AuthManager import AuthManager
+from .utils import logger, clientContext, cachedRequest, instrumented, responseJson
 
 # -------------------- #
 # Get Teams -----
 
 
-def GetTeams() -> pd.DataFrame:
+@instrumented
+def GetTeams(client=None) -> pd.DataFrame:
     """Get teams for an account. This function is designed to retrieve all teams within your organization.
 
+    Parameters
+    ----------
+    client : HawkinClient, optional
+        Client to send the request with. Default is None, using the authentication set by `AuthManager`.
+
     Returns
     -------
     pd.DataFrame
@@ -28,50 +30,11 @@ def GetTeams() -> pd.DataFrame:
         or if there is a failure in parsing the JSON response.
     """
     # Retrieve Access Token and check expiration
-    a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-    tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-
-    # get current time in timestamp
-    now = datetime.datetime.now()
-    nowtime = datetime.datetime.timestamp(now)
-
-    # Validate refresh token and expiration
-    if a_token is None:
-        logger.error("No Access Token found.")
-        raise Exception("No Access Token found.")
-    elif int(nowtime) >= tokenExp:
-        logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-        # authenticate
-        try:
-            AuthManager(
-                region=ConfigManager.region,
-                authMethod=ConfigManager.env_method,
-                refreshToken_name=ConfigManager.token_name,
-                refreshToken=ConfigManager.refresh_token,
-                env_file_name=ConfigManager.file_name
-            )
-            # Retrieve Access Token and check expiration
-            a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-            logger.debug("New ACCESS_TOKEN retrieved")
-            tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-            logger.debug("TOKEN_EXPIRATION retrieved")
-            if a_token is None:
-                logger.error("No Access Token found.")
-                raise Exception("No Access Token found.")
-            elif int(nowtime) >= tokenExp:
-                logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-                raise Exception("Token expired")
-            else:
-                logger.debug(f"New Access Token valid through: {datetime.datetime.fromtimestamp(tokenExp)}")
-                pass
-        except ValueError:
-            logger.error("Failed to authenticate. Try AuthManager")
-            raise Exception("Failed to authenticate. Try AuthManage")
-    else:
-        logger.debug(f"Access Token retrieved. expires {datetime.datetime.fromtimestamp(tokenExp)}")
+    provider, session = clientContext(client)
+    a_token = provider.get_token()
 
     # API Cloud URL
-    url_cloud = os.getenv("CLOUD_URL")
+    url_cloud = provider.url_cloud
 
     # Create URL for request
     url = f"{url_cloud}/teams"
@@ -79,7 +42,7 @@ def GetTeams() -> pd.DataFrame:
     # GET Request
     logger.debug("GET Request: Teams.")
     headers = {"Authorization": f"Bearer {a_token}"}
-    response = requests.get(url, headers=headers)
+    response = cachedRequest("teams", url, provider, headers=headers, session=session)
 
     # Response Handling
     # If Error show error
@@ -90,7 +53,7 @@ def GetTeams() -> pd.DataFrame:
     # If successful
     try:
         # Flatten test data from response
-        data = response.json()
+        data = responseJson(response)
         df = pd.json_normalize(data['data'], meta=['count'], errors='ignore')
 
         # Setting attributes
@@ -1,106 +1,44 @@
 # Create function to call tests by type
+import contextvars
 import requests
-import os
-import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 # Package imports
-from .utils import responseHandler, logger, ConfigManager
-from .AuthManager import AuthManager
+from .utils import logger, clientContext, apiRequest, ColumnBuilder, instrumented, responseJson, phase, columnName, KEY_COLUMNS, recordFilter, recordColumns, dropDuplicateTests, emptyTestColumns, checkOutput, testsOutput, RecordStream
+from .GetMetrics import GetMetrics
 
 # -------------------- #
-# Get All Tests
-
-
-def GetTests(from_=None, to_=None, sync=False, athleteId=None, typeId=None, teamId=None, groupId=None, includeInactive = False) -> pd.DataFrame:
-    """Get all test trials from an account. Allows filtering of results based on time frames, synchronization needs, and the active status of tests.
-
-    Parameters
-    ----------
-    from_ : int, optional
-        Unix timestamp specifying the start time from which tests should be fetched. Default is None, which fetches tests from the beginning.
-
-    to_ : int, optional
-        Unix timestamp specifying the end time until which tests should be fetched. Default is None, which fetches tests up to the current time.
-
-    sync : bool, optional
-        If True, the function fetches updated and newly created tests to synchronize with the database. Default is False.
+# Test Type IDs
+
+type_ids = {
+    "7nNduHeM5zETPjHxvm7s": ["7nNduHeM5zETPjHxvm7s", "Countermovement Jump", "CMJ"],
+    "QEG7m7DhYsD6BrcQ8pic": ["QEG7m7DhYsD6BrcQ8pic", "Squat Jump", "SJ"],
+    "2uS5XD5kXmWgIZ5HhQ3A": ["2uS5XD5kXmWgIZ5HhQ3A", "Isometric Test", "ISO"],
+    "gyBETpRXpdr63Ab2E0V8": ["gyBETpRXpdr63Ab2E0V8", "Drop Jump", "DJ"],
+    "5pRSUQVSJVnxijpPMck3": ["5pRSUQVSJVnxijpPMck3", "Free Run", "FREE"],
+    "pqgf2TPUOQOQs6r0HQWb": ["pqgf2TPUOQOQs6r0HQWb", "CMJ Rebound", "CMJR"],
+    "r4fhrkPdYlLxYQxEeM78": ["r4fhrkPdYlLxYQxEeM78", "Multi Rebound", "MR"],
+    "ubeWMPN1lJFbuQbAM97s": ["ubeWMPN1lJFbuQbAM97s", "Weigh In", "WI"],
+    "rKgI4y3ItTAzUekTUpvR": ["rKgI4y3ItTAzUekTUpvR", "Drop Landing", "DL"],
+    "4KlQgKmBxbOY6uKTLDFL": ["4KlQgKmBxbOY6uKTLDFL", "TS Free Run", "TSFR"],
+    "umnEZPgi6zaxuw0KhUpM": ["umnEZPgi6zaxuw0KhUpM", "TS Isometric Test", "TSISO"]
+}
 
-    athleteId : str optional
-        The unique identifier of the athlete whose tests are to be retrieved.
-
-    typeId : str optional
-        The canonical test ID, test type name, or test name abbreviation. Must correspond to known test types.
-
-    teamId : str optional
-        A single team ID, tuple or list of team IDs to receive tests from specific teams.
+# -------------------- #
+# Tests Query
 
-    groupId : str optional
-        A single group ID or a comma-separated string of group IDs to receive tests from specific groups.
 
-    includeInactive : bool, optional
-        Default to False, where only active tests are returned. If True, all tests including inactive ones are returned.
-
-    Returns
-    -------
-    pd.DataFrame
-        A DataFrame containing test trials matching the query criteria, with columns dependent on the test data and the following DataFrame attributes:
-        - Last Sync Time
-        - Last Test Time
-        - Count of Tests
+def buildTestsQuery(from_=None, to_=None, sync=False, athleteId=None, typeId=None, teamId=None, groupId=None) -> dict:
+    """Validate test arguments and build the query parameters of a tests request.
 
     Raises
     ------
     Exception
-        If the HTTP response status is not 200, indicating an unsuccessful API request, or if there is a failure in parsing the JSON response.
+        If typeId does not correspond to a known test type.
     ValueError
-        If there is an error in handling the JSON response or data formatting.
+        If more than one of athleteId, typeId, teamId, or groupId is given, or teamId/groupId is not a string or a list/tuple of strings.
     """
-    # Retrieve Access Token and check expiration
-    a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-    tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-
-    # get current time in timestamp
-    now = datetime.datetime.now()
-    nowtime = datetime.datetime.timestamp(now)
-
-    # Validate refresh token and expiration
-    if a_token is None:
-        logger.error("No Access Token found.")
-        raise Exception("No Access Token found.")
-    elif int(nowtime) >= tokenExp:
-        logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-        # authenticate
-        try:
-            AuthManager(
-                region=ConfigManager.region,
-                authMethod=ConfigManager.env_method,
-                refreshToken_name=ConfigManager.token_name,
-                refreshToken=ConfigManager.refresh_token,
-                env_file_name=ConfigManager.file_name
-            )
-            # Retrieve Access Token and check expiration
-            a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-            logger.debug("New ACCESS_TOKEN retrieved")
-            tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-            logger.debug("TOKEN_EXPIRATION retrieved")
-            if a_token is None:
-                logger.error("No Access Token found.")
-                raise Exception("No Access Token found.")
-            elif int(nowtime) >= tokenExp:
-                logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-                raise Exception("Token expired")
-            else:
-                logger.debug(f"New Access Token valid through: {datetime.datetime.fromtimestamp(tokenExp)}")
-                pass
-        except ValueError:
-            logger.error("Failed to authenticate. Try AuthManager")
-            raise Exception("Failed to authenticate. Try AuthManage")
-    else:
-        logger.debug(f"Access Token retrieved. expires {datetime.datetime.fromtimestamp(tokenExp)}")
-
-    # Create URL for request
-    url = os.getenv("CLOUD_URL")
-
     # Create blank Query list to handle parameters
     query = {}
 
@@ -129,20 +67,6 @@ def GetTests(from_=None, to_=None, sync=False, athleteId=None, typeId=None, team
 
     # Evaluate for Test Type argument
     if typeId is not None:
-        # Check typeId
-        type_ids = {
-            "7nNduHeM5zETPjHxvm7s": ["7nNduHeM5zETPjHxvm7s", "Countermovement Jump", "CMJ"],
-            "QEG7m7DhYsD6BrcQ8pic": ["QEG7m7DhYsD6BrcQ8pic", "Squat Jump", "SJ"],
-            "2uS5XD5kXmWgIZ5HhQ3A": ["2uS5XD5kXmWgIZ5HhQ3A", "Isometric Test", "ISO"],
-            "gyBETpRXpdr63Ab2E0V8": ["gyBETpRXpdr63Ab2E0V8", "Drop Jump", "DJ"],
-            "5pRSUQVSJVnxijpPMck3": ["5pRSUQVSJVnxijpPMck3", "Free Run", "FREE"],
-            "pqgf2TPUOQOQs6r0HQWb": ["pqgf2TPUOQOQs6r0HQWb", "CMJ Rebound", "CMJR"],
-            "r4fhrkPdYlLxYQxEeM78": ["r4fhrkPdYlLxYQxEeM78", "Multi Rebound", "MR"],
-            "ubeWMPN1lJFbuQbAM97s": ["ubeWMPN1lJFbuQbAM97s", "Weigh In", "WI"],
-            "rKgI4y3ItTAzUekTUpvR": ["rKgI4y3ItTAzUekTUpvR", "Drop Landing", "DL"],
-            "4KlQgKmBxbOY6uKTLDFL": ["4KlQgKmBxbOY6uKTLDFL", "TS Free Run", "TSFR"],
-            "umnEZPgi6zaxuw0KhUpM": ["umnEZPgi6zaxuw0KhUpM", "TS Isometric Test", "TSISO"]
-        }
         # Sort test type Id
         for key, values in type_ids.items():
             if typeId in values:
@@ -185,54 +109,379 @@ def GetTests(from_=None, to_=None, sync=False, athleteId=None, typeId=None, team
         logger.debug(f"Test Request to_dt")
     elif to_ is None:
         logger.debug(f"Test Request from_dt")
+
+    return query
+
+
+def resolveColumns(columns, client=None) -> dict:
+    """Resolve the names of a `columns` projection to the names used in test records.
+
+    Metric ids and labels from `GetMetrics` are expanded to the metric names found in test records, a label
+    with its units such as "Jump Height(m)". Other names, e.g. 'athlete_teams' or 'tag_ids', are kept as given.
+
+    Returns
+    -------
+    dict
+        Each requested name to the set of names it matches.
+
+    Raises
+    ------
+    ValueError
+        If columns is not a string or a list/tuple of strings.
+    """
+    if isinstance(columns, str):
+        columns = [columns]
+    if not isinstance(columns, (list, tuple, set)) or not all(isinstance(col, str) for col in columns):
+        logger.error("columns must be a list of column or metric names.")
+        raise ValueError("columns must be a list of column or metric names.")
+    resolved = {name: {name} for name in columns}
+
+    # Only metric names need the metrics list (cached by CacheManager)
+    info = set(KEY_COLUMNS) | {columnName(key) for key in KEY_COLUMNS} | {'tag_ids', 'tag_names'}
+    if all(name in info or name.startswith(('athlete', 'testType', 'external_')) for name in resolved):
+        return resolved
+    try:
+        metrics = GetMetrics(client=client)
+    except Exception as e:
+        logger.warning(f"Metric names could not be resolved, using columns as given: {e}")
+        return resolved
+    if not {'id', 'label', 'units'} <= set(metrics.columns):
+        return resolved
+    for mid, label, units in zip(metrics['id'], metrics['label'], metrics['units']):
+        names = {label}
+        if units:
+            names |= {f"{label}({units})", f"{label} ({units})"}
+        for key in (mid, label):
+            if key in resolved:
+                resolved[key] |= names
+    return resolved
+
+
+# -------------------- #
+# Fetch Tests
+
+
+def fetchTests(query: dict, client=None) -> dict:
+    """Send a tests request and return the decoded JSON response.
+
+    Raises
+    ------
+    Exception
+        If the HTTP response status is not 200.
+    """
+    # Retrieve Access Token and check expiration
+    provider, session = clientContext(client)
+    a_token = provider.get_token()
+
     # GET Request
     headers = {"Authorization": f"Bearer {a_token}"}
-    response = requests.get(url, headers=headers, params=query)
+    response = apiRequest("GET", provider.url_cloud, headers=headers, params=query, session=session)
 
     # Check response status and handle data accordingly
     if response.status_code != 200:
         logger.error(f"{response.status_code}: {response.reason}")
         raise Exception(f"Error {response.status_code}: {response.reason}")
 
+    return responseJson(response)
+
+
+def streamTestBatches(query: dict, batchSize: int = 1000, client=None):
+    """Send a tests request and yield its records `batchSize` at a time while the response is read.
+
+    Yields
+    ------
+    tuple
+        (records, values) for each batch, where values holds the other values of the response read so far
+        (count, lastSyncTime and lastTestTime). A last empty batch is yielded once the whole response is read,
+        with the complete values.
+
+    Raises
+    ------
+    Exception
+        If the HTTP response status is not 200.
+    ValueError
+        If the response is not valid JSON.
+    """
+    # Retrieve Access Token and check expiration
+    provider, session = clientContext(client)
+    a_token = provider.get_token()
+
+    # GET Request, reading the body as it is parsed
+    headers = {"Authorization": f"Bearer {a_token}"}
+    response = apiRequest("GET", provider.url_cloud, headers=headers, params=query, session=session, stream=True)
+    try:
+        if response.status_code != 200:
+            logger.error(f"{response.status_code}: {response.reason}")
+            raise Exception(f"Error {response.status_code}: {response.reason}")
+
+        stream = RecordStream(response)
+        for batch in stream.batches(batchSize):
+            yield batch, stream.values
+        yield [], stream.values
+    finally:
+        response.close()
+
+
+def streamTests(query: dict, builder: ColumnBuilder, batchSize: int = 1000, client=None) -> dict:
+    """Send a tests request and parse its records into `builder` while the response is read.
+
+    Records are decoded from the streamed body and added to the builder `batchSize` at a time, so memory
+    holds the columns built so far and one batch of records, rather than the body and the decoded response.
+
+    Returns
+    -------
+    dict
+        The other values of the response: count, lastSyncTime and lastTestTime.
+
+    Raises
+    ------
+    Exception
+        If the HTTP response status is not 200.
+    ValueError
+        If the response is not valid JSON.
+    """
+    values = {}
+    for batch, values in streamTestBatches(query, batchSize, client=client):
+        builder.extend(batch)
+    return values
+
+
+def fetchTestWindows(query: dict, start: int, end: int, window: int, windowTarget: int = 5000, max_workers: int = 4, client=None):
+    """Fetch tests between `start` and `end` in adaptive time windows.
+
+    Windows are requested `max_workers` at a time. After each round the window size is scaled towards
+    `windowTarget` tests per window: shrinking when windows are dense, growing when they are sparse.
+
+    Yields
+    ------
+    tuple
+        (from, to, data) for each window, in time order, where data is the decoded JSON response.
+
+    Raises
+    ------
+    Exception
+        If a window request fails. The message includes the window, so the range can be resumed from it.
+    """
+    if int(window) < 1 or int(windowTarget) < 1 or int(max_workers) < 1:
+        logger.error("window, windowTarget and max_workers must be at least 1")
+        raise ValueError("window, windowTarget and max_workers must be at least 1.")
+
+    # Time range query keys for regular or sync requests
+    sync = 'syncFrom' in query or 'syncTo' in query
+    from_key, to_key = ('syncFrom', 'syncTo') if sync else ('from', 'to')
+    base = {k: v for k, v in query.items() if k not in (from_key, to_key)}
+
+    def fetch(lo, hi):
+        try:
+            return fetchTests({**base, from_key: lo, to_key: hi}, client=client)
+        except Exception as e:
+            logger.error(f"Test window {lo}-{hi} failed: {e}")
+            raise Exception(f"{e} (window from_={lo}, to_={hi})")
+
+    cursor = int(start)
+    size = int(window)
+    with ThreadPoolExecutor(max_workers=int(max_workers), thread_name_prefix="hdforce-tests") as executor:
+        while cursor < end:
+            # Next round of windows
+            bounds = []
+            while len(bounds) < max_workers and cursor < end:
+                hi = min(int(end), cursor + size)
+                bounds.append((cursor, hi))
+                cursor = hi
+            # Workers run in a copy of this context, so their requests count in the measured call
+            futures = [executor.submit(contextvars.copy_context().run, fetch, lo, hi) for lo, hi in bounds]
+
+            largest = 0
+            for (lo, hi), future in zip(bounds, futures):
+                data = future.result()
+                count = int(data.get('count', 0))
+                largest = max(largest, count / max(1, hi - lo))
+                logger.debug(f"Test window {lo}-{hi}: {count} tests")
+                yield lo, hi, data
+
+            # Scale window size towards the target count, at most 4x per round
+            if largest > 0:
+                size = int(min(size * 4, max(size / 4, windowTarget / largest)))
+            else:
+                size = size * 4
+            size = max(1, size)
+
+
+# -------------------- #
+# Get All Tests
+
+
+@instrumented
+def GetTests(from_=None, to_=None, sync=False, athleteId=None, typeId=None, teamId=None, groupId=None, includeInactive = False, window=None, windowTarget=5000, max_workers=4, columns=None, tagId=None, where=None, compact=False, output="pandas", stream=False, client=None) -> pd.DataFrame:
+    """Get all test trials from an account. Allows filtering of results based on time frames, synchronization needs, and the active status of tests.
+
+    Parameters
+    ----------
+    from_ : int, optional
+        Unix timestamp specifying the start time from which tests should be fetched. Default is None, which fetches tests from the beginning.
+
+    to_ : int, optional
+        Unix timestamp specifying the end time until which tests should be fetched. Default is None, which fetches tests up to the current time.
+
+    sync : bool, optional
+        If True, the function fetches updated and newly created tests to synchronize with the database. Default is False.
+
+    athleteId : str optional
+        The unique identifier of the athlete whose tests are to be retrieved.
+
+    typeId : str optional
+        The canonical test ID, test type name, or test name abbreviation. Must correspond to known test types.
+
+    teamId : str optional
+        A single team ID, tuple or list of team IDs to receive tests from specific teams.
+
+    groupId : str optional
+        A single group ID or a comma-separated string of group IDs to receive tests from specific groups.
+
+    includeInactive : bool, optional
+        Default to False, where only active tests are returned. If True, all tests including inactive ones are returned.
+
+    window : int, optional
+        Fetch the time range in windows of about this many seconds, in parallel, instead of one request. Window sizes adapt to the number of tests returned: smaller where tests are dense, larger where they are sparse. Recommended for large ranges or when `from_` is not given. Default is None (single request).
+
+    windowTarget : int, optional
+        Number of tests per window that window sizes adapt towards. Default is 5000.
+
+    max_workers : int, optional
+        Maximum number of windows fetched at the same time when `window` is used. Default is 4.
+
+    columns : list of str, optional
+        Only build these columns, plus the test id, timestamp, segment, active status, and athlete and test type ids and names. Metric ids and labels from `GetMetrics` can be used as well as column names. Values of other columns are never collected, which saves parse time and memory on large pulls. Default is None (every column).
+
+    tagId : str or list of str, optional
+        Only return tests tagged with one of these tag ids. Filtered client-side, as tests are parsed.
+
+    where : callable, optional
+        Predicate called with each raw test record (the nested dictionary from the API, e.g. `record['athlete']['id']`), keeping the test when it returns True. Like `includeInactive` and `tagId`, it runs before any DataFrame is built, so rejected tests cost no parse time or memory. Default is None.
+
+    compact : bool, optional
+        Return memory-efficient dtypes: `timestamp` as UTC datetime64, metrics as float32, repeated strings such as athlete and test type names as categoricals, and nullable integer and boolean columns. About half the memory of the default dtypes on large pulls. Default is False.
+
+    output : str, optional
+        "pandas" (default), "arrow" for a `pyarrow.Table`, or "polars" for a `polars.DataFrame`. Arrow and polars results are built straight from the parsed test columns, without an intermediate pandas DataFrame, and need the optional `pyarrow` (and `polars`) packages. The DataFrame attributes are stored as JSON schema metadata of an Arrow table.
+
+    stream : bool, optional
+        Read the response as it arrives and parse tests in batches of 1000, instead of decoding the whole response first. Peak memory is then about the size of the result, rather than the response body plus the decoded response plus the result, which matters for full-history pulls without `window`. Cannot be used with `window`, whose responses are already bounded by `windowTarget`. Default is False.
+
+    client : HawkinClient, optional
+        Client to send the request with. Default is None, using the authentication set by `AuthManager`.
+
+    Returns
+    -------
+    pd.DataFrame, pyarrow.Table or polars.DataFrame
+        A DataFrame containing test trials matching the query criteria, with columns dependent on the test data and the following DataFrame attributes:
+        - Last Sync Time
+        - Last Test Time
+        - Count: number of tests matching the query on the server, before the client-side `includeInactive`, `tagId` and `where` filters. With `window`, tests returned by two windows are counted once.
+        - Rows: number of tests in the result, after the client-side filters
+        - Windows (list of (from, to, count) for each window, when `window` is used)
+        If every test is filtered out by `includeInactive`, `tagId` or `where`, the DataFrame has no rows, but keeps the id, timestamp, segment, active, athlete and test type columns and any requested `columns`.
+
+    Raises
+    ------
+    Exception
+        If the HTTP response status is not 200, indicating an unsuccessful API request, or if there is a failure in parsing the JSON response.
+    ValueError
+        If there is an error in handling the JSON response or data formatting, if `window`, `windowTarget` or `max_workers` is less than 1, `columns` or `tagId` is not a list of strings, `where` is not callable, `output` is unknown, or `stream` is used with `window`.
+    ImportError
+        If `output` is "arrow" or "polars" and pyarrow or polars is not installed.
+    """
+    # Build query parameters
+    query = buildTestsQuery(from_=from_, to_=to_, sync=sync, athleteId=athleteId, typeId=typeId, teamId=teamId, groupId=groupId)
+    checkOutput(output, compact)
+    if stream and window is not None:
+        logger.error("stream cannot be used with window")
+        raise ValueError("stream cannot be used with window. Windowed responses are already limited by windowTarget.")
+
+    # Column projection
+    resolved = resolveColumns(columns, client=client) if columns is not None else None
+    keep = set().union(*resolved.values()) if resolved is not None else None
+
+    # Client-side filters, applied to raw records before they are parsed
+    where = recordFilter(includeInactive=includeInactive, tagId=tagId, where=where)
+
+    if window is None and stream:
+        # Parse the tests while the response is read
+        builder = ColumnBuilder(keep, where)
+        data = streamTests(query, builder, client=client)
+    elif window is None:
+        data = fetchTests(query, client=client)
+    else:
+        # Fetch the range in windows, parsing each one as it arrives
+        start = from_ if from_ is not None else 0
+        end = to_ if to_ is not None else int(time.time())
+        builder = ColumnBuilder(keep, where)
+        windows = []
+        seen = set()
+        data = {'count': 0, 'lastSyncTime': 0, 'lastTestTime': 0}
+        for lo, hi, window_data in fetchTestWindows(query, start, end, window, windowTarget, max_workers, client=client):
+            builder.extend(window_data.get('data', []))
+            seen.update(record.get('id') for record in window_data.get('data', []))
+            windows.append((lo, hi, int(window_data.get('count', 0))))
+            data['lastSyncTime'] = max(data['lastSyncTime'], int(window_data.get('lastSyncTime') or 0))
+            data['lastTestTime'] = max(data['lastTestTime'], int(window_data.get('lastTestTime') or 0))
+        # Tests on window bounds are returned by both windows, count them once
+        data['count'] = len(seen)
+
     try:
-        data = response.json()
         # Check if the data dictionary is empty
         if data.get('count', 0) == 0:
             logger.info("No tests returned from query")
             return "No tests returned from query"
 
-        # run data handler function
-        df = responseHandler(data) 
-
-        # Filter active tests if required
-        if 'active' in df.columns and includeInactive == False:
-            df = df[df['active'] == True]
-
-        # Setting attributes
-        # Create Test Type info for df attrs
-        if typeId:
-            if t_id in type_ids:
-                type_info = type_ids[t_id]
+        # Flatten the test records into columns
+        attrs = {}
+        if window is None and stream:
+            tests = builder.columns()
+        elif window is None:
+            with phase("parse"):
+                tests = recordColumns(data['data'], keep, where)
+        else:
+            # Remove tests returned by two windows
+            tests = builder.columns()
+            with phase("filter"):
+                tests = dropDuplicateTests(tests)
+            attrs['Windows'] = windows
+
+        # Every test filtered out: no rows, but the key and requested columns
+        if not tests:
+            tests = emptyTestColumns(list(resolved) if resolved is not None else None)
+
+        # Requested columns not found in any test
+        if resolved is not None:
+            built = {columnName(key) for key in tests}
+            missing = [name for name, names in resolved.items() if not any(columnName(n) in built for n in names)]
+            if missing:
+                logger.warning(f"Columns not found in tests: {missing}")
 
         # Create team info for df attrs
         if teamId:
-            df.attrs['Team Id'] = teamId
+            attrs['Team Id'] = teamId
 
         # Create group info for df attrs
         if groupId:
-            df.attrs['Group Id'] = groupId
+            attrs['Group Id'] = groupId
 
         # Athlete Real Name
         if athleteId:
-            aName = df['athlete_name'].unique()
-            aName = str(aName[0])
-            df.attrs['Athlete Id'] = athleteId
-            df.attrs['Athlete Name'] = aName
-        
-        df.attrs['Last Sync'] = int(data['lastSyncTime'])
-        df.attrs['Last Test Time'] = int(data['lastTestTime'])
-        df.attrs['Count'] = int(data['count'])
-        logger.info(f"Request successful. Tests returned: {data['count']}")
+            aName = tests.get('athlete.name') or []
+            attrs['Athlete Id'] = athleteId
+            attrs['Athlete Name'] = str(aName[0]) if len(aName) else None
+
+        attrs['Last Sync'] = int(data['lastSyncTime'])
+        attrs['Last Test Time'] = int(data['lastTestTime'])
+        attrs['Count'] = int(data['count'])
+        attrs['Rows'] = len(tests.get('id') or [])
+
+        # Build the DataFrame or table
+        with phase("parse"):
+            df = testsOutput(tests, output, compact, attrs)
+        logger.info(f"Request successful. Tests returned: {attrs['Rows']} of {data['count']}")
         return df
 
     except requests.RequestException as e:
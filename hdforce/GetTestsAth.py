@@ -1,11 +1,8 @@
 # Create function to call tests by Athlete
 import requests
-import os
-import datetime
 import pandas as pd
 # Package imports
-from .utils import responseHandler, logger, ConfigManager, deprecated
-from .AuthManager import AuthManager
+from .utils import responseHandler, logger, ConfigManager, deprecated, apiRequest, instrumented, responseJson, recordFilter
 # Enable deprecation warnings globally
 import warnings
 warnings.simplefilter('always', DeprecationWarning)
@@ -14,6 +11,7 @@ warnings.simplefilter('always', DeprecationWarning)
 # Tests by Athlete
 
 @deprecated('Use `GetTests` instead, which has been expanded to handle all requests.')
+@instrumented
 def GetTestsAth(athleteId: str, from_: int = None, to_: int = None, sync: bool = False, includeInactive: bool = False) -> pd.DataFrame:
     """Get test trials for a specified athlete from an API. The function allows filtering of results based on time frames and the state of the test (active or not).
 
@@ -56,50 +54,11 @@ def GetTestsAth(athleteId: str, from_: int = None, to_: int = None, sync: bool =
     Use `GetTests` instead, which has been expanded to handle all requests.
     """
     # Retrieve Access Token and check expiration
-    a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-    tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-
-    # get current time in timestamp
-    now = datetime.datetime.now()
-    nowtime = datetime.datetime.timestamp(now)
-
-    # Validate refresh token and expiration
-    if a_token is None:
-        logger.error("No Access Token found.")
-        raise Exception("No Access Token found.")
-    elif int(nowtime) >= tokenExp:
-        logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-        # authenticate
-        try:
-            AuthManager(
-                region=ConfigManager.region,
-                authMethod=ConfigManager.env_method,
-                refreshToken_name=ConfigManager.token_name,
-                refreshToken=ConfigManager.refresh_token,
-                env_file_name=ConfigManager.file_name
-            )
-            # Retrieve Access Token and check expiration
-            a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-            logger.debug("New ACCESS_TOKEN retrieved")
-            tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-            logger.debug("TOKEN_EXPIRATION retrieved")
-            if a_token is None:
-                logger.error("No Access Token found.")
-                raise Exception("No Access Token found.")
-            elif int(nowtime) >= tokenExp:
-                logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-                raise Exception("Token expired")
-            else:
-                logger.debug(f"New Access Token valid through: {datetime.datetime.fromtimestamp(tokenExp)}")
-                pass
-        except ValueError:
-            logger.error("Failed to authenticate. Try AuthManager")
-            raise Exception("Failed to authenticate. Try AuthManage")
-    else:
-        logger.debug(f"Access Token retrieved. expires {datetime.datetime.fromtimestamp(tokenExp)}")
+    provider = ConfigManager.get_token_provider()
+    a_token = provider.get_token()
 
     # Create URL for request
-    url = os.getenv("CLOUD_URL")
+    url = provider.url_cloud
 
     # Create blank Query list to handle parameters
     query = {}
@@ -133,7 +92,7 @@ def GetTestsAth(athleteId: str, from_: int = None, to_: int = None, sync: bool =
 
     # GET Request
     headers = {"Authorization": f"Bearer {a_token}"}
-    response = requests.get(url, headers=headers, params=query)
+    response = apiRequest("GET", url, headers=headers, params=query)
 
     # Check response status and handle data accordingly
     if response.status_code != 200:
@@ -141,22 +100,19 @@ def GetTestsAth(athleteId: str, from_: int = None, to_: int = None, sync: bool =
         raise Exception(f"Error {response.status_code}: {response.reason}")
 
     try:
-        data = response.json()
+        data = responseJson(response)
         # Check if the data dictionary is empty
         if data.get('count', 0) == 0:
             logger.info("No tests returned from query")
             return "No tests returned from query"
 
         # run data handler function
-        df = responseHandler(data)
-
-        # Filter active tests if required
-        if 'active' in df.columns and includeInactive == False:
-            df = df[df['active'] == True]
+        # Inactive tests are skipped before parsing if not required
+        df = responseHandler(data, where=recordFilter(includeInactive=includeInactive))
 
         # Athlete Real Name
         aName = df['athlete_name'].unique()
-        aName = str(aName[0])
+        aName = str(aName[0]) if len(aName) else None
 
         # Setting attributes
         df.attrs['Athlete Id'] = athleteId
@@ -1,19 +1,21 @@
 # Dependencies -----
-import requests
-import os
-import datetime
 import pandas as pd
 # Package imports
-from .utils import logger, ConfigManager
-from .AuthManager import AuthManager
+from .utils import logger, clientContext, cachedRequest, CacheManager, instrumented, responseJson
 
 # -------------------- #
 # Get Test Types
 
 
-def GetTypes() -> pd.DataFrame:
+@instrumented
+def GetTypes(client=None) -> pd.DataFrame:
     """Get the test type names and IDs from an API.
 
+    Parameters
+    ----------
+    client : HawkinClient, optional
+        Client to send the request with. Default is None, using the authentication set by `AuthManager`.
+
     Returns
     -------
     pd.DataFrame
@@ -28,50 +30,11 @@ def GetTypes() -> pd.DataFrame:
         or if there is a failure in parsing the JSON response.
     """
     # Retrieve Access Token and check expiration
-    a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-    tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-
-    # get current time in timestamp
-    now = datetime.datetime.now()
-    nowtime = datetime.datetime.timestamp(now)
-
-    # Validate refresh token and expiration
-    if a_token is None:
-        logger.error("No Access Token found.")
-        raise Exception("No Access Token found.")
-    elif int(nowtime) >= tokenExp:
-        logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-        # authenticate
-        try:
-            AuthManager(
-                region=ConfigManager.region,
-                authMethod=ConfigManager.env_method,
-                refreshToken_name=ConfigManager.token_name,
-                refreshToken=ConfigManager.refresh_token,
-                env_file_name=ConfigManager.file_name
-            )
-            # Retrieve Access Token and check expiration
-            a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-            logger.debug("New ACCESS_TOKEN retrieved")
-            tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-            logger.debug("TOKEN_EXPIRATION retrieved")
-            if a_token is None:
-                logger.error("No Access Token found.")
-                raise Exception("No Access Token found.")
-            elif int(nowtime) >= tokenExp:
-                logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-                raise Exception("Token expired")
-            else:
-                logger.debug(f"New Access Token valid through: {datetime.datetime.fromtimestamp(tokenExp)}")
-                pass
-        except ValueError:
-            logger.error("Failed to authenticate. Try AuthManager")
-            raise Exception("Failed to authenticate. Try AuthManage")
-    else:
-        logger.debug(f"Access Token retrieved. expires {datetime.datetime.fromtimestamp(tokenExp)}")
+    provider, session = clientContext(client)
+    a_token = provider.get_token()
 
     # API Cloud URL
-    url_cloud = os.getenv("CLOUD_URL")
+    url_cloud = provider.url_cloud
 
     # Construct the API endpoint URL
     url = f"{url_cloud}/test_types"
@@ -81,19 +44,26 @@ def GetTypes() -> pd.DataFrame:
 
     # Send the GET request to the API
     logger.debug("GET request sent for Test Types.")
-    response = requests.get(url, headers=headers)
+    response = cachedRequest("types", url, provider, headers=headers, session=session)
 
     # Check if the API response was successful
     if response.status_code != 200:
         logger.error(f"Error {response.status_code}: {response.reason}")
         raise Exception(f"Error {response.status_code}: {response.reason}")
 
+    # Previously parsed types, if unchanged since
+    df = CacheManager.frame(response)
+    if df is not None:
+        logger.info(f"Request successful. Types returned: {len(df.index)} (cached)")
+        return df
+
     # If successful
     try:
-        data = response.json()
+        data = responseJson(response)
         df = pd.DataFrame.from_records(data)
 
         df.attrs['Count'] = int(len(df.index))
+        CacheManager.set_frame(response, df)
         count = str(len(df.index))
         logger.info(f"Request successful. Types returned: {count}")
         return df
@@ -0,0 +1,154 @@
+# Dependencies -----
+from typing import TYPE_CHECKING, Iterator, List
+# Package imports
+from .utils import TokenProvider, SessionManager
+from .LoggerConfig import LoggerConfig
+
+# Functions are imported by the methods using them, so a client made only for its token loads no more than that
+if TYPE_CHECKING:
+    import pandas as pd
+    from .Classes import NewAthlete, Athlete, AthleteResult
+
+# Get a logger specific to this module
+logger = LoggerConfig.get_logger(__name__)
+
+# -------------------- #
+# Hawkin Client
+
+
+class HawkinClient:
+    """A connection to one organization and region, independent of `AuthManager`.
+
+    Each client carries its own refresh token, access token, cloud URL and pooled session, and nothing is
+    written to the environment or a .env file. Several clients can be used side by side, from any number
+    of threads, to work with many organizations or regions in one process.
+
+    Parameters
+    ----------
+    refreshToken : str
+        The refresh token of the organization.
+
+    region : str
+        The region that designates the url prefix. Defaults to "Americas", with other options being "Europe" and "Asia/Pacific". A server URL sends requests to that server instead.
+
+    pool_maxsize : int
+        Maximum number of connections kept alive for this client. Default is 10.
+
+    renewBefore : int, optional
+        Renew the access token in the background this many seconds before it expires.
+
+    Attributes
+    ----------
+    region : str
+        Stores the region.
+
+    token_provider : TokenProvider
+        Holds the client's access token.
+
+    session : requests.Session
+        The client's pooled session.
+
+    Raises
+    ------
+    ValueError
+        If no refresh token is given, or the refresh token is invalid or expired.
+    """
+    def __init__(self, refreshToken: str, region: str = "Americas", pool_maxsize: int = 10, renewBefore: int = None):
+        if not refreshToken:
+            logger.error("No refresh token given")
+            raise ValueError("Refresh token must be provided.")
+        self.region = region
+        self.session = SessionManager.build_session(
+            pool_connections=SessionManager.pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=SessionManager.pool_block,
+            keep_alive=SessionManager.keep_alive,
+            transport=SessionManager.transport
+        )
+        self.token_provider = TokenProvider(refreshToken=refreshToken, region=region, method=None, session=self.session, renewBefore=renewBefore)
+        self.token_provider.refresh()
+        logger.debug(f"HawkinClient created for {region}: {refreshToken[0:6]}xxxx")
+
+    @property
+    def url_cloud(self) -> str:
+        """Base URL for the API of the client's region."""
+        return self.token_provider.url_cloud
+
+    def close(self):
+        """Stop token renewal and close the client's connections."""
+        self.token_provider.stop_renewal()
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __repr__(self):
+        return f"HawkinClient(region={self.region!r})"
+
+    def GetTests(self, **kwargs) -> "pd.DataFrame":
+        """`GetTests` for this client's organization. Accepts the same keyword arguments."""
+        from .GetTests import GetTests
+        return GetTests(client=self, **kwargs)
+
+    def IterTests(self, **kwargs) -> "Iterator[pd.DataFrame]":
+        """`IterTests` for this client's organization. Accepts the same keyword arguments."""
+        from .IterTests import IterTests
+        return IterTests(client=self, **kwargs)
+
+    def SyncTests(self, store=None, window: int = None) -> dict:
+        """`SyncTests` for this client's organization. The default store is specific to the organization."""
+        from .SyncTests import SyncTests
+        return SyncTests(store=store, window=window, client=self)
+
+    def GetForceTime(self, testId: str, asTrace: bool = False, dtype: str = "float64", archive=None, output: str = "pandas") -> "pd.DataFrame":
+        """`GetForceTime` for this client's organization."""
+        from .GetForceTime import GetForceTime
+        return GetForceTime(testId, asTrace=asTrace, dtype=dtype, archive=archive, output=output, client=self)
+
+    def GetForceTimeBulk(self, testIds: List[str], max_workers: int = 8, longFormat: bool = False, archive=None) -> dict:
+        """`GetForceTimeBulk` for this client's organization."""
+        from .GetForceTimeBulk import GetForceTimeBulk
+        return GetForceTimeBulk(testIds, max_workers=max_workers, longFormat=longFormat, archive=archive, client=self)
+
+    def GetAthletes(self, includeInactive: bool = False) -> "pd.DataFrame":
+        """`GetAthletes` for this client's organization."""
+        from .GetAthletes import GetAthletes
+        return GetAthletes(includeInactive, client=self)
+
+    def GetMetrics(self) -> "pd.DataFrame":
+        """`GetMetrics` for this client's region."""
+        from .GetMetrics import GetMetrics
+        return GetMetrics(client=self)
+
+    def GetTypes(self) -> "pd.DataFrame":
+        """`GetTypes` for this client's region."""
+        from .GetTypes import GetTypes
+        return GetTypes(client=self)
+
+    def GetTeams(self) -> "pd.DataFrame":
+        """`GetTeams` for this client's organization."""
+        from .GetTeams import GetTeams
+        return GetTeams(client=self)
+
+    def GetGroups(self) -> "pd.DataFrame":
+        """`GetGroups` for this client's organization."""
+        from .GetGroups import GetGroups
+        return GetGroups(client=self)
+
+    def GetTags(self) -> "pd.DataFrame":
+        """`GetTags` for this client's organization."""
+        from .GetTags import GetTags
+        return GetTags(client=self)
+
+    def CreateAthletes(self, athletes: "List[NewAthlete]") -> "List[AthleteResult]":
+        """`CreateAthletes` for this client's organization."""
+        from .CreateAthletes import CreateAthletes
+        return CreateAthletes(athletes, client=self)
+
+    def UpdateAthletes(self, athletes: "List[Athlete]") -> "List[AthleteResult]":
+        """`UpdateAthletes` for this client's organization."""
+        from .UpdateAthletes import UpdateAthletes
+        return UpdateAthletes(athletes, client=self)
@@ -0,0 +1,152 @@
+# Dependencies -----
+import time
+from typing import Iterator
+import pandas as pd
+# Package imports
+from .utils import logger, ColumnBuilder, instrumented, phase, recordFilter
+from .GetTests import buildTestsQuery, streamTestBatches, fetchTestWindows, resolveColumns
+
+# -------------------- #
+# Iterate Tests
+
+
+@instrumented
+def IterTests(from_=None, to_=None, sync=False, athleteId=None, typeId=None, teamId=None, groupId=None, includeInactive=False, window=None, chunkSize=None, windowTarget=5000, max_workers=4, columns=None, tagId=None, where=None, compact=False, client=None) -> Iterator[pd.DataFrame]:
+    """Iterate over test trials from an account in DataFrame chunks. Takes the same filters as `GetTests`, but yields each chunk as soon as it is ready, so large pulls can be written out and dropped one chunk at a time.
+
+    Parameters
+    ----------
+    from_ : int, optional
+        Unix timestamp specifying the start time from which tests should be fetched. Default is None, which fetches tests from the beginning.
+
+    to_ : int, optional
+        Unix timestamp specifying the end time until which tests should be fetched. Default is None, which fetches tests up to the current time.
+
+    sync : bool, optional
+        If True, the function fetches updated and newly created tests to synchronize with the database. Default is False.
+
+    athleteId : str optional
+        The unique identifier of the athlete whose tests are to be retrieved.
+
+    typeId : str optional
+        The canonical test ID, test type name, or test name abbreviation. Must correspond to known test types.
+
+    teamId : str optional
+        A single team ID, tuple or list of team IDs to receive tests from specific teams.
+
+    groupId : str optional
+        A single group ID, tuple or list of group IDs to receive tests from specific groups.
+
+    includeInactive : bool, optional
+        Default to False, where only active tests are returned. If True, all tests including inactive ones are returned.
+
+    window : int, optional
+        Fetch the time range in adaptive windows of about this many seconds, as in `GetTests`, yielding at least one chunk per window. Default is None (single request).
+
+    chunkSize : int, optional
+        Maximum number of trials in each chunk. Default is None, yielding one chunk per window, or a single chunk without `window`. Without `window`, the response is parsed as it is read, `chunkSize` records at a time, so memory holds about two chunks rather than the whole response.
+
+    windowTarget : int, optional
+        Number of tests per window that window sizes adapt towards. Default is 5000.
+
+    max_workers : int, optional
+        Maximum number of windows fetched at the same time when `window` is used. Default is 4.
+
+    columns : list of str, optional
+        Only build these columns and the test, athlete and test type ids, as in `GetTests`. Default is None (every column).
+
+    tagId : str or list of str, optional
+        Only yield tests tagged with one of these tag ids, as in `GetTests`.
+
+    where : callable, optional
+        Predicate on each raw test record, keeping the test when it returns True, as in `GetTests`. Default is None.
+
+    compact : bool, optional
+        Memory-efficient dtypes, as in `GetTests`. Categories are found per chunk, so `pd.concat` of chunks keeps categoricals only when they match. Default is False.
+
+    client : HawkinClient, optional
+        Client to send the requests with. Default is None, using the authentication set by `AuthManager`.
+
+    Yields
+    ------
+    pd.DataFrame
+        Test trials with the same columns as `GetTests`, and the following DataFrame attributes:
+        - Last Sync
+        - Last Test Time
+        - Count and Rows (trials in the chunk)
+        Without `window`, Last Sync and Last Test Time are read from the response as it streams in. When they come after the tests in the response, only the last chunk has them.
+        - Window ((from, to) of the window, when `window` is used)
+
+    Raises
+    ------
+    Exception
+        If the HTTP response status is not 200, indicating an unsuccessful API request. With `window`, the message names the failing window.
+    ValueError
+        If `chunkSize`, `window`, `windowTarget` or `max_workers` is less than 1, `columns` or `tagId` is not a list of strings, or `where` is not callable.
+    """
+    if chunkSize is not None and int(chunkSize) < 1:
+        logger.error("chunkSize must be at least 1")
+        raise ValueError("chunkSize must be at least 1.")
+
+    # Build query parameters
+    query = buildTestsQuery(from_=from_, to_=to_, sync=sync, athleteId=athleteId, typeId=typeId, teamId=teamId, groupId=groupId)
+    keep = set().union(*resolveColumns(columns, client=client).values()) if columns is not None else None
+    where = recordFilter(includeInactive=includeInactive, tagId=tagId, where=where)
+
+    def chunkFrame(builder, values, bounds=None):
+        # DataFrame of one chunk, with the values of its response
+        df = builder.frame(compact)
+        df.attrs['Last Sync'] = int(values.get('lastSyncTime') or 0)
+        df.attrs['Last Test Time'] = int(values.get('lastTestTime') or 0)
+        df.attrs['Count'] = len(df.index)
+        df.attrs['Rows'] = len(df.index)
+        if bounds is not None:
+            df.attrs['Window'] = bounds
+        return df
+
+    total = 0
+    if window is None:
+        # Parse the response while it is read, one chunk of records at a time. Each chunk is held until
+        # the next one is read, so the last chunk gets the values sent after the tests.
+        pending = None
+        builder = ColumnBuilder(keep, where)
+        for batch, values in streamTestBatches(query, int(chunkSize or 1000), client=client):
+            with phase("parse"):
+                builder.extend(batch)
+            if batch and chunkSize is None:
+                continue
+            if pending is not None and pending.rows:
+                total += pending.rows
+                yield chunkFrame(pending, values)
+            pending, builder = builder, ColumnBuilder(keep, where)
+        if pending is not None and pending.rows:
+            total += pending.rows
+            yield chunkFrame(pending, values)
+        logger.info(f"Request successful. Tests returned: {total}")
+        return
+
+    start = from_ if from_ is not None else 0
+    end = to_ if to_ is not None else int(time.time())
+
+    # Tests on a shared window edge are returned by both windows
+    previous_ids = set()
+    for lo, hi, data in fetchTestWindows(query, start, end, window, windowTarget, max_workers, client=client):
+        records = data.get('data') or []
+        data['data'] = None
+        ids = set()
+        size = int(chunkSize) if chunkSize is not None else max(1, len(records))
+        for i in range(0, len(records), size):
+            builder = ColumnBuilder(keep, where)
+            with phase("parse"):
+                for record in records[i:i + size]:
+                    if record.get('id') in previous_ids:
+                        continue
+                    ids.add(record.get('id'))
+                    builder.add(record)
+            if not builder.rows:
+                continue
+            total += builder.rows
+            yield chunkFrame(builder, data, (lo, hi))
+        previous_ids = ids
+
+    logger.info(f"Request successful. Tests returned: {total}")
@@ -0,0 +1,365 @@
+# Dependencies -----
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+# Package imports
+from .LoggerConfig import LoggerConfig
+from .GetTests import type_ids
+
+# Get a logger specific to this module
+logger = LoggerConfig.get_logger(__name__)
+
+# -------------------- #
+# Synthetic Data
+
+# Metrics of every synthetic test: id, column label, units
+_metrics = [
+    ("jumpHeight", "Jump Height(m)", "m"),
+    ("peakPropulsiveForce", "Peak Propulsive Force(N)", "N"),
+    ("avgPropulsiveForce", "Avg. Propulsive Force(N)", "N"),
+    ("systemWeight", "System Weight(N)", "N"),
+    ("mrsi", "mRSI", "")
+]
+
+
+class MockData:
+    """Synthetic organization served by `MockServer`.
+
+    Everything is generated from `seed`, so the same arguments always give the same athletes, tests and
+    force-time data. Override the `make*` methods to serve other data.
+
+    Parameters
+    ----------
+    trials : int
+        Number of test trials. Default is 1000.
+
+    athletes : int
+        Number of athletes. Default is 25.
+
+    samples : int
+        Samples in each force-time trace, at 1000 Hz. Default is 2000.
+
+    seed : int
+        Seed of the generators. Default is 0.
+
+    start : int
+        Unix timestamp of the first trial. Trials are 10 minutes apart on average.
+    """
+    def __init__(self, trials: int = 1000, athletes: int = 25, samples: int = 2000, seed: int = 0, start: int = 1690000000):
+        self.samples = int(samples)
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self.teams = [{"id": self.makeId(), "name": f"Team {i + 1}"} for i in range(3)]
+        self.groups = [{"id": self.makeId(), "name": f"Group {i + 1}"} for i in range(2)]
+        self.tags = [{"id": self.makeId(), "name": name, "description": f"{name} session"} for name in ("Pre", "Post", "Rehab")]
+        self.types = [{"id": key, "name": values[1]} for key, values in type_ids.items()]
+        self.metrics = [
+            {
+                "canonicalTestTypeId": t["id"], "testTypeName": t["name"],
+                "metrics": [{"id": mid, "label": label, "units": units, "description": f"Synthetic {label}"} for mid, label, units in _metrics]
+            }
+            for t in self.types
+        ]
+        self.athletes = [self.makeAthlete(i) for i in range(int(athletes))]
+        self.tests = []
+        self.index = {}
+        self.sync_times = {}
+        t = int(start)
+        for i in range(int(trials)):
+            t += self._rng.randint(60, 1140)
+            self.addTest(self.makeTest(i, t), t + self._rng.randint(1, 60))
+
+    def makeId(self) -> str:
+        """Random 20 character id."""
+        chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+        return "".join(self._rng.choice(chars) for _ in range(20))
+
+    def makeAthlete(self, i: int) -> dict:
+        """Athlete number `i`."""
+        return {
+            "id": self.makeId(),
+            "name": f"Athlete {i + 1}",
+            "teams": [self.teams[i % len(self.teams)]["id"]],
+            "groups": [self.groups[i % len(self.groups)]["id"]] if i % 3 else [],
+            "active": i % 10 != 9,
+            "external": {"GradYear": str(2024 + i % 4)}
+        }
+
+    def makeTest(self, i: int, timestamp: int) -> dict:
+        """Test trial number `i`."""
+        rng = self._rng
+        athlete = self.athletes[rng.randrange(len(self.athletes))]
+        key = rng.choice(list(type_ids))
+        name = type_ids[key][1]
+        tags = [tag for tag in self.tags if rng.random() < 0.2]
+        height = round(rng.uniform(0.2, 0.6), 4)
+        weight = round(rng.uniform(500, 1100), 2)
+        record = {
+            "id": self.makeId(),
+            "timestamp": timestamp,
+            "segment": f"{name}:{i % 5 + 1}",
+            "testType": {"id": key, "name": name, "canonicalId": key, "tags": tags},
+            "athlete": athlete,
+            "active": i % 50 != 49,
+            "Jump Height(m)": height,
+            "Peak Propulsive Force(N)": round(weight * rng.uniform(1.8, 2.6), 2),
+            "Avg. Propulsive Force(N)": round(weight * rng.uniform(1.4, 1.9), 2),
+            "System Weight(N)": weight,
+            "mRSI": round(height / rng.uniform(0.6, 1.0), 3)
+        }
+        return record
+
+    def addTest(self, record: dict, syncTime: int):
+        """Add a test with the time it was last synced."""
+        self.tests.append(record)
+        self.index[record["id"]] = record
+        self.sync_times[record["id"]] = syncTime
+
+    def makeForceTime(self, test: dict) -> dict:
+        """Force-time data of a test."""
+        rng = random.Random(f"{self.seed}-{test['id']}")
+        n = self.samples
+        weight = test.get("System Weight(N)", 800.0)
+        left, right = [], []
+        for i in range(n):
+            x = i / n
+            wave = math.sin(math.pi * x) ** 2 if 0.4 < x < 0.8 else 0.0
+            left.append(round(weight / 2 * (1 + 1.2 * wave) + rng.uniform(-3, 3), 1))
+            right.append(round(weight / 2 * (1 + 1.1 * wave) + rng.uniform(-3, 3), 1))
+        combined = [a + b for a, b in zip(left, right)]
+        mass = weight / 9.81
+        velocity, displacement, power = [], [], []
+        v = d = 0.0
+        for f in combined:
+            v += (f - weight) / mass / 1000
+            d += v / 1000
+            velocity.append(round(v, 6))
+            displacement.append(round(d, 6))
+            power.append(round(f * v, 6))
+        return {
+            "id": test["id"], "timestamp": test["timestamp"], "rsi": test.get("mRSI"),
+            "testType": {"id": test["testType"]["id"], "name": test["testType"]["name"]},
+            "athlete": {"id": test["athlete"]["id"], "name": test["athlete"]["name"]},
+            "Time(s)": [round((i + 1) / 1000, 3) for i in range(n)],
+            "LeftForce(N)": left, "RightForce(N)": right, "CombinedForce(N)": combined,
+            "Velocity(m/s)": velocity, "Displacement(m)": displacement, "Power(W)": power
+        }
+
+    def queryTests(self, query: dict) -> dict:
+        """Tests response for the query parameters of a tests request."""
+        def param(name, cast=str):
+            return cast(query[name]) if name in query else None
+
+        from_, to_ = param("from", int), param("to", int)
+        sync_from, sync_to = param("syncFrom", int), param("syncTo", int)
+        athlete, test_type = param("athleteId"), param("testTypeId")
+        teams = set(query["teamId"].split(",")) if "teamId" in query else None
+        groups = set(query["groupId"].split(",")) if "groupId" in query else None
+
+        data = []
+        for test in self.tests:
+            sync = self.sync_times[test["id"]]
+            if (from_ is not None and test["timestamp"] < from_) or (to_ is not None and test["timestamp"] > to_):
+                continue
+            if (sync_from is not None and sync < sync_from) or (sync_to is not None and sync > sync_to):
+                continue
+            if athlete is not None and test["athlete"]["id"] != athlete:
+                continue
+            if test_type is not None and test["testType"]["canonicalId"] != test_type:
+                continue
+            if teams is not None and not teams & set(test["athlete"]["teams"]):
+                continue
+            if groups is not None and not groups & set(test["athlete"]["groups"]):
+                continue
+            data.append(test)
+        return {
+            "data": data,
+            "count": len(data),
+            "lastSyncTime": max((self.sync_times[t["id"]] for t in data), default=0),
+            "lastTestTime": max((t["timestamp"] for t in data), default=0)
+        }
+
+
+# -------------------- #
+# Mock Server
+
+
+class MockServer:
+    """A local HTTP server imitating the Hawkin Dynamics API, for offline testing and benchmarks.
+
+    Serves `/api/token`, the tests endpoint `/api/dev`, and `/forcetime/{id}`, `/athletes`, `/athletes/bulk`,
+    `/metrics`, `/teams`, `/groups`, `/tags` and `/test_types` under `/api/dev`, with the data of a `MockData`.
+    Pass the server's `url` as the region to `AuthManager` or `HawkinClient`. Any refresh token is accepted.
+
+    Parameters
+    ----------
+    data : MockData, optional
+        Data to serve. Default is None, generating `MockData(trials=trials)`.
+
+    trials : int
+        Number of synthetic test trials when `data` is not given. Default is 1000.
+
+    host : str
+        Interface to listen on. Default is "127.0.0.1".
+
+    port : int
+        Port to listen on. Default is 0, picking a free port.
+
+    latency : float
+        Seconds added to every response, to imitate a network. Default is 0.
+
+    tokenTTL : int
+        Seconds until access tokens expire. Default is 3600.
+
+    Attributes
+    ----------
+    url : str
+        Base URL of the running server.
+
+    requests : int
+        Number of requests served.
+    """
+    def __init__(self, data: MockData = None, trials: int = 1000, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, tokenTTL: int = 3600):
+        self.data = data if data is not None else MockData(trials=trials)
+        self.latency = float(latency)
+        self.tokenTTL = int(tokenTTL)
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._thread = None
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Start serving on a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="hdforce-mock", daemon=True)
+            self._thread.start()
+            logger.debug(f"Mock server started: {self.url}")
+        return self
+
+    def stop(self):
+        """Stop the server."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        logger.debug("Mock server stopped")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def __repr__(self):
+        return f"MockServer(url={self.url!r}, trials={len(self.data.tests)})"
+
+    def route(self, method: str, path: str, query: dict, body):
+        """Status and JSON body for a request."""
+        data = self.data
+        if path == "/api/token":
+            return 200, {"access_token": f"mock-{time.time_ns()}", "expires_at": int(time.time()) + self.tokenTTL}
+        if not path.startswith("/api/dev"):
+            return 404, {"message": "Not Found"}
+        path = path[len("/api/dev"):].rstrip("/")
+
+        if method == "GET":
+            if path == "":
+                return 200, data.queryTests(query)
+            if path.startswith("/forcetime/"):
+                testId = path[len("/forcetime/"):]
+                test = data.index.get(testId)
+                if test is None:
+                    return 404, {"message": "Test not found"}
+                return 200, data.makeForceTime(test)
+            if path == "/athletes":
+                inactive = query.get("inactive", "false").lower() == "true"
+                return 200, {"data": [a for a in data.athletes if inactive or a["active"]]}
+            catalog = {"/teams": {"data": data.teams}, "/groups": {"data": data.groups}, "/tags": {"data": data.tags},
+                       "/test_types": data.types, "/metrics": data.metrics}
+            if path in catalog:
+                return 200, catalog[path]
+
+        if path == "/athletes/bulk" and method in ("POST", "PUT"):
+            created, failures = [], []
+            with self._lock:
+                names = {a["name"] for a in data.athletes}
+                known = {a["id"]: a for a in data.athletes}
+                for athlete in body or []:
+                    if method == "POST" and athlete.get("name") not in names:
+                        new = {"teams": [], "groups": [], "active": True, "external": {}, **athlete, "id": data.makeId()}
+                        data.athletes.append(new)
+                        names.add(new["name"])
+                        created.append({"id": new["id"], "name": new["name"]})
+                    elif method == "PUT" and athlete.get("id") in known:
+                        known[athlete["id"]].update(athlete)
+                        created.append({"id": athlete["id"], "name": athlete.get("name")})
+                    else:
+                        failures.append({"reason": "Duplicate or Invalid Athlete Name", "data": athlete})
+            return 200, {"data": created, "failures": failures}
+
+        return 404, {"message": "Not Found"}
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; without this small responses wait on delayed ACKs
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                logger.debug("Mock server: " + format % args)
+
+            def _serve(self, method):
+                with server._lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                parts = urlsplit(self.path)
+                query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+
+                if not self.headers.get("Authorization", "").startswith("Bearer "):
+                    status, payload = 401, {"message": "Unauthorized"}
+                else:
+                    status, payload = server.route(method, parts.path, query, body)
+
+                content = json.dumps(payload).encode("utf-8")
+                etag = '"' + hashlib.sha256(content).hexdigest()[:16] + '"'
+                if status == 200 and method == "GET" and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                if method == "GET":
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(content)
+
+            def do_GET(self):
+                self._serve("GET")
+
+            def do_POST(self):
+                self._serve("POST")
+
+            def do_PUT(self):
+                self._serve("PUT")
+
+        return Handler
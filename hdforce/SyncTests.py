@@ -0,0 +1,249 @@
+# Dependencies -----
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import pandas as pd
+# Package imports
+from .utils import logger, ColumnBuilder, ConfigManager, instrumented, clientContext
+from .GetTests import buildTestsQuery, fetchTests, fetchTestWindows
+
+# -------------------- #
+# Test Store
+
+
+def storePath(client=None) -> str:
+    """Default database path of an organization's test store.
+
+    `tests-<org>.sqlite` in `ConfigManager.cache_dir`, where `<org>` is a hash of the API URL and refresh token
+    of the client, so clients of different organizations or regions never share a store.
+
+    Parameters
+    ----------
+    client : HawkinClient, optional
+        Client of the organization. Default is None, using the authentication set by `AuthManager`.
+    """
+    provider, _ = clientContext(client)
+    org = hashlib.sha256(f"{provider.url_cloud}|{provider.refreshToken}".encode()).hexdigest()[:16]
+    return os.path.join(ConfigManager.cache_dir, f"tests-{org}.sqlite")
+
+
+class TestStore:
+    """A local SQLite store of test trials, kept up to date with `SyncTests`.
+
+    Each trial is stored once by its test `id`, as the JSON record returned by the API, together with the
+    last sync time of the organization. A store holds the trials of one organization.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of the SQLite database file. Default is None, using the store of the client's organization (see `storePath`) in `ConfigManager.cache_dir` (the HDFORCE_CACHE_DIR environment variable, otherwise `~/.hdforce`).
+
+    client : HawkinClient, optional
+        Client whose organization's store is opened when `path` is None. Default is None, using the authentication set by `AuthManager`.
+
+    Attributes
+    ----------
+    path : str
+        Stores the database path.
+    """
+    __test__ = False  # Not a pytest test class
+
+    def __init__(self, path: str = None, client=None):
+        if path is None:
+            path = storePath(client)
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tests ("
+                "id TEXT PRIMARY KEY, timestamp INTEGER, athlete_id TEXT, type_id TEXT, active INTEGER, record TEXT)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS tests_timestamp ON tests (timestamp)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        logger.debug(f"Test store opened: {path}")
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM tests").fetchone()[0]
+
+    def __repr__(self):
+        return f"TestStore(path={self.path!r})"
+
+    @property
+    def last_sync(self):
+        """Last sync time of the stored trials, or None if the store was never synced."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'lastSyncTime'").fetchone()
+        return int(row[0]) if row else None
+
+    def upsert(self, records, lastSync: int = None) -> int:
+        """Insert or replace test records by `id`, and optionally move the sync cursor, in one transaction.
+
+        Returns
+        -------
+        int
+            Number of records written.
+        """
+        rows = [
+            (
+                record['id'],
+                record.get('timestamp'),
+                (record.get('athlete') or {}).get('id'),
+                (record.get('testType') or {}).get('canonicalId'),
+                int(bool(record.get('active', True))),
+                json.dumps(record)
+            )
+            for record in records
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO tests VALUES (?, ?, ?, ?, ?, ?)", rows)
+            if lastSync is not None:
+                self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('lastSyncTime', ?)", (str(int(lastSync)),))
+        return len(rows)
+
+    def load(self, from_: int = None, to_: int = None, athleteId: str = None, typeId: str = None, includeInactive: bool = False) -> pd.DataFrame:
+        """Read stored trials into a DataFrame with the same columns as `GetTests`.
+
+        Parameters
+        ----------
+        from_ : int, optional
+            Unix timestamp of the earliest trial.
+
+        to_ : int, optional
+            Unix timestamp of the latest trial.
+
+        athleteId : str, optional
+            Only trials of this athlete.
+
+        typeId : str, optional
+            Only trials of this test type. The canonical test ID, test type name, or test name abbreviation.
+
+        includeInactive : bool, optional
+            Default to False, where only active tests are returned.
+
+        Returns
+        -------
+        pd.DataFrame
+            Stored trials in time order, with the attributes Count, Rows and Last Sync.
+        """
+        clauses, params = [], []
+        if from_ is not None:
+            clauses.append("timestamp >= ?")
+            params.append(int(from_))
+        if to_ is not None:
+            clauses.append("timestamp <= ?")
+            params.append(int(to_))
+        if athleteId is not None:
+            clauses.append("athlete_id = ?")
+            params.append(athleteId)
+        if typeId is not None:
+            clauses.append("type_id = ?")
+            params.append(buildTestsQuery(typeId=typeId)['testTypeId'])
+        if not includeInactive:
+            clauses.append("active = 1")
+        sql = "SELECT record FROM tests"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY timestamp, id"
+
+        builder = ColumnBuilder()
+        with self._lock:
+            for (record,) in self._conn.execute(sql, params):
+                builder.add(json.loads(record))
+        df = builder.frame()
+        df.attrs['Count'] = builder.rows
+        df.attrs['Rows'] = builder.rows
+        df.attrs['Last Sync'] = self.last_sync
+        logger.debug(f"Loaded {builder.rows} tests from store")
+        return df
+
+
+# -------------------- #
+# Sync Tests
+
+
+@instrumented
+def SyncTests(store=None, window=None, client=None) -> dict:
+    """Bring a local test store up to date, fetching only the tests created or changed since the last sync.
+
+    The first sync of an empty store fetches every test of the organization. Later syncs request tests from the
+    stored last sync time and insert or replace them by test `id`. The sync cursor only moves once the fetched
+    tests are written, so an interrupted sync can simply be run again.
+
+    Parameters
+    ----------
+    store : TestStore or str, optional
+        Store to update, or the path of its database file. Default is None, using the store of the client's organization (see `storePath`).
+
+    window : int, optional
+        Fetch the first full sync in adaptive windows of about this many seconds, as in `GetTests`. Each window is written as it arrives, and the stored last sync time is the oldest of the windows, so tests changed while the windows were fetched are picked up by the next sync. Default is None (single request).
+
+    client : HawkinClient, optional
+        Client to send the requests with. Default is None, using the authentication set by `AuthManager`.
+
+    Returns
+    -------
+    dict
+        A dictionary with:
+        - updated: Number of tests inserted or replaced.
+        - lastSync: Last sync time now stored.
+        - total: Number of tests in the store.
+
+    Raises
+    ------
+    Exception
+        If the HTTP response status is not 200, indicating an unsuccessful API request.
+    """
+    own_store = not isinstance(store, TestStore)
+    if own_store:
+        store = TestStore(store, client=client)
+
+    try:
+        cursor = store.last_sync
+        updated = 0
+        if cursor is None and window is not None:
+            # First sync in windows, moving the cursor only after the last one
+            started = int(time.time())
+            lasts = [started]
+            for lo, hi, data in fetchTestWindows(buildTestsQuery(), 0, started, window, client=client):
+                updated += store.upsert(data.get('data') or [])
+                if data.get('lastSyncTime'):
+                    lasts.append(int(data['lastSyncTime']))
+            # Windows are fetched at different times: a test changed after its window was fetched is newer than
+            # that window's lastSyncTime, so the cursor is the oldest one. Tests fetched twice are replaced by id.
+            store.upsert([], lastSync=min(lasts))
+        else:
+            if cursor is None:
+                logger.debug("Test store is empty. Fetching all tests")
+                query = buildTestsQuery()
+            else:
+                logger.debug(f"Syncing tests from {cursor}")
+                query = buildTestsQuery(from_=cursor, sync=True)
+            data = fetchTests(query, client=client)
+            last = int(data.get('lastSyncTime') or cursor or 0)
+            updated = store.upsert(data.get('data') or [], lastSync=max(last, cursor or 0))
+
+        result = {"updated": updated, "lastSync": store.last_sync, "total": len(store)}
+        logger.info(f"Sync successful. Tests updated: {updated}. Tests stored: {result['total']}")
+        return result
+
+    finally:
+        if own_store:
+            store.close()
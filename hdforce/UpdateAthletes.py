@@ -1,12 +1,8 @@
 # Dependencies -----
-import requests
-import os
-import datetime
 from typing import List, Dict, Optional
 from pydantic import BaseModel
 # Package imports
-from .AuthManager import AuthManager
-from .utils import ConfigManager
+from .utils import clientContext, apiRequest, CacheManager, instrumented, responseJson
 from .LoggerConfig import LoggerConfig
 from .Classes import Athlete, AthleteResult
 
@@ -16,7 +12,8 @@ logger = LoggerConfig.get_logger(__name__)
 # -------------------- #
 # Update Athletes
 
-def UpdateAthletes(athletes: List[Athlete]) -> List[AthleteResult]:
+@instrumented
+def UpdateAthletes(athletes: List[Athlete], client=None) -> List[AthleteResult]:
     """Update athletes for your account. Up to 500 at one time.
 
     Parameters
@@ -24,6 +21,9 @@ def UpdateAthletes(athletes: List[Athlete]) -> List[AthleteResult]:
     athletes : list[Athlete]
         A list of Athletes with class of `Athlete`.
 
+    client : HawkinClient, optional
+        Client to send the request with. Default is None, using the authentication set by `AuthManager`.
+
     Returns
     -------
     list[AthleteResult]
@@ -35,50 +35,11 @@ def UpdateAthletes(athletes: List[Athlete]) -> List[AthleteResult]:
         If the HTTP response status is not 200, indicating an unsuccessful API request, or if there is a failure in parsing the JSON response.
     """
     # Retrieve Access Token and check expiration
-    a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-    tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-
-    # get current time in timestamp
-    now = datetime.datetime.now()
-    nowtime = datetime.datetime.timestamp(now)
-
-    # Validate refresh token and expiration
-    if a_token is None:
-        logger.error("No Access Token found.")
-        raise Exception("No Access Token found.")
-    elif int(nowtime) >= tokenExp:
-        logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-        # authenticate
-        try:
-            AuthManager(
-                region=ConfigManager.region,
-                authMethod=ConfigManager.env_method,
-                refreshToken_name=ConfigManager.token_name,
-                refreshToken=ConfigManager.refresh_token,
-                env_file_name=ConfigManager.file_name
-            )
-            # Retrieve Access Token and check expiration
-            a_token = ConfigManager.get_env_variable("ACCESS_TOKEN")
-            logger.debug("New ACCESS_TOKEN retrieved")
-            tokenExp = int(ConfigManager.get_env_variable("TOKEN_EXPIRATION"))
-            logger.debug("TOKEN_EXPIRATION retrieved")
-            if a_token is None:
-                logger.error("No Access Token found.")
-                raise Exception("No Access Token found.")
-            elif int(nowtime) >= tokenExp:
-                logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(tokenExp)}")
-                raise Exception("Token expired")
-            else:
-                logger.debug(f"New Access Token valid through: {datetime.datetime.fromtimestamp(tokenExp)}")
-                pass
-        except ValueError:
-            logger.error("Failed to authenticate. Try AuthManager")
-            raise Exception("Failed to authenticate. Try AuthManage")
-    else:
-        logger.debug(f"Access Token retrieved. expires {datetime.datetime.fromtimestamp(tokenExp)}")
+    provider, session = clientContext(client)
+    a_token = provider.get_token()
 
     # API Cloud URL
-    url_cloud = os.getenv("CLOUD_URL")
+    url_cloud = provider.url_cloud
 
     # GET Request
     headers = {"Authorization": f"Bearer {a_token}"}
@@ -91,7 +52,10 @@ def UpdateAthletes(athletes: List[Athlete]) -> List[AthleteResult]:
     logger.debug(f"Payload being sent to API: {payload}")
 
     # GET Request
-    response = requests.put(url, headers=headers, json=payload)
+    response = apiRequest("PUT", url, headers=headers, json=payload, session=session)
+
+    # Cached athletes of this organization are out of date
+    CacheManager.invalidate("athletes", provider)
 
     # Response Handling
     if response.status_code != 200:
@@ -99,7 +63,7 @@ def UpdateAthletes(athletes: List[Athlete]) -> List[AthleteResult]:
         raise Exception(f"Error {response.status_code}: {response.reason}")
     
     try:
-        response_data = response.json()
+        response_data = responseJson(response)
         data = response_data.get('data', [])
         failures = response_data.get('failures', [])
     
@@ -1,21 +1,100 @@
-# From Utils
-from .AuthManager import AuthManager
-from .LoggerConfig import LoggerConfig
-
-# From Get Tests
-from .GetForceTime import GetForceTime
-from .GetTests import GetTests
-from .GetTestsAth import GetTestsAth
-from .GetTestsGroup import GetTestsGroup
-from .GetTestsTeam import GetTestsTeam
-from .GetTestsType import GetTestsType
-
-# From Hawkin Data
-from .GetMetrics import GetMetrics
-from .GetTypes import GetTypes
-
-# From Org Data
-from .GetAthletes import GetAthletes
-from .GetGroups import GetGroups
-from .GetTeams import GetTeams
-from .GetTags import GetTags
\ No newline at end of file
+# Public names are imported on first use, so `import hdforce` does not load pandas, requests or pydantic
+# until a function that needs them is called. `from hdforce import GetTests` works as before.
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING
+
+# Public name: module it is defined in
+_exports = {
+    # From Utils
+    "AuthManager": ".AuthManager",
+    "LoggerConfig": ".LoggerConfig",
+    "SessionManager": ".utils",
+    "RetryManager": ".utils",
+    "CacheManager": ".utils",
+    "StatsManager": ".utils",
+    "DecoderManager": ".utils",
+    "stats": ".utils",
+    "HawkinClient": ".HawkinClient",
+    "MockServer": ".MockServer",
+    "MockData": ".MockServer",
+    "RecordAdapter": ".transport",
+    "ReplayAdapter": ".transport",
+
+    # From Get Tests
+    "GetForceTime": ".GetForceTime",
+    "GetForceTimeBulk": ".GetForceTimeBulk",
+    "ForceTimeTrace": ".ForceTimeTrace",
+    "ForceTimeArchive": ".ForceTimeArchive",
+    "GetTests": ".GetTests",
+    "IterTests": ".IterTests",
+    "SyncTests": ".SyncTests",
+    "TestStore": ".SyncTests",
+    "GetTestsAth": ".GetTestsAth",
+    "GetTestsGroup": ".GetTestsGroup",
+    "GetTestsTeam": ".GetTestsTeam",
+    "GetTestsType": ".GetTestsType",
+
+    # From Hawkin Data
+    "GetMetrics": ".GetMetrics",
+    "GetTypes": ".GetTypes",
+
+    # From Org Data
+    "GetAthletes": ".GetAthletes",
+    "GetGroups": ".GetGroups",
+    "GetTeams": ".GetTeams",
+    "GetTags": ".GetTags",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    module = _exports.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports))
+
+
+class _Package(types.ModuleType):
+    # Importing a submodule sets it as an attribute of the package. Most functions share the name of their
+    # module, so keep the function there instead, as `from .GetTests import GetTests` used to.
+    def __setattr__(self, name, value):
+        if isinstance(value, types.ModuleType) and _exports.get(name) == "." + name and value.__name__ == f"{__name__}.{name}":
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+if TYPE_CHECKING:
+    from .AuthManager import AuthManager
+    from .LoggerConfig import LoggerConfig
+    from .utils import SessionManager, RetryManager, CacheManager, StatsManager, DecoderManager, stats
+    from .HawkinClient import HawkinClient
+    from .MockServer import MockServer, MockData
+    from .transport import RecordAdapter, ReplayAdapter
+    from .GetForceTime import GetForceTime
+    from .GetForceTimeBulk import GetForceTimeBulk
+    from .ForceTimeTrace import ForceTimeTrace
+    from .ForceTimeArchive import ForceTimeArchive
+    from .GetTests import GetTests
+    from .IterTests import IterTests
+    from .SyncTests import SyncTests, TestStore
+    from .GetTestsAth import GetTestsAth
+    from .GetTestsGroup import GetTestsGroup
+    from .GetTestsTeam import GetTestsTeam
+    from .GetTestsType import GetTestsType
+    from .GetMetrics import GetMetrics
+    from .GetTypes import GetTypes
+    from .GetAthletes import GetAthletes
+    from .GetGroups import GetGroups
+    from .GetTeams import GetTeams
+    from .GetTags import GetTags
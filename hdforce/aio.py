@@ -0,0 +1,204 @@
+# Dependencies -----
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+import pandas as pd
+# Package imports
+from .utils import SessionManager
+from .LoggerConfig import LoggerConfig
+from .Classes import NewAthlete, Athlete, AthleteResult
+from .GetTests import GetTests as _GetTests
+from .GetForceTime import GetForceTime as _GetForceTime
+from .GetAthletes import GetAthletes as _GetAthletes
+from .GetMetrics import GetMetrics as _GetMetrics
+from .GetTypes import GetTypes as _GetTypes
+from .GetTeams import GetTeams as _GetTeams
+from .GetGroups import GetGroups as _GetGroups
+from .GetTags import GetTags as _GetTags
+from .CreateAthletes import CreateAthletes as _CreateAthletes
+from .UpdateAthletes import UpdateAthletes as _UpdateAthletes
+
+# Get a logger specific to this module
+logger = LoggerConfig.get_logger(__name__)
+
+# -------------------- #
+# Async Client
+
+
+class AsyncClient:
+    """Awaitable versions of the hdforce functions with bounded concurrency.
+
+    Each call runs the matching synchronous function (same authentication, request layer and parsing)
+    on a worker thread, so many network waits can overlap in one event loop. No more than
+    `max_concurrency` calls are in flight at once.
+
+    Parameters
+    ----------
+    max_concurrency : int
+        Maximum number of requests in flight at the same time. Default is 10.
+
+    client : HawkinClient, optional
+        Client to send the requests with. Default is None, using the authentication set by `AuthManager`.
+
+    Attributes
+    ----------
+    max_concurrency : int
+        Stores the concurrency limit.
+    """
+    def __init__(self, max_concurrency: int = 10, client=None):
+        if int(max_concurrency) < 1:
+            logger.error("max_concurrency must be at least 1")
+            raise ValueError("max_concurrency must be at least 1.")
+        self.max_concurrency = int(max_concurrency)
+        self.client = client
+        self._semaphore = None
+        self._loop = None
+        self._executor = None
+
+        # Workers share the default session (see SessionManager.check_pool)
+        if client is None:
+            SessionManager.check_pool(self.max_concurrency, "max_concurrency")
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Semaphores belong to one event loop, so create one per running loop
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def _run(self, func, *args, **kwargs):
+        # Run a blocking function on the worker pool once a slot is free
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="hdforce-aio")
+        async with self._get_semaphore():
+            if self.client is not None:
+                kwargs['client'] = self.client
+            ctx = contextvars.copy_context()
+            call = functools.partial(ctx.run, func, *args, **kwargs)
+            return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    def close(self):
+        """Shut down the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    async def GetTests(self, **kwargs) -> pd.DataFrame:
+        """Awaitable `GetTests`. Accepts the same keyword arguments."""
+        return await self._run(_GetTests, **kwargs)
+
+    async def GetForceTime(self, testId: str, asTrace: bool = False, dtype: str = "float64", archive=None, output: str = "pandas") -> pd.DataFrame:
+        """Awaitable `GetForceTime`."""
+        return await self._run(_GetForceTime, testId, asTrace=asTrace, dtype=dtype, archive=archive, output=output)
+
+    async def GetAthletes(self, includeInactive: bool = False) -> pd.DataFrame:
+        """Awaitable `GetAthletes`."""
+        return await self._run(_GetAthletes, includeInactive)
+
+    async def GetMetrics(self) -> pd.DataFrame:
+        """Awaitable `GetMetrics`."""
+        return await self._run(_GetMetrics)
+
+    async def GetTypes(self) -> pd.DataFrame:
+        """Awaitable `GetTypes`."""
+        return await self._run(_GetTypes)
+
+    async def GetTeams(self) -> pd.DataFrame:
+        """Awaitable `GetTeams`."""
+        return await self._run(_GetTeams)
+
+    async def GetGroups(self) -> pd.DataFrame:
+        """Awaitable `GetGroups`."""
+        return await self._run(_GetGroups)
+
+    async def GetTags(self) -> pd.DataFrame:
+        """Awaitable `GetTags`."""
+        return await self._run(_GetTags)
+
+    async def CreateAthletes(self, athletes: List[NewAthlete]) -> List[AthleteResult]:
+        """Awaitable `CreateAthletes`."""
+        return await self._run(_CreateAthletes, athletes)
+
+    async def UpdateAthletes(self, athletes: List[Athlete]) -> List[AthleteResult]:
+        """Awaitable `UpdateAthletes`."""
+        return await self._run(_UpdateAthletes, athletes)
+
+
+# -------------------- #
+# Module level functions
+
+# Client used by the module level functions
+_client = AsyncClient()
+
+
+def SetConcurrency(max_concurrency: int) -> None:
+    """Set the concurrency limit used by the module level async functions.
+
+    Parameters
+    ----------
+    max_concurrency : int
+        Maximum number of requests in flight at the same time.
+    """
+    global _client
+    _client.close()
+    _client = AsyncClient(max_concurrency=max_concurrency)
+    logger.debug(f"Async concurrency set to {max_concurrency}")
+
+
+async def GetTests(**kwargs) -> pd.DataFrame:
+    """Awaitable `GetTests`. Accepts the same keyword arguments."""
+    return await _client.GetTests(**kwargs)
+
+
+async def GetForceTime(testId: str, asTrace: bool = False, dtype: str = "float64", archive=None, output: str = "pandas") -> pd.DataFrame:
+    """Awaitable `GetForceTime`."""
+    return await _client.GetForceTime(testId, asTrace=asTrace, dtype=dtype, archive=archive, output=output)
+
+
+async def GetAthletes(includeInactive: bool = False) -> pd.DataFrame:
+    """Awaitable `GetAthletes`."""
+    return await _client.GetAthletes(includeInactive)
+
+
+async def GetMetrics() -> pd.DataFrame:
+    """Awaitable `GetMetrics`."""
+    return await _client.GetMetrics()
+
+
+async def GetTypes() -> pd.DataFrame:
+    """Awaitable `GetTypes`."""
+    return await _client.GetTypes()
+
+
+async def GetTeams() -> pd.DataFrame:
+    """Awaitable `GetTeams`."""
+    return await _client.GetTeams()
+
+
+async def GetGroups() -> pd.DataFrame:
+    """Awaitable `GetGroups`."""
+    return await _client.GetGroups()
+
+
+async def GetTags() -> pd.DataFrame:
+    """Awaitable `GetTags`."""
+    return await _client.GetTags()
+
+
+async def CreateAthletes(athletes: List[NewAthlete]) -> List[AthleteResult]:
+    """Awaitable `CreateAthletes`."""
+    return await _client.CreateAthletes(athletes)
+
+
+async def UpdateAthletes(athletes: List[Athlete]) -> List[AthleteResult]:
+    """Awaitable `UpdateAthletes`."""
+    return await _client.UpdateAthletes(athletes)
@@ -0,0 +1,159 @@
+# Dependencies -----
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit, parse_qsl, urlencode
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+# Package imports
+from .LoggerConfig import LoggerConfig
+
+# Get a logger specific to this module
+logger = LoggerConfig.get_logger(__name__)
+
+# -------------------- #
+# Cassettes
+
+# Response headers kept in cassettes
+_kept_headers = ("Content-Type", "ETag", "Last-Modified", "Retry-After")
+
+
+class CassetteMiss(requests.RequestException):
+    """No recorded response matches a request."""
+
+
+def requestKey(request: requests.PreparedRequest) -> str:
+    """Key matching a request to its recorded response: method, URL with sorted query and a hash of the body."""
+    parts = urlsplit(request.url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    body = request.body or b""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    digest = hashlib.sha256(body).hexdigest()[:16] if body else ""
+    return f"{request.method} {parts.scheme}://{parts.netloc}{parts.path}?{query} {digest}".rstrip()
+
+
+def _load(path: str) -> dict:
+    # Recorded responses by request key
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+# -------------------- #
+# Record Adapter
+
+
+class RecordAdapter(HTTPAdapter):
+    """Transport that sends requests to the server and records every response to a cassette file.
+
+    Authorization headers are never written, and access tokens in token responses are replaced. Use with
+    `SessionManager.configure(transport=RecordAdapter("cassette.json"))`, then replay the file offline with
+    `ReplayAdapter`.
+
+    Parameters
+    ----------
+    path : str
+        Cassette file. Responses are added to an existing file.
+
+    **kwargs
+        Passed through to `requests.adapters.HTTPAdapter` (pool_connections, pool_maxsize, ...).
+    """
+    def __init__(self, path: str, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self._lock = threading.Lock()
+        self._interactions = _load(path)
+
+    def __repr__(self):
+        return f"RecordAdapter(path={self.path!r})"
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        body = response.content.decode(response.encoding or "utf-8", errors="replace")
+        if urlsplit(request.url).path.endswith("/token") and response.status_code == 200:
+            # Do not keep access tokens
+            token = json.loads(body)
+            token["access_token"] = "recorded-access-token"
+            body = json.dumps(token)
+        recorded = {
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {k: response.headers[k] for k in _kept_headers if k in response.headers},
+            "body": body
+        }
+        with self._lock:
+            self._interactions.setdefault(requestKey(request), []).append(recorded)
+            folder = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(folder, exist_ok=True)
+            with open(self.path + ".tmp", "w") as f:
+                json.dump(self._interactions, f, indent=1)
+            os.replace(self.path + ".tmp", self.path)
+        logger.debug(f"Recorded {request.method} {request.url}: {response.status_code}")
+        return response
+
+
+# -------------------- #
+# Replay Adapter
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport that answers requests from a cassette file, without a network connection.
+
+    Responses recorded for the same request are replayed in order, repeating the last one. Token responses
+    get a new expiry, so recorded tokens never expire during replay.
+
+    Parameters
+    ----------
+    path : str
+        Cassette file written by `RecordAdapter`.
+
+    Raises
+    ------
+    CassetteMiss
+        When sending a request that has no recorded response.
+    """
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._lock = threading.Lock()
+        self._interactions = _load(path)
+        self._played = {}
+
+    def __repr__(self):
+        return f"ReplayAdapter(path={self.path!r})"
+
+    def send(self, request, **kwargs):
+        key = requestKey(request)
+        recorded = self._interactions.get(key)
+        if not recorded:
+            logger.error(f"No recorded response for {request.method} {request.url}")
+            raise CassetteMiss(f"No recorded response for {request.method} {request.url}", request=request)
+        with self._lock:
+            i = self._played.get(key, 0)
+            self._played[key] = i + 1
+        recorded = recorded[min(i, len(recorded) - 1)]
+
+        body = recorded["body"]
+        if urlsplit(request.url).path.endswith("/token") and recorded["status"] == 200:
+            token = json.loads(body)
+            token["expires_at"] = int(time.time()) + 3600
+            body = json.dumps(token)
+
+        response = requests.Response()
+        response.status_code = recorded["status"]
+        response.reason = recorded["reason"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        response._content = body.encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
@@ -1,12 +1,28 @@
 # Dependencies
-import pandas as pd
-from pandas import json_normalize
 import requests
+from requests.adapters import HTTPAdapter
+import codecs
+import contextvars
 import datetime
+import functools
+import hashlib
+import inspect
+import json
 import os
+import random
+import re
+import sys
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv, set_key
 from .LoggerConfig import LoggerConfig
 
+# pandas is imported when a DataFrame is first built, so authentication alone does not load it
+if TYPE_CHECKING:
+    import pandas as pd
+
 # Get a logger specific to this module
 logger = LoggerConfig.get_logger(__name__)
 
@@ -18,6 +34,11 @@ class ConfigManager:
     # Class to manage configuration for environment variables source
     env_method = 'env'  # Default to system environment variables
     file_name = None
+    token_name = None
+    refresh_token = None
+    region = "Americas"
+    token_provider = None  # In memory access token, set by AuthManager
+    cache_dir = os.environ.get("HDFORCE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".hdforce"))  # Folder of local stores and archives
 
     @classmethod
     def set_env_source(self, region, method, fileName, token_name, token):
@@ -46,6 +67,35 @@ class ConfigManager:
         self.region = region             # Region
         logger.debug(f"region: {region}")
 
+    @classmethod
+    def set_token_provider(self, provider):
+        # Set the token provider consulted by all endpoints
+        if self.token_provider is not None and self.token_provider is not provider:
+            self.token_provider.stop_renewal()
+        self.token_provider = provider
+        logger.debug("Token provider set")
+
+    @classmethod
+    def get_token_provider(self):
+        # Get the token provider, creating one from stored variables if AuthManager was not run
+        if self.token_provider is None:
+            a_token = self.get_env_variable("ACCESS_TOKEN")
+            if a_token is None:
+                logger.error("No Access Token found.")
+                raise Exception("No Access Token found.")
+            tokenExp = self.get_env_variable("TOKEN_EXPIRATION")
+            self.token_provider = TokenProvider(
+                refreshToken=self.refresh_token,
+                region=self.region,
+                method=self.env_method,
+                fileName=self.file_name,
+                accessToken=a_token,
+                expiration=int(tokenExp) if tokenExp else 0,
+                url_cloud=self.get_env_variable("CLOUD_URL")
+            )
+            logger.debug("Token provider created from stored variables")
+        return self.token_provider
+
     @classmethod
     def get_env_variable(self, var_name):
         # Get an environment variable from the specified source
@@ -62,6 +112,1176 @@ class ConfigManager:
             return os.getenv(var_name)
 
 
+# -------------------- #
+# Session Manager
+
+
+class SessionManager:
+    """Holds the pooled HTTP session shared by every request made by the package.
+
+    Connections to the Hawkin Dynamics cloud are kept alive and reused between calls, so repeated
+    requests avoid a new TCP and TLS handshake each time.
+
+    Attributes
+    ----------
+    pool_connections : int
+        Number of host connection pools to cache. Default is 10.
+
+    pool_maxsize : int
+        Maximum number of connections kept alive per host. Default is 10.
+
+    pool_block : bool
+        If True, requests wait for a free connection when a host's pool is full instead of opening a throwaway connection. Default is False.
+
+    keep_alive : bool
+        If True, connections are kept open between requests. Default is True.
+
+    transport : requests.adapters.BaseAdapter or None
+        Adapter that sends every request in place of the pooled HTTP adapter, e.g. a `RecordAdapter` or `ReplayAdapter`. Default is None.
+    """
+    pool_connections = 10
+    pool_maxsize = 10
+    pool_block = False
+    keep_alive = True
+    transport = None
+    _session = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def configure(self, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False, keep_alive: bool = True, transport=None):
+        """Set the connection pool options and rebuild the shared session.
+
+        Parameters
+        ----------
+        pool_connections : int
+            Number of host connection pools to cache.
+
+        pool_maxsize : int
+            Maximum number of connections kept alive per host. Raise this when making many calls in parallel.
+
+        pool_block : bool
+            If True, block when a host's pool is exhausted rather than opening extra connections.
+
+        keep_alive : bool
+            If False, connections are closed after every request.
+
+        transport : requests.adapters.BaseAdapter
+            Adapter that sends every request, e.g. to record or replay responses. None uses the pooled HTTP adapter.
+        """
+        if int(pool_connections) < 1 or int(pool_maxsize) < 1:
+            logger.error("Pool sizes must be at least 1")
+            raise ValueError("pool_connections and pool_maxsize must be at least 1.")
+
+        with self._lock:
+            self.pool_connections = int(pool_connections)
+            self.pool_maxsize = int(pool_maxsize)
+            self.pool_block = bool(pool_block)
+            self.keep_alive = bool(keep_alive)
+            self.transport = transport
+            # Replace the current session so the new settings take effect
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+        logger.debug(f"Session configured: pool_connections={pool_connections} pool_maxsize={pool_maxsize} pool_block={pool_block} keep_alive={keep_alive} transport={transport!r}")
+
+    @staticmethod
+    def build_session(pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False, keep_alive: bool = True, transport=None) -> requests.Session:
+        """Create a new `requests.Session` with pooled HTTPS and HTTP adapters, or the given transport adapter."""
+        session = requests.Session()
+        adapter = transport
+        if adapter is None:
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Connection"] = "keep-alive" if keep_alive else "close"
+        return session
+
+    @classmethod
+    def get_session(self) -> requests.Session:
+        """Return the shared session, creating it on first use."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self.build_session(
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                        pool_block=self.pool_block,
+                        keep_alive=self.keep_alive,
+                        transport=self.transport
+                    )
+                    logger.debug("New pooled session created")
+        return self._session
+
+    @classmethod
+    def check_pool(self, workers: int, name: str = "max_workers"):
+        """Log a hint when `workers` parallel requests on the shared session are more than its connection pool holds."""
+        # Connections beyond the pool size are opened and thrown away
+        if workers > self.pool_maxsize:
+            logger.info(f"{name} ({workers}) is larger than the session pool ({self.pool_maxsize}). Use SessionManager.configure(pool_maxsize={workers}) to reuse all connections.")
+
+    @classmethod
+    def close(self):
+        """Close the shared session and release its connections."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                logger.debug("Pooled session closed")
+            self._session = None
+
+
+# -------------------- #
+# Rate Limiter
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting how fast requests are sent.
+
+    Parameters
+    ----------
+    rate : float
+        Requests allowed per second on average.
+
+    burst : int
+        Largest number of requests that can be sent back to back. Defaults to `rate` (at least 1).
+    """
+    def __init__(self, rate: float, burst: int = None):
+        if rate is None or float(rate) <= 0:
+            logger.error("rate must be greater than 0")
+            raise ValueError("rate must be greater than 0.")
+        self.rate = float(rate)
+        self.burst = float(burst) if burst is not None else max(1.0, self.rate)
+        if self.burst < 1:
+            logger.error("burst must be at least 1")
+            raise ValueError("burst must be at least 1.")
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    # Refill the bucket for the time passed
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hold every caller for `seconds`, e.g. after the server answers with Retry-After."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + float(seconds))
+            self._tokens = 0.0
+
+
+# -------------------- #
+# Retry Manager
+
+
+class RetryManager:
+    """Retry and rate limiting settings used by every request made by the package.
+
+    Failed requests are retried with jittered exponential backoff. When the server sends a
+    `Retry-After` header, that wait is used instead, and with a 429 all threads are held by the
+    shared rate limiter until it has passed.
+
+    Attributes
+    ----------
+    max_retries : int
+        Number of retries after the first attempt. Default is 3.
+
+    backoff_factor : float
+        Base delay in seconds. Retry `n` waits a random time between 0 and `backoff_factor * 2 ** n`. Default is 0.5.
+
+    max_backoff : float
+        Upper limit of a single backoff delay in seconds. Default is 30.
+
+    max_retry_after : float
+        Longest `Retry-After` wait that will be honored. Longer waits return the response without retrying. Default is 300.
+
+    retry_statuses : tuple
+        Response status codes that are retried. Default is (429, 500, 502, 503, 504).
+
+    rate_limiter : RateLimiter or None
+        Shared client side rate limiter. Default is None (no limit).
+    """
+    max_retries = 3
+    backoff_factor = 0.5
+    max_backoff = 30.0
+    max_retry_after = 300.0
+    retry_statuses = (429, 500, 502, 503, 504)
+    rate_limiter = None
+
+    # Methods that are safe to resend after a server error
+    idempotent_methods = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+    @classmethod
+    def configure(self, max_retries: int = 3, backoff_factor: float = 0.5, max_backoff: float = 30.0, max_retry_after: float = 300.0, retry_statuses: tuple = (429, 500, 502, 503, 504), rate: float = None, burst: int = None):
+        """Set the retry policy and the client side rate limit.
+
+        Parameters
+        ----------
+        max_retries : int
+            Number of retries after the first attempt. Use 0 to disable retries.
+
+        backoff_factor : float
+            Base delay in seconds for exponential backoff.
+
+        max_backoff : float
+            Upper limit of a single backoff delay in seconds.
+
+        max_retry_after : float
+            Longest `Retry-After` wait that will be honored.
+
+        retry_statuses : tuple
+            Response status codes that are retried.
+
+        rate : float
+            Requests allowed per second across all threads. None disables the rate limit.
+
+        burst : int
+            Largest number of requests sent back to back. Defaults to `rate`.
+        """
+        if int(max_retries) < 0:
+            logger.error("max_retries must be 0 or greater")
+            raise ValueError("max_retries must be 0 or greater.")
+        self.max_retries = int(max_retries)
+        self.backoff_factor = float(backoff_factor)
+        self.max_backoff = float(max_backoff)
+        self.max_retry_after = float(max_retry_after)
+        self.retry_statuses = tuple(retry_statuses)
+        self.rate_limiter = RateLimiter(rate=rate, burst=burst) if rate is not None else None
+        logger.debug(f"Retry configured: max_retries={max_retries} backoff_factor={backoff_factor} rate={rate} burst={burst}")
+
+    @classmethod
+    def backoff(self, attempt: int) -> float:
+        """Jittered exponential backoff delay for a retry attempt (0 based)."""
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+
+    @staticmethod
+    def retry_after(response: requests.Response):
+        """Seconds to wait from a `Retry-After` header, or None if missing or invalid."""
+        value = response.headers.get("Retry-After") if response.headers else None
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+# -------------------- #
+# Stats Manager
+
+
+class CallRecord:
+    """Measurements of one call of a package function, passed to `StatsManager` hooks.
+
+    Attributes
+    ----------
+    endpoint : str
+        Name of the function called, e.g. "GetTests".
+
+    seconds : float
+        Wall time of the call.
+
+    phases : dict
+        Seconds spent in each phase of the call: "token" (access token check or refresh), "request" (network,
+        including retries), "decode" (JSON decoding, see `DecoderManager`), "parse" (building the DataFrame, including the
+        `includeInactive` and `where` filters) and "filter" (removing tests returned by two windows).
+        Nested phases are not counted twice, so time in none of them is the remaining Python work of the function.
+        Requests sent in parallel (e.g. `GetTests(window=...)`) each add their time, so phases can add up to more than `seconds`.
+
+    requests : int
+        HTTP requests sent, including retries.
+
+    bytes : int
+        Response body bytes received.
+
+    rows : int or None
+        Rows of the returned DataFrame (samples of a force-time trace). None for other results.
+
+    status : int or None
+        Status code of the last response.
+
+    error : str or None
+        Exception type name if the call raised.
+    """
+    __slots__ = ("endpoint", "start", "seconds", "phases", "requests", "bytes", "rows", "status", "error", "_lock")
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.start = time.time()
+        self.seconds = 0.0
+        self.phases = {}
+        self.requests = 0
+        self.bytes = 0
+        self.rows = None
+        self.status = None
+        self.error = None
+        self._lock = threading.Lock()
+
+    def add_phase(self, name: str, seconds: float):
+        """Add time to a phase. Safe to call from worker threads of the call."""
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def add_response(self, response: requests.Response, body: bool = True):
+        """Count a response and its body size. Streamed bodies (`body=False`) are counted with `add_bytes` as they are read."""
+        with self._lock:
+            self.requests += 1
+            if body:
+                self.bytes += len(response.content or b"")
+            self.status = response.status_code
+
+    def add_bytes(self, n: int):
+        """Count `n` bytes of a streamed response body."""
+        with self._lock:
+            self.bytes += n
+
+    def to_dict(self) -> dict:
+        return {
+            "endpoint": self.endpoint, "start": self.start, "seconds": self.seconds, "phases": dict(self.phases),
+            "requests": self.requests, "bytes": self.bytes, "rows": self.rows, "status": self.status, "error": self.error
+        }
+
+    def __repr__(self):
+        phases = "".join(f", {k}={v:.4f}" for k, v in self.phases.items())
+        return f"CallRecord(endpoint={self.endpoint!r}, seconds={self.seconds:.4f}, rows={self.rows}, bytes={self.bytes}{phases})"
+
+
+# Call being measured and the phase it is in, for the current thread or task
+_current_call = contextvars.ContextVar("hdforce_call", default=None)
+_current_phase = contextvars.ContextVar("hdforce_phase", default=None)
+
+
+class StatsManager:
+    """Collects timings of every call of the package functions, for export to a metrics system.
+
+    Each call of a Get, Create or Update function (directly or through a `HawkinClient`) is measured as a
+    `CallRecord`. Records are aggregated per function into a latency histogram and totals of bytes, rows and
+    phase time, read with `stats()`. Functions added with `add_hook` receive every record as it completes.
+
+    Attributes
+    ----------
+    enabled : bool
+        If False, calls are not measured. Default is True.
+
+    buckets : tuple
+        Upper bounds in seconds of the latency histogram buckets. A last bucket counts slower calls.
+    """
+    enabled = True
+    buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+    _hooks = []
+    _stats = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def configure(self, enabled: bool = True, buckets: tuple = None):
+        """Turn measurement on or off and set the histogram buckets. Collected stats are reset.
+
+        Parameters
+        ----------
+        enabled : bool
+            If False, calls are not measured and hooks are not called.
+
+        buckets : tuple of float, optional
+            Upper bounds in seconds of the latency buckets. Default is None, keeping the current buckets.
+        """
+        if buckets is not None:
+            buckets = tuple(sorted(float(b) for b in buckets))
+            if not buckets or buckets[0] <= 0:
+                logger.error("Stats buckets must be positive")
+                raise ValueError("buckets must be a non-empty sequence of positive numbers.")
+        with self._lock:
+            self.enabled = bool(enabled)
+            if buckets is not None:
+                self.buckets = buckets
+            self._stats = {}
+        logger.debug(f"Stats configured: enabled={enabled} buckets={self.buckets}")
+
+    @classmethod
+    def add_hook(self, hook):
+        """Call `hook(record)` with the `CallRecord` of every completed call.
+
+        Hooks run on the thread that made the call, so they should be quick, e.g. hand the record to a
+        metrics client. Exceptions raised by a hook are logged and ignored.
+        """
+        if not callable(hook):
+            logger.error("Stats hook must be callable")
+            raise ValueError("hook must be callable.")
+        with self._lock:
+            self._hooks = self._hooks + [hook]
+
+    @classmethod
+    def remove_hook(self, hook):
+        """Stop calling a hook added with `add_hook`."""
+        with self._lock:
+            self._hooks = [h for h in self._hooks if h is not hook]
+
+    @classmethod
+    def reset(self):
+        """Clear the collected stats. Hooks are kept."""
+        with self._lock:
+            self._stats = {}
+
+    @classmethod
+    def record(self, call: CallRecord):
+        """Add a completed call to the stats and pass it to the hooks."""
+        with self._lock:
+            stats = self._stats.get(call.endpoint)
+            if stats is None:
+                stats = self._stats[call.endpoint] = {
+                    "calls": 0, "errors": 0, "seconds": 0.0, "requests": 0, "bytes": 0, "rows": 0,
+                    "phases": {}, "buckets": list(self.buckets), "counts": [0] * (len(self.buckets) + 1)
+                }
+            stats["calls"] += 1
+            stats["errors"] += call.error is not None
+            stats["seconds"] += call.seconds
+            stats["requests"] += call.requests
+            stats["bytes"] += call.bytes
+            stats["rows"] += call.rows or 0
+            for name, seconds in call.phases.items():
+                stats["phases"][name] = stats["phases"].get(name, 0.0) + seconds
+            i = 0
+            while i < len(stats["buckets"]) and call.seconds > stats["buckets"][i]:
+                i += 1
+            stats["counts"][i] += 1
+            hooks = self._hooks
+        for hook in hooks:
+            try:
+                hook(call)
+            except Exception as e:
+                logger.warning(f"Stats hook {hook!r} failed: {e}")
+
+    @classmethod
+    def stats(self) -> dict:
+        """Collected stats per function name.
+
+        Returns
+        -------
+        dict
+            Function name to a dictionary with:
+            - calls, errors: Number of calls, and of calls that raised.
+            - seconds: Total wall time of the calls.
+            - requests, bytes, rows: Total HTTP requests, response bytes and rows returned.
+            - phases: Total seconds in each phase (token, request, decode, parse, filter).
+            - buckets, counts: Latency histogram. `counts[i]` is the number of calls slower than `buckets[i-1]` and at most `buckets[i]` seconds; the last count is calls slower than every bucket.
+        """
+        with self._lock:
+            return {
+                endpoint: {**stats, "phases": dict(stats["phases"]), "buckets": list(stats["buckets"]), "counts": list(stats["counts"])}
+                for endpoint, stats in self._stats.items()
+            }
+
+
+def stats() -> dict:
+    """Collected call stats per function name. See `StatsManager.stats`."""
+    return StatsManager.stats()
+
+
+class phase:
+    """Context manager timing a phase of the call being measured.
+
+    Time spent in a nested phase counts for that phase only, so phases add up to at most the call time.
+    Nested phases of the same name are counted once. Does nothing outside a measured call.
+    """
+    __slots__ = ("name", "_call", "_parent", "_nested", "_token", "_start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self._call = _current_call.get()
+        self._parent = _current_phase.get()
+        if self._call is None or (self._parent is not None and self._parent.name == self.name):
+            self._call = None
+            return self
+        self._nested = 0.0
+        self._token = _current_phase.set(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._call is None:
+            return False
+        elapsed = time.perf_counter() - self._start
+        _current_phase.reset(self._token)
+        self._call.add_phase(self.name, elapsed - self._nested)
+        if self._parent is not None:
+            self._parent._nested += elapsed
+        return False
+
+
+def currentCall():
+    """The `CallRecord` of the call being measured, or None."""
+    return _current_call.get()
+
+
+def _rows(result):
+    # Rows of a DataFrame result, or samples of a force-time trace
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(result, pd.DataFrame):
+        return len(result.index)
+    if hasattr(result, "sample_rate") and hasattr(result, "__len__"):
+        return len(result)
+    return None
+
+
+def instrumented(func):
+    """Decorator measuring each call of a package function with `StatsManager`.
+
+    Calls made while another call is measured on the same thread (e.g. a function using another one) are
+    counted in the outer call only. For generator functions, the time spent producing the items is measured
+    and rows are summed over the items.
+    """
+    endpoint = func.__name__
+
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def generator(*args, **kwargs):
+            if not StatsManager.enabled or _current_call.get() is not None:
+                yield from func(*args, **kwargs)
+                return
+            call = CallRecord(endpoint)
+            context = contextvars.copy_context()
+            context.run(_current_call.set, call)
+            items = func(*args, **kwargs)
+            try:
+                while True:
+                    # Time spent producing items, not in the caller's loop
+                    start = time.perf_counter()
+                    try:
+                        item = context.run(next, items)
+                    except StopIteration:
+                        break
+                    finally:
+                        call.seconds += time.perf_counter() - start
+                    rows = _rows(item)
+                    if rows is not None:
+                        call.rows = (call.rows or 0) + rows
+                    yield item
+            except BaseException as e:
+                if not isinstance(e, GeneratorExit):
+                    call.error = type(e).__name__
+                raise
+            finally:
+                context.run(items.close)
+                StatsManager.record(call)
+        return generator
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not StatsManager.enabled or _current_call.get() is not None:
+            return func(*args, **kwargs)
+        call = CallRecord(endpoint)
+        token = _current_call.set(call)
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+            call.rows = _rows(result)
+            return result
+        except BaseException as e:
+            call.error = type(e).__name__
+            raise
+        finally:
+            call.seconds = time.perf_counter() - start
+            _current_call.reset(token)
+            StatsManager.record(call)
+    return wrapper
+
+
+# -------------------- #
+# JSON Decoder
+
+
+class DecoderManager:
+    """JSON decoder used for every API response.
+
+    With the default "auto", `orjson` is used when it is installed (`pip install hdforce[fast]`), which decodes
+    large test and force-time responses several times faster than the standard library. Otherwise responses
+    are decoded with `response.json()` as before.
+
+    Attributes
+    ----------
+    decoder : str or callable
+        "auto", "orjson", "json" (standard library), or a function taking the response body as bytes and
+        returning the decoded object. Default is "auto".
+    """
+    decoder = "auto"
+    _loads = None
+    _name = None
+
+    @classmethod
+    def configure(self, decoder="auto"):
+        """Set the JSON decoder.
+
+        Parameters
+        ----------
+        decoder : str or callable
+            "auto" (orjson when installed, else the standard library), "orjson", "json", or a function taking
+            the response body as bytes, such as `orjson.loads` or `simdjson.loads`.
+
+        Raises
+        ------
+        ValueError
+            If decoder is not one of the names above or a callable.
+        ImportError
+            If decoder is "orjson" and orjson is not installed.
+        """
+        if callable(decoder):
+            loads, name = decoder, getattr(decoder, "__module__", None) or "custom"
+        elif decoder == "json":
+            loads, name = None, "json"
+        elif decoder in ("auto", "orjson"):
+            try:
+                import orjson
+                loads, name = orjson.loads, "orjson"
+            except ImportError:
+                if decoder == "orjson":
+                    logger.error("orjson is not installed. Install it with: pip install hdforce[fast]")
+                    raise ImportError("orjson is not installed. Install it with: pip install hdforce[fast]")
+                loads, name = None, "json"
+        else:
+            logger.error(f"Unknown JSON decoder: {decoder!r}")
+            raise ValueError(f"Unknown JSON decoder: {decoder!r}. Use 'auto', 'orjson', 'json' or a callable.")
+        self.decoder = decoder
+        self._loads = loads
+        self._name = name
+        logger.debug(f"JSON decoder configured: {name}")
+
+    @classmethod
+    def name(self) -> str:
+        """Name of the decoder in use: "orjson", "json", or the module of a custom decoder."""
+        if self._name is None:
+            self.configure(self.decoder)
+        return self._name
+
+    @classmethod
+    def decode(self, response: requests.Response):
+        """Decode the JSON body of a response."""
+        if self._name is None:
+            self.configure(self.decoder)
+        loads = self._loads
+        body = getattr(response, "content", None)
+        # Standard decoder, or objects that only provide .json()
+        if loads is None or not isinstance(body, (bytes, bytearray)):
+            return response.json()
+        if response.encoding and response.encoding.lower().replace("-", "") not in ("utf8", "ascii"):
+            body = body.decode(response.encoding).encode("utf-8")
+        return loads(body)
+
+
+def numericArray(values):
+    """NumPy array of a decoded JSON list of numbers, with null values as NaN. Lists of other values are returned as they are."""
+    import numpy as np
+    array = np.asarray(values)
+    if array.dtype == object:
+        try:
+            array = array.astype(np.float64)
+        except (TypeError, ValueError):
+            return values
+    return array if array.dtype.kind in "biuf" else values
+
+
+def responseJson(response: requests.Response, arrays=None):
+    """Decode a JSON response with `DecoderManager`, timed as the "decode" phase of the call being measured.
+
+    Lists under the keys in `arrays` are converted to NumPy arrays as part of decoding (see `numericArray`),
+    and each list is dropped as soon as its array is made.
+    """
+    with phase("decode"):
+        data = DecoderManager.decode(response)
+        if arrays and isinstance(data, dict):
+            for key in arrays:
+                if isinstance(data.get(key), list):
+                    data[key] = numericArray(data[key])
+        return data
+
+
+# JSON whitespace
+_whitespace = re.compile(r"[ \t\n\r]*")
+
+
+class RecordStream:
+    """Incremental parser of a streamed JSON response holding one large array of records, e.g. the 'data' list of tests.
+
+    The body is read in chunks and each record is decoded as soon as it is complete, so the raw body and the
+    full decoded response are never held in memory. Other top-level values (e.g. 'count') are collected in
+    `values`. Records are decoded with the standard library, as `DecoderManager` decoders need whole documents.
+
+    Parameters
+    ----------
+    response : requests.Response
+        Response sent with `stream=True`. Responses already read are parsed from their content.
+
+    key : str, optional
+        Top-level key of the record array. Default is 'data'.
+
+    chunkSize : int, optional
+        Bytes read from the response at a time. Default is 65536.
+
+    Attributes
+    ----------
+    values : dict
+        Top-level values other than the records, complete once the records have been read.
+
+    bytes : int
+        Bytes of the body read so far.
+
+    Raises
+    ------
+    ValueError
+        While iterating, if the body is not a JSON object or is cut off.
+    """
+    def __init__(self, response: requests.Response, key: str = 'data', chunkSize: int = 65536):
+        self.key = key
+        self.values = {}
+        self.bytes = 0
+        if response.raw is not None:
+            self._chunks = response.iter_content(chunk_size=int(chunkSize))
+        else:
+            # Transports that set the content directly
+            content = response.content or b""
+            self._chunks = (content[i:i + int(chunkSize)] for i in range(0, len(content), int(chunkSize)))
+        self._text = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        self._decoder = json.JSONDecoder()
+        self._call = currentCall()
+        self._buf = ""
+        self._pos = 0
+        self._done = False
+
+    def _fill(self) -> bool:
+        # Read the next chunk into the buffer, dropping text already parsed. False at the end of the body.
+        if self._done:
+            return False
+        with phase("request"):
+            chunk = next(self._chunks, None)
+        if chunk is None:
+            self._done = True
+            text = self._text.decode(b"", final=True)
+        else:
+            self.bytes += len(chunk)
+            if self._call is not None:
+                self._call.add_bytes(len(chunk))
+            text = self._text.decode(chunk)
+        self._buf = self._buf[self._pos:] + text
+        self._pos = 0
+        return chunk is not None or bool(text)
+
+    def _peek(self) -> str:
+        # Next character after whitespace, reading more of the body as needed. '' at the end of the body.
+        while True:
+            self._pos = _whitespace.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            logger.error(f"Unexpected {char or 'end of response'!r} in streamed JSON, expected one of {chars!r}")
+            raise ValueError(f"Unexpected {char or 'end of response'!r} in streamed JSON, expected one of {chars!r}.")
+        self._pos += 1
+        return char
+
+    def _value(self):
+        # Decode the value at the current position. Values ending with the buffer may be cut off, so the
+        # next chunk is read before they are accepted.
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                if end < len(self._buf) or self._done:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._done:
+                    raise
+            self._fill()
+
+    def __iter__(self):
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            name = self._value()
+            self._expect(':')
+            if name == self.key and self._peek() == '[':
+                self._pos += 1
+                if self._peek() == ']':
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._value()
+                        if self._expect(',]') == ']':
+                            break
+            else:
+                self.values[name] = self._value()
+            if self._expect(',}') == '}':
+                return
+
+    def batches(self, size: int = 1000):
+        """Yield lists of up to `size` records, timed as the "decode" phase of the call being measured."""
+        records = iter(self)
+        while True:
+            with phase("decode"):
+                batch = [record for _, record in zip(range(int(size)), records)]
+            if not batch:
+                return
+            yield batch
+
+
+# -------------------- #
+# API Request
+
+
+def apiRequest(method: str, url: str, session: requests.Session = None, **kwargs) -> requests.Response:
+    """Send a request to the API through the pooled session, with retries and rate limiting.
+
+    Responses with a status in `RetryManager.retry_statuses` and connection errors are retried up to
+    `RetryManager.max_retries` times. POST requests are only retried on 429, as other failures may have
+    been processed by the server.
+
+    Parameters
+    ----------
+    method : str
+        HTTP method, e.g. 'GET', 'POST' or 'PUT'.
+
+    url : str
+        Full request URL.
+
+    session : requests.Session, optional
+        Session to send the request with. Defaults to the shared `SessionManager` session.
+
+    **kwargs
+        Passed through to `requests.Session.request` (headers, params, json, ...).
+
+    Returns
+    -------
+    requests.Response
+        The response of the last attempt.
+
+    Raises
+    ------
+    requests.RequestException
+        If the request could not be sent after all retries.
+    """
+    if session is None:
+        session = SessionManager.get_session()
+    idempotent = method.upper() in RetryManager.idempotent_methods
+
+    call = _current_call.get()
+    attempt = 0
+    while True:
+        limiter = RetryManager.rate_limiter
+        try:
+            with phase("request"):
+                if limiter is not None:
+                    limiter.acquire()
+                response = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt >= RetryManager.max_retries or not idempotent:
+                raise
+            delay = RetryManager.backoff(attempt)
+            logger.warning(f"{method} {url} failed ({e.__class__.__name__}). Retry {attempt + 1}/{RetryManager.max_retries} in {delay:.2f}s")
+            with phase("request"):
+                time.sleep(delay)
+            attempt += 1
+            continue
+
+        if call is not None:
+            call.add_response(response, body=not kwargs.get("stream", False))
+        status = response.status_code
+        if status not in RetryManager.retry_statuses or attempt >= RetryManager.max_retries:
+            return response
+        if status != 429 and not idempotent:
+            return response
+
+        # Prefer the server's requested wait over backoff
+        delay = RetryManager.retry_after(response)
+        if delay is None:
+            delay = RetryManager.backoff(attempt)
+        elif delay > RetryManager.max_retry_after:
+            logger.warning(f"Retry-After of {delay:.0f}s is longer than max_retry_after. Not retrying.")
+            return response
+        elif status == 429 and limiter is not None:
+            limiter.pause(delay)
+
+        logger.warning(f"{method} {url} returned {status}. Retry {attempt + 1}/{RetryManager.max_retries} in {delay:.2f}s")
+        response.close()
+        with phase("request"):
+            time.sleep(delay)
+        attempt += 1
+
+
+# -------------------- #
+# Cache Manager
+
+
+class CacheManager:
+    """Time-to-live cache of responses from endpoints that rarely change.
+
+    Successful responses of the org and catalog endpoints (athletes, teams, groups, tags, test types and
+    metrics) are kept for the number of seconds set for the endpoint in `ttl`. Entries are kept per
+    organization and URL, so clients of different organizations never share entries. With `path` set,
+    entries are also written to disk, so separate runs of a script or notebook can reuse them.
+
+    Athletes are not cached by default (ttl 0), as athletes created or updated in the app would not show
+    until the entry expires. Set a ttl for them with `configure(ttl={"athletes": 60})`.
+
+    Attributes
+    ----------
+    enabled : bool
+        Use the cache. Default is True.
+
+    ttl : dict
+        Seconds responses are kept, by endpoint. An endpoint with a ttl of 0 is not cached.
+
+    path : str or None
+        Folder of the on-disk cache. Default is None (memory only).
+    """
+    enabled = True
+    ttl = {"types": 86400, "metrics": 86400, "teams": 300, "groups": 300, "tags": 300, "athletes": 0}
+    path = None
+    _entries = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def configure(self, enabled: bool = True, ttl: dict = None, path: str = None):
+        """Set the cache settings.
+
+        Parameters
+        ----------
+        enabled : bool
+            Use the cache. False turns it off and clears the entries held in memory.
+
+        ttl : dict
+            Seconds responses are kept, by endpoint, e.g. {"athletes": 60}. Endpoints not given keep their current ttl.
+
+        path : str
+            Folder of the on-disk cache. None keeps entries in memory only.
+        """
+        if ttl is not None:
+            unknown = set(ttl) - set(self.ttl)
+            if unknown:
+                logger.error(f"Unknown cache endpoints: {sorted(unknown)}")
+                raise ValueError(f"Unknown cache endpoints: {sorted(unknown)}. Use {sorted(self.ttl)}.")
+            self.ttl = {**self.ttl, **{k: float(v) for k, v in ttl.items()}}
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+        self.enabled = bool(enabled)
+        self.path = path
+        if not self.enabled:
+            with self._lock:
+                self._entries.clear()
+        logger.debug(f"Cache configured: enabled={enabled} ttl={self.ttl} path={path}")
+
+    @classmethod
+    def invalidate(self, endpoint: str = None, provider=None):
+        """Remove cached responses of one endpoint, or of every endpoint if None.
+
+        With `provider` set, only the responses of that provider's organization are removed.
+        """
+        org = None if provider is None else self.org(provider)
+
+        def match(name, name_org):
+            return (endpoint is None or name == endpoint) and (org is None or name_org == org)
+
+        with self._lock:
+            for key in [k for k in self._entries if match(k[0], k[1])]:
+                del self._entries[key]
+        if self.path is not None and os.path.isdir(self.path):
+            for name in os.listdir(self.path):
+                # Files are named {endpoint}-{org}-{digest}.json
+                parts = name[:-len(".json")].split("-")
+                if name.endswith(".json") and len(parts) == 3 and match(parts[0], parts[1]):
+                    try:
+                        os.remove(os.path.join(self.path, name))
+                    except OSError:
+                        pass
+        logger.debug(f"Cache invalidated: {endpoint or 'all endpoints'}{'' if org is None else f' of organization {org}'}")
+
+    @staticmethod
+    def org(provider) -> str:
+        """Short hash of the provider's refresh token, identifying its organization in cache keys."""
+        return hashlib.sha256(str(provider.refreshToken).encode()).hexdigest()[:16]
+
+    @classmethod
+    def key(self, endpoint: str, provider, url: str, params: dict = None) -> tuple:
+        """Cache key of a request, scoped to the organization of the provider's refresh token."""
+        org = self.org(provider)
+        query = json.dumps(params or {}, sort_keys=True, default=str)
+        digest = hashlib.sha256(f"{org}|{url}|{query}".encode()).hexdigest()[:32]
+        return (endpoint, org, digest)
+
+    @classmethod
+    def get(self, key: tuple):
+        """The cached entry for a key, including expired entries, or None if missing."""
+        if not self.enabled or not self.ttl.get(key[0]):
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None and self.path is not None:
+            try:
+                with open(self._file(key)) as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+            with self._lock:
+                entry = self._entries.setdefault(key, entry)
+        return entry
+
+    @staticmethod
+    def fresh(entry: dict) -> bool:
+        """True if an entry has not expired."""
+        return entry["expires"] > time.time()
+
+    @classmethod
+    def set(self, key: tuple, response: requests.Response):
+        """Store a successful response with its validators, and return the new entry."""
+        ttl = self.ttl.get(key[0])
+        if not self.enabled or not ttl:
+            return None
+        entry = {
+            "expires": time.time() + ttl,
+            "url": response.url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content": response.content.decode(response.encoding or "utf-8")
+        }
+        with self._lock:
+            self._entries[key] = entry
+        self._write(key, entry)
+        return entry
+
+    @classmethod
+    def renew(self, key: tuple, entry: dict):
+        """Keep an entry for another ttl, after the server confirmed it is unchanged."""
+        entry["expires"] = time.time() + self.ttl.get(key[0], 0)
+        self._write(key, entry)
+
+    @classmethod
+    def _file(self, key: tuple) -> str:
+        # Disk file of a key
+        return os.path.join(self.path, "-".join(key) + ".json")
+
+    @classmethod
+    def _write(self, key: tuple, entry: dict):
+        # Copy of an entry on disk, without the parsed DataFrame
+        if self.path is None:
+            return
+        file = self._file(key)
+        with self._lock:
+            data = {k: v for k, v in entry.items() if k != "frame"}
+        try:
+            with open(file + ".tmp", "w") as f:
+                json.dump(data, f)
+            os.replace(file + ".tmp", file)
+        except OSError as e:
+            logger.warning(f"Could not write cache file {file}: {e}")
+
+    @staticmethod
+    def response(entry: dict) -> requests.Response:
+        """Rebuild a response from a cached entry."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = entry["url"]
+        response.encoding = "utf-8"
+        response._content = entry["content"].encode("utf-8")
+        response.from_cache = True
+        response.cache_entry = entry
+        return response
+
+    @staticmethod
+    def frame(response: requests.Response):
+        """Copy of the DataFrame previously parsed from a cached response, or None."""
+        entry = getattr(response, "cache_entry", None)
+        if not getattr(response, "from_cache", False) or entry is None or entry.get("frame") is None:
+            return None
+        return entry["frame"].copy()
+
+    @classmethod
+    def set_frame(self, response: requests.Response, df: "pd.DataFrame"):
+        """Keep the DataFrame parsed from a response, to be reused while the response is unchanged."""
+        entry = getattr(response, "cache_entry", None)
+        if entry is not None:
+            frame = df.copy()
+            with self._lock:
+                entry["frame"] = frame
+
+
+def cachedRequest(endpoint: str, url: str, provider, session: requests.Session = None, **kwargs) -> requests.Response:
+    """GET request answered from `CacheManager` while a response of the endpoint is cached.
+
+    Once a cached response has expired, it is revalidated with `If-None-Match` / `If-Modified-Since` when the
+    server sent an ETag or Last-Modified header. A 304 reply renews the cached response instead of downloading
+    it again. Without validators a normal request is sent.
+
+    Parameters
+    ----------
+    endpoint : str
+        Endpoint name used for the ttl, e.g. 'teams'.
+
+    url : str
+        Full request URL.
+
+    provider : TokenProvider
+        Provider of the request, used to keep entries per organization.
+
+    session : requests.Session, optional
+        Session to send the request with.
+
+    **kwargs
+        Passed through to `apiRequest`.
+
+    Returns
+    -------
+    requests.Response
+        The cached or new response.
+    """
+    key = CacheManager.key(endpoint, provider, url, kwargs.get("params"))
+    entry = CacheManager.get(key)
+    if entry is not None and CacheManager.fresh(entry):
+        logger.debug(f"Cached response: {endpoint}")
+        return CacheManager.response(entry)
+
+    # Revalidate an expired response
+    if entry is not None and (entry.get("etag") or entry.get("last_modified")):
+        headers = dict(kwargs.get("headers") or {})
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        kwargs["headers"] = headers
+
+    response = apiRequest("GET", url, session=session, **kwargs)
+    if response.status_code == 304 and entry is not None:
+        logger.debug(f"Not modified: {endpoint}")
+        CacheManager.renew(key, entry)
+        return CacheManager.response(entry)
+    if response.status_code == 200:
+        response.from_cache = False
+        response.cache_entry = CacheManager.set(key, response)
+    return response
+
+
 # -------------------- #
 # Variable Manager
 
@@ -113,7 +1333,7 @@ class TokenManager:
         The refresh token used to obtain access tokens.
 
     region : str
-        The geographic region associated with the API endpoint. Defaults to "Americas", with other options being "Europe" and "Asia/Pacific".
+        The geographic region associated with the API endpoint. Defaults to "Americas", with other options being "Europe" and "Asia/Pacific". A server URL such as "http://127.0.0.1:8000" sends requests to that server instead, e.g. a `MockServer`.
 
     Attributes
     ----------
@@ -134,9 +1354,12 @@ class TokenManager:
 
     url_cloud : str or None
         Stores the base URL for the API corresponding to the region.
+
+    session : requests.Session or None
+        Session used for the token request. None uses the shared session.
     """
     # Class attributes
-    def __init__(self, refreshToken, region, fileName):
+    def __init__(self, refreshToken, region, fileName, session=None):
         self.refreshToken = refreshToken
         self.region = region
         self.accessToken = None
@@ -144,29 +1367,42 @@ class TokenManager:
         self.ExpirationStr = None
         self.url_cloud = None
         self.fileName = fileName
+        self.session = session
         self.get_access()
 
-    # Get access token and exp
-    def get_access(self):
-        """Fetches and stores a new access token using the refresh token."""
+    @staticmethod
+    def region_urls(region: str) -> tuple:
+        """Token and cloud URLs of a region."""
         # Set Token Request URL
         url_token = {
             "Americas": "https://cloud.hawkindynamics.com/api/token",
             "Europe": "https://eu.cloud.hawkindynamics.com/api/token",
             "Asia/Pacific": "https://apac.cloud.hawkindynamics.com/api/token"
-        }.get(self.region, "https://cloud.dev.hawkindynamics.com/api/token")
+        }.get(region, "https://cloud.dev.hawkindynamics.com/api/token")
 
         # Set Cloud URL
-        self.url_cloud = {
+        url_cloud = {
             "Americas": "https://cloud.hawkindynamics.com/api/dev",
             "Europe": "https://eu.cloud.hawkindynamics.com/api/dev",
             "Asia/Pacific": "https://apac.cloud.hawkindynamics.com/api/dev"
-        }.get(self.region, "https://cloud.dev.hawkindynamics.com/api/dev")
+        }.get(region, "https://cloud.dev.hawkindynamics.com/api/dev")
+        return url_token, url_cloud
+
+    # Get access token and exp
+    def get_access(self):
+        """Fetches and stores a new access token using the refresh token."""
+        # A server URL (e.g. a local mock server) in place of a region
+        if str(self.region).startswith(("http://", "https://")):
+            base = self.region.rstrip("/")
+            self.url_cloud = f"{base}/api/dev"
+            url_token = f"{base}/api/token"
+        else:
+            url_token, self.url_cloud = self.region_urls(self.region)
 
         # Set auth headers
         headers = {"Authorization": f"Bearer {self.refreshToken}"}
         # Send Token Request
-        response = requests.get(url_token, headers=headers)
+        response = apiRequest("GET", url_token, headers=headers, session=self.session)
 
         # Handle request response
         if response.status_code == 200:  # successful
@@ -189,128 +1425,711 @@ class TokenManager:
             raise ValueError(error_msg)
 
 
+# -------------------- #
+# Token Provider
+
+
+class TokenProvider:
+    """Holds the access token, its expiration and the cloud URL in memory.
+
+    Endpoints ask the provider for a token instead of reading the environment or .env file on every call.
+    A new access token is requested only once the current one has expired, and only then are the values
+    written to the environment or .env file.
+
+    Parameters
+    ----------
+    refreshToken : str or None
+        The refresh token used to obtain access tokens. Without it the provider cannot refresh.
+
+    region : str
+        The region that designates the url prefix.
+
+    method : str
+        Where values are stored on refresh. One of 'env', 'file', 'manual' (stored like 'env'), or None to keep them in memory only.
+
+    fileName : str
+        .env file used with method='file'.
+
+    accessToken : str, optional
+        A current access token, if already known.
+
+    expiration : int, optional
+        Expiration of `accessToken` as a Unix timestamp.
+
+    url_cloud : str, optional
+        Base URL for the API. Set from the region on refresh.
+
+    renewBefore : int, optional
+        If given, renew the access token in the background this many seconds before it expires, at most half
+        the token lifetime before.
+
+    session : requests.Session, optional
+        Session used for token requests. None uses the shared session.
+
+    Attributes
+    ----------
+    accessToken : str or None
+        The current access token.
+
+    ExpirationVal : int or None
+        Expiration of the current access token as a Unix timestamp.
+
+    url_cloud : str or None
+        Base URL for the API corresponding to the region.
+    """
+    def __init__(self, refreshToken, region="Americas", method="env", fileName=None, accessToken=None, expiration=None, url_cloud=None, renewBefore=None, session=None):
+        self.refreshToken = refreshToken
+        self.region = region
+        self.method = method
+        self.fileName = fileName
+        self.accessToken = accessToken
+        self.ExpirationVal = int(expiration) if expiration is not None else None
+        self.url_cloud = url_cloud
+        self.session = session
+        self.renewBefore = None
+        self._issued = None
+        self._lock = threading.Lock()
+        self._timer = None
+        if renewBefore is not None:
+            self.start_renewal(renewBefore)
+
+    def is_valid(self, margin: int = 0) -> bool:
+        """True if an access token is held and does not expire within `margin` seconds."""
+        if self.accessToken is None or self.ExpirationVal is None:
+            return False
+        return int(time.time()) + margin < self.ExpirationVal
+
+    def get_token(self) -> str:
+        """Return a valid access token, refreshing it first if it has expired.
+
+        Only one thread refreshes at a time. Threads arriving during a refresh wait for it and use the
+        new token instead of requesting their own. With `renewBefore` set, a token close to expiring is
+        renewed by one caller while the others keep using the current token.
+        """
+        with phase("token"):
+            return self._get_token()
+
+    def _renewal_margin(self) -> float:
+        # Seconds before expiration a token is due for renewal: renewBefore, capped at half the token lifetime
+        if not self.renewBefore:
+            return 0
+        if self._issued is None or self.ExpirationVal is None:
+            return self.renewBefore
+        return min(self.renewBefore, (self.ExpirationVal - self._issued) / 2)
+
+    def _get_token(self) -> str:
+        margin = self._renewal_margin()
+        if self.is_valid(margin):
+            logger.debug(f"Access Token retrieved. expires {datetime.datetime.fromtimestamp(self.ExpirationVal)}")
+            return self.accessToken
+
+        # Still valid but due for renewal: renew if no one else is, else keep the current token
+        if margin and self.is_valid():
+            if not self._lock.acquire(blocking=False):
+                return self.accessToken
+            try:
+                if not self.is_valid(margin):
+                    self._refresh_or_raise()
+            except Exception as e:
+                logger.warning(f"Early token renewal failed, current token still valid: {e}")
+            finally:
+                self._lock.release()
+            return self.accessToken
+
+        if self.accessToken is None and self.refreshToken is None:
+            logger.error("No Access Token found.")
+            raise Exception("No Access Token found.")
+
+        # Single flight refresh
+        with self._lock:
+            if not self.is_valid():
+                if self.ExpirationVal is not None:
+                    logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(self.ExpirationVal)}")
+                self._refresh_or_raise()
+
+        if not self.is_valid():
+            logger.debug(f"Token Expired: {datetime.datetime.fromtimestamp(self.ExpirationVal)}")
+            raise Exception("Token expired")
+        return self.accessToken
+
+    def _refresh_or_raise(self):
+        # authenticate, with the lock held by the caller
+        try:
+            self._refresh()
+        except ValueError:
+            logger.error("Failed to authenticate. Try AuthManager")
+            raise Exception("Failed to authenticate. Try AuthManager")
+        logger.debug(f"New Access Token valid through: {datetime.datetime.fromtimestamp(self.ExpirationVal)}")
+
+    def refresh(self):
+        """Request a new access token with the refresh token and store it.
+
+        Raises
+        ------
+        ValueError
+            If there is no refresh token, or the token request fails.
+        """
+        with self._lock:
+            self._refresh()
+
+    def _refresh(self):
+        # Request and store a new token, with the lock held by the caller
+        if self.refreshToken is None:
+            logger.error("No refresh token available")
+            raise ValueError("No refresh token available. Authenticate with AuthManager.")
+
+        issued = time.time()
+        session = TokenManager(refreshToken=self.refreshToken, region=self.region, fileName=self.fileName, session=self.session)
+        self._issued = issued
+        self.url_cloud = str(session.url_cloud)
+        self.ExpirationVal = int(session.ExpirationVal)
+        self.accessToken = str(session.accessToken)
+        logger.debug("New ACCESS_TOKEN retrieved")
+        self.persist()
+        self._schedule_renewal()
+
+    def start_renewal(self, renewBefore: int = 60):
+        """Renew the access token in the background `renewBefore` seconds before it expires.
+
+        A token is renewed at most half its lifetime before it expires, by the background timer or by the
+        next `get_token()` call, and the timer never fires sooner than one second after it was scheduled.
+        A `renewBefore` as long as the token lifetime or longer therefore renews each token once, halfway,
+        instead of on every call.
+
+        Parameters
+        ----------
+        renewBefore : int
+            Seconds before expiration to request a new token.
+        """
+        if int(renewBefore) < 0:
+            logger.error("renewBefore must be 0 or greater")
+            raise ValueError("renewBefore must be 0 or greater.")
+        self.renewBefore = int(renewBefore)
+        logger.debug(f"Background token renewal {self.renewBefore}s before expiration")
+        self._schedule_renewal()
+
+    def stop_renewal(self):
+        """Stop background renewal."""
+        self.renewBefore = None
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _schedule_renewal(self, delay: float = None):
+        # (Re)start the renewal timer for the current token
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self.renewBefore is None or self.ExpirationVal is None or self.refreshToken is None:
+            return
+        if delay is None:
+            remaining = self.ExpirationVal - time.time()
+            lead = min(self._renewal_margin(), remaining / 2)
+            if lead < self.renewBefore:
+                logger.debug(f"renewBefore of {self.renewBefore}s is longer than half the token lifetime. Renewing {max(lead, 0):.0f}s before expiration.")
+            delay = max(1.0, remaining - lead)
+        self._timer = threading.Timer(delay, self._background_renew)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _background_renew(self):
+        # Timer callback: renew the token, retrying shortly if the request fails
+        with self._lock:
+            if self.renewBefore is None:
+                return
+            try:
+                self._refresh()
+                logger.debug(f"Access Token renewed in background. Valid through: {datetime.datetime.fromtimestamp(self.ExpirationVal)}")
+            except Exception as e:
+                remaining = (self.ExpirationVal or 0) - time.time()
+                logger.warning(f"Background token renewal failed: {e}")
+                if remaining > 0:
+                    self._schedule_renewal(delay=min(30.0, max(1.0, remaining / 2)))
+
+    def persist(self):
+        """Write the access token, expiration and cloud URL to the environment or .env file."""
+        if self.method is None:
+            return
+
+        values = {
+            "ACCESS_TOKEN": str(self.accessToken),
+            "TOKEN_EXPIRATION": str(self.ExpirationVal),
+            "CLOUD_URL": str(self.url_cloud)
+        }
+        if self.method == 'file':
+            for name, value in values.items():
+                set_key(str(self.fileName), name, value)
+            load_dotenv(str(self.fileName), override=True)
+        else:
+            for name, value in values.items():
+                os.environ[name] = value
+
+        # Environment variable debugging
+        for name, value in values.items():
+            if value == os.getenv(name):
+                logger.debug(f"{name} set")
+            else:
+                logger.debug(f"Error: new {name} not passed")
+
+
+# -------------------- #
+# Client Context
+
+
+def clientContext(client=None):
+    """Return the token provider and session to send a request with.
+
+    Parameters
+    ----------
+    client : HawkinClient, optional
+        Client carrying its own token and session. None uses the authentication set by `AuthManager` and the shared session.
+
+    Returns
+    -------
+    tuple
+        The `TokenProvider` and the `requests.Session` (None for the shared session).
+    """
+    if client is None:
+        return ConfigManager.get_token_provider(), None
+    return client.token_provider, client.session
+
+
 # -------------------- #
 # Response Handler for test calls
 
 
-def responseHandler(json_data):
-    """Parses and arranges the JSON response from the API into a structured Pandas DataFrame.
+def flattenRecord(record: dict) -> dict:
+    """Flatten one nested test record into a single level dictionary.
+
+    Nested keys are joined with '.', top level values come first and nested objects follow in their
+    original order, the same layout as `pandas.json_normalize`. Lists are kept as values.
+    """
+    flat = {}
+    nested = []
+    for key, value in record.items():
+        if isinstance(value, dict):
+            nested.append((key, value))
+        else:
+            flat[key] = value
+    for key, value in nested:
+        _flattenInto(value, key, flat)
+    return flat
+
+
+def _flattenInto(data: dict, prefix: str, flat: dict):
+    # Add nested values to flat with prefixed keys
+    for key, value in data.items():
+        name = f"{prefix}.{key}"
+        if isinstance(value, dict):
+            _flattenInto(value, name, flat)
+        else:
+            flat[name] = value
+
+
+def _testColumnOrder(col: str) -> int:
+    # Custom order to prioritize certain columns
+    if col == 'id':
+        return 0
+    elif col == 'timestamp':
+        return 1
+    elif col.startswith('athlete'):
+        return 2
+    elif col == 'active':
+        return 7
+    elif col.startswith('testType'):
+        return 3
+    elif col.startswith('tag'):
+        return 4
+    elif col == 'segment':
+        return 5
+    else:
+        return 6
+
+
+# Columns kept by a column projection in addition to the requested columns
+KEY_COLUMNS = (
+    'id', 'timestamp', 'segment', 'active', 'athlete.id', 'athlete.name',
+    'testType.id', 'testType.name', 'testType.canonicalId'
+)
+
+
+def columnName(key: str) -> str:
+    """DataFrame column name of a flattened record key, e.g. 'athlete.external.GradYear' to 'external_GradYear'."""
+    return key.replace('.', '_').replace('athlete_external_', 'external_')
+
+
+def recordFilter(includeInactive=True, tagId=None, where=None):
+    """Combine the client-side test filters into one predicate on raw test records.
+
+    Records are checked before they are flattened, so filtered tests never reach a DataFrame.
 
     Parameters
     ----------
-    json_data : dict
-        A dictionary containing nested JSON data.
+    includeInactive : bool, optional
+        If False, only keep records whose 'active' value is True. Records without one are kept. Default is True.
+
+    tagId : str or list of str, optional
+        Only keep records tagged with one of these tag ids. Default is None.
+
+    where : callable, optional
+        Called with each raw (nested) test record, keeping it when the result is true. Default is None.
 
     Returns
     -------
-    pd.DataFrame
-        A DataFrame containing columns for id, name, teams, groups, active, and external,
-        arranged according to a custom-defined order.
+    callable or None
+        Predicate taking a record, or None when nothing is filtered.
 
+    Raises
+    ------
+    ValueError
+        If tagId is not a string or a list/tuple of strings, or where is not callable.
     """
-    # 1 - Create normalized DataFrame
-    dfAll = json_normalize(json_data['data'], errors='ignore')
-        
-
-    # 2 - Remove athlete and testType columns
-    # 2.1 - Generate a list of columns to drop
-    columns_to_drop = [col for col in dfAll.columns if col.startswith('testType') or col.startswith('athlete')]
-
-    # 2.2 - Drop the columns from the DataFrame
-    dfAll.drop(columns=columns_to_drop, inplace=True)
-
-    # 3.1 - Create DataFrame of athlete and testType info
-    infoDF = pd.json_normalize(
-            json_data['data'],
-            meta=[
-                'id',
-                ['athlete', 'id'],
-                ['athlete', 'name'],
-                ['athlete', 'teams'],
-                ['athlete', 'groups'],
-                ['athlete', 'active'],
-                ['testType', 'id'],
-                ['testType', 'name'],
-                ['testType', 'canonicalId']
-            ], errors='ignore'
-        )
-
-    # 4.3 - Create DataFrame of tags column from infoDF
-    tags = pd.DataFrame(infoDF["testType.tags"])
-    
-    # 3.2 - Extract only athlete and testType data
-    selected_columns = infoDF.columns[infoDF.columns.astype(str).str.startswith('athlete') | infoDF.columns.astype(str).str.startswith('testType')]
+    checks = []
+    if not includeInactive:
+        checks.append(lambda record: record.get('active', True) == True)
+    if tagId is not None:
+        if isinstance(tagId, str):
+            tagId = [tagId]
+        if not isinstance(tagId, (list, tuple, set)) or not all(isinstance(t, str) for t in tagId):
+            logger.error("tagId must be a string or a tuple/list of strings.")
+            raise ValueError("tagId must be a string or a tuple/list of strings.")
+        tags = set(tagId)
+        checks.append(lambda record: any(tag.get('id') in tags for tag in (record.get('testType') or {}).get('tags') or []))
+    if where is not None:
+        if not callable(where):
+            logger.error("where must be a callable taking a test record.")
+            raise ValueError("where must be a callable taking a test record.")
+        checks.append(where)
 
-    # 3.3 Narrow down the DataFrame
-    infoDF = infoDF[selected_columns]
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+    return lambda record: all(check(record) for check in checks)
 
-    # 4- Create data frame of tags from testType.tags
-    # 4.1 - Function to extract IDs
-    def extract_ids(tags):
-        return [tag['id'] for tag in tags if 'id' in tag]
 
-    # 4.2 - Function to extract names
-    def extract_names(tags):
-        return [tag['name'] for tag in tags if 'name' in tag]
+class ColumnBuilder:
+    """Collects test records into one list per column.
 
-    # 4.3 - Create DataFrame of tags column from infoDF
-        tags = pd.DataFrame(infoDF["testType.tags"])
+    Each record is flattened a single time and its values appended to its columns. The `testType.tags`
+    list is split into `tag_ids` and `tag_names`. Values missing from a record are NaN. Records can be
+    added in several batches, e.g. one per response, without keeping the raw responses.
 
-    # 4.4 - Apply these functions to create new columns in tags
-    tags['tag_ids'] = tags['testType.tags'].apply(extract_ids)
-    tags['tag_names'] = tags['testType.tags'].apply(extract_names)
+    Parameters
+    ----------
+    columns : iterable of str, optional
+        Only keep these columns, plus the `KEY_COLUMNS` (ids, names, timestamp and active status). Names can be
+        DataFrame column names (e.g. 'athlete_teams') or flattened keys (e.g. 'athlete.teams'). Values of other
+        columns are never collected. Default is None, keeping every column.
 
-    # 4.5 - Drop the original column from the tags DataFrame
-    tags = tags.drop(columns="testType.tags", axis=1)
+    where : callable, optional
+        Predicate on raw test records, e.g. from `recordFilter`. Records it rejects are skipped before they are
+        flattened. Default is None, adding every record.
 
-    # 5 - Remove testType.tags from infoDF DataFrame
-    infoDF = infoDF.drop(columns="testType.tags", axis=1)
+    Attributes
+    ----------
+    rows : int
+        Number of records added.
 
-    # 6 - Join New DataFrames together
-    df = dfAll.join(infoDF).join(tags)
+    skipped : int
+        Number of records rejected by `where`.
+    """
+    def __init__(self, columns=None, where=None):
+        self.rows = 0
+        self.skipped = 0
+        self._where = where
+        self._columns = {}
+        self._tag_ids = []
+        self._tag_names = []
+        self._wanted = None
+        self._tags = True
+        if columns is not None:
+            self._wanted = set(columns) | set(KEY_COLUMNS)
+            self._tags = bool({'tag_ids', 'tag_names', 'testType.tags'} & self._wanted)
+            # Keep decision by flattened key, and kept top level keys by record layout, filled as first seen
+            self._keep = {}
+            self._plans = {}
 
-    # 7 - change "." to "_" in column names
-    df.columns = [col.replace('.', '_') for col in df.columns]
+    def _kept(self, key: str) -> bool:
+        keep = self._keep.get(key)
+        if keep is None:
+            keep = self._keep[key] = key in self._wanted or columnName(key) in self._wanted
+        return keep
 
-    # 8 - List all columns from the DataFrame
-    columns = df.columns.tolist()
+    def _project(self, record: dict) -> dict:
+        # Flatten only the kept values of a record. Records of a test type share their keys, so the kept
+        # keys are worked out once per layout and the other values are never visited.
+        layout = tuple(record)
+        plan = self._plans.get(layout)
+        if plan is None:
+            scalars = [key for key in layout if not isinstance(record[key], dict) and self._kept(key)]
+            nested = [key for key in layout if isinstance(record[key], dict)]
+            plan = self._plans[layout] = (scalars, nested)
+        scalars, nested = plan
+        flat = {key: record[key] for key in scalars}
+        for key in nested:
+            value = record[key]
+            if not isinstance(value, dict):
+                if self._kept(key):
+                    flat[key] = value
+                continue
+            values = {}
+            _flattenInto(value, key, values)
+            for name, item in values.items():
+                if name == 'testType.tags' or self._kept(name):
+                    flat[name] = item
+        return flat
 
-    # 9 - Custom order function to prioritize certain columns
-    def custom_order(col):
-        if col == 'id':
-            return 0
-        elif col == 'timestamp':
-            return 1
-        elif col.startswith('athlete'):
-            return 2
-        elif col == 'active':
-            return 7
-        elif col.startswith('testType'):
-            return 3
-        elif col.startswith('tag'):
-            return 4
-        elif col == 'segment':
-            return 5
-        else:
-            return 6
+    def add(self, record: dict):
+        """Add one test record, unless rejected by `where`."""
+        if self._where is not None and not self._where(record):
+            self.skipped += 1
+            return
+        columns = self._columns
+        n = self.rows
+        flat = flattenRecord(record) if self._wanted is None else self._project(record)
+        tags = flat.pop('testType.tags', None) or []
+        for key, value in flat.items():
+            col = columns.get(key)
+            if col is None:
+                col = columns[key] = [float('nan')] * n
+            col.append(value)
+        n = self.rows = n + 1
+        # Pad columns missing from this record
+        if len(flat) != len(columns):
+            for col in columns.values():
+                if len(col) < n:
+                    col.append(float('nan'))
+        if self._tags:
+            self._tag_ids.append([tag['id'] for tag in tags if 'id' in tag])
+            self._tag_names.append([tag['name'] for tag in tags if 'name' in tag])
 
-    # 10 - Sort columns based on custom order
-    sorted_columns = sorted(columns, key=custom_order)
+    def extend(self, records):
+        """Add an iterable of test records."""
+        with phase("parse"):
+            for record in records:
+                self.add(record)
+        return self
 
-    # 11 - Rearrange DataFrame using sorted column names
-    df = df[sorted_columns]
+    def columns(self) -> dict:
+        """Column name (with '.' separators) to list of values, in order of first appearance."""
+        if not self.rows:
+            return {}
+        columns = dict(self._columns)
+        for name, values in (('tag_ids', self._tag_ids), ('tag_names', self._tag_names)):
+            if self._wanted is None or name in self._wanted or 'testType.tags' in self._wanted:
+                columns[name] = values
+        return columns
 
-    # 12 - change "athlete_external_" to "external_" in column names
-    df.columns = [col.replace('athlete_external_', 'external_') for col in df.columns]
+    def frame(self, compact: bool = False) -> "pd.DataFrame":
+        """Arrange the collected columns into a test DataFrame, with `compactFrame` dtypes if `compact` is True."""
+        with phase("parse"):
+            return columnsFrame(self.columns(), compact)
 
-    return df
+
+def recordColumns(records, columns=None, where=None) -> dict:
+    """Flatten test records once into columns.
+
+    Parameters
+    ----------
+    records : iterable of dict
+        Test records, as found in the 'data' list of a tests response.
+
+    columns : iterable of str, optional
+        Only keep these columns and the `KEY_COLUMNS`, as in `ColumnBuilder`. Default is None (every column).
+
+    where : callable, optional
+        Only keep records for which this predicate is true, as in `ColumnBuilder`. Default is None (every record).
+
+    Returns
+    -------
+    dict
+        Column name (with '.' separators) to list of values, in order of first appearance.
+    """
+    return ColumnBuilder(columns, where).extend(records).columns()
+
+
+def _orderedColumns(columns: dict) -> list:
+    # Flattened keys in the column order of the test DataFrames
+    # Metric and test columns first, then athlete and test type info, then tags
+    names = list(columns)
+    info = [col for col in names if col.startswith('athlete') or col.startswith('testType')]
+    tags = [col for col in ('tag_ids', 'tag_names') if col in columns]
+    rest = [col for col in names if col not in tags and not (col.startswith('athlete') or col.startswith('testType'))]
+    ordered = rest + info + tags
+
+    # change "." to "_" in column names and sort based on custom order
+    renamed = [col.replace('.', '_') for col in ordered]
+    order = sorted(range(len(ordered)), key=lambda i: _testColumnOrder(renamed[i]))
+    return [ordered[i] for i in order]
+
+
+def columnsFrame(columns: dict, compact: bool = False) -> "pd.DataFrame":
+    """Arrange flattened test columns into the DataFrame layout returned by the test functions, with `compactFrame` dtypes if `compact` is True."""
+    import pandas as pd
+    ordered = _orderedColumns(columns)
+    df = pd.DataFrame({i: columns[key] for i, key in enumerate(ordered)})
+    # change "athlete_external_" to "external_" in column names
+    df.columns = [columnName(key) for key in ordered]
+    return compactFrame(df) if compact else df
+
+
+def dropDuplicateTests(columns: dict) -> dict:
+    """Keep the last row of each test id in flattened test columns, as `drop_duplicates(subset='id', keep='last')`."""
+    ids = columns.get('id') or []
+    last = {}
+    for i, tid in enumerate(ids):
+        last[tid] = i
+    if len(last) == len(ids):
+        return columns
+    rows = sorted(last.values())
+    return {key: [values[i] for i in rows] for key, values in columns.items()}
+
+
+def emptyTestColumns(columns=None) -> dict:
+    """Flattened test columns without rows: the `KEY_COLUMNS` and the requested `columns`, for queries where every test is filtered out."""
+    empty = {key: [] for key in KEY_COLUMNS}
+    built = {columnName(key) for key in empty}
+    for name in columns or ():
+        if columnName(name) not in built:
+            empty[name] = []
+            built.add(columnName(name))
+    return empty
+
+
+def compactFrame(df: "pd.DataFrame") -> "pd.DataFrame":
+    """Convert a test DataFrame to memory-efficient dtypes.
+
+    - `timestamp` to UTC `datetime64`, in one vectorized conversion
+    - float metrics to float32 (about 7 significant digits, more than the API reports)
+    - integer columns to the smallest integer type, or nullable `Int64` when values are missing
+    - true/false columns with missing values to nullable `boolean`
+    - string columns with repeated values (athlete and test type names and ids, segments, ...) to `category`
+
+    Lists (teams, groups, tags) and the test `id` are kept as they are. DataFrame attributes are kept.
+    """
+    import pandas as pd
+    from pandas.api.types import infer_dtype
+    converted = {}
+    for i, col in enumerate(df.columns):
+        values = df.iloc[:, i]
+        if col == 'timestamp':
+            values = pd.to_datetime(values, unit='s', utc=True)
+        elif values.dtype == 'float64':
+            values = values.astype('float32')
+        elif values.dtype == 'int64':
+            values = pd.to_numeric(values, downcast='integer')
+        elif values.dtype != bool:
+            kind = infer_dtype(values, skipna=True)
+            if kind == 'boolean':
+                values = values.astype('boolean')
+            elif kind == 'integer':
+                values = values.astype('Int64')
+            elif kind == 'string' and col != 'id' and values.nunique() <= len(values.index) // 2:
+                values = values.astype('category')
+        converted[i] = values
+    compact = pd.DataFrame(converted, index=df.index)
+    compact.columns = df.columns
+    compact.attrs = dict(df.attrs)
+    return compact
+
+
+# -------------------- #
+# Output Formats
+
+# Result types of the test and force-time functions, and the packages they need
+OUTPUTS = {"pandas": (), "arrow": ("pyarrow",), "polars": ("pyarrow", "polars")}
+
+
+def checkOutput(output: str, compact: bool = False):
+    """Check an `output` argument and that the packages it needs are installed.
+
+    Raises
+    ------
+    ValueError
+        If output is not "pandas", "arrow" or "polars", or compact is used with another output than "pandas".
+    ImportError
+        If pyarrow (or polars) is not installed.
+    """
+    if output not in OUTPUTS:
+        logger.error(f"output must be one of {list(OUTPUTS)}, not {output!r}")
+        raise ValueError(f"output must be one of {list(OUTPUTS)}, not {output!r}.")
+    if compact and output != "pandas":
+        logger.error("compact is only available with output='pandas'")
+        raise ValueError("compact is only available with output='pandas'.")
+    import importlib.util
+    for module in OUTPUTS[output]:
+        if importlib.util.find_spec(module) is None:
+            logger.error(f"output='{output}' requires {module}. Install it with: pip install hdforce[{output}]")
+            raise ImportError(f"output='{output}' requires {module}. Install it with: pip install hdforce[{output}]")
+
+
+def tableOutput(columns: dict, output: str = "arrow", attrs: dict = None):
+    """Build a `pyarrow.Table`, or a `polars.DataFrame` from it, straight from column name to values.
+
+    Values can be lists or NumPy arrays, so no pandas objects are made on the way. NaN is stored as null.
+    A column of values Arrow cannot type together (e.g. numbers and text) is stored as text. `attrs` are
+    kept as JSON encoded schema metadata of the table; polars DataFrames have no metadata.
+    """
+    import pyarrow as pa
+    arrays = {}
+    for name, values in columns.items():
+        try:
+            arrays[name] = pa.array(values, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays[name] = pa.array([None if v is None or v != v else str(v) for v in values], type=pa.string())
+    table = pa.table(arrays)
+    if attrs:
+        table = table.replace_schema_metadata({str(k): json.dumps(v, default=str) for k, v in attrs.items()})
+    if output == "polars":
+        import polars as pl
+        return pl.from_arrow(table)
+    return table
+
+
+def testsOutput(columns: dict, output: str = "pandas", compact: bool = False, attrs: dict = None):
+    """Flattened test columns as a test DataFrame (`columnsFrame`), `pyarrow.Table` or `polars.DataFrame`, with attributes."""
+    if output == "pandas":
+        df = columnsFrame(columns, compact)
+        df.attrs.update(attrs or {})
+        return df
+    return tableOutput({columnName(key): columns[key] for key in _orderedColumns(columns)}, output, attrs)
+
+
+def responseHandler(json_data, columns=None, where=None, compact=False):
+    """Parses and arranges the JSON response from the API into a structured Pandas DataFrame.
+
+    Parameters
+    ----------
+    json_data : dict
+        A dictionary containing nested JSON data.
+
+    columns : iterable of str, optional
+        Only build these columns and the `KEY_COLUMNS`. Default is None (every column).
+
+    where : callable, optional
+        Only build rows for records for which this predicate is true, e.g. from `recordFilter`. Default is None (every record).
+
+    compact : bool, optional
+        Use the memory-efficient dtypes of `compactFrame`. Default is False.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing columns for id, name, teams, groups, active, and external,
+        arranged according to a custom-defined order. If `where` rejects every record, the DataFrame has
+        no rows but keeps the `KEY_COLUMNS` and `columns`.
+
+    """
+    with phase("parse"):
+        tests = recordColumns(json_data['data'], columns, where)
+        return columnsFrame(tests or emptyTestColumns(columns), compact)
 
 
 # -------------------- #
 # Deprecation Decorator
 
 import warnings
-import functools
 
 def deprecated(reason):
     """
@@ -0,0 +1,134 @@
+import pytest
+import json
+import requests
+from unittest.mock import patch, MagicMock
+from hdforce.utils import CacheManager
+from hdforce.GetTeams import GetTeams
+
+# Mocked provider of one organization
+def mock_context(client=None):
+    return (MagicMock(refreshToken="org_cache", url_cloud="https://cloud.hawkindynamics.com/api/dev", get_token=lambda: "token"), None)
+
+# Mocked teams response
+def mock_teams(method, url, **kwargs):
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = json.dumps({"data": [{"id": "team_1", "name": "Team One"}]}).encode()
+    return response
+
+# Default settings and empty cache for each test
+default_ttl = dict(CacheManager.ttl)
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    CacheManager.configure(ttl=default_ttl)
+    CacheManager.invalidate()
+    yield
+    CacheManager.configure(ttl=default_ttl)
+    CacheManager.invalidate()
+
+# repeated calls answered from cache until invalidated
+@patch('hdforce.GetTeams.clientContext', side_effect=mock_context)
+@patch('hdforce.utils.apiRequest', side_effect=mock_teams)
+def test_CacheManager_teams(mock_request, mock_ctx):
+    first = GetTeams()
+    second = GetTeams()
+
+    # Check one request made, same result
+    assert mock_request.call_count == 1
+    assert second['name'][0] == first['name'][0] == "Team One"
+
+    # Check request made again after invalidation
+    CacheManager.invalidate("teams")
+    GetTeams()
+    assert mock_request.call_count == 2
+
+# expired entries and disabled endpoints are requested again
+@patch('hdforce.GetTeams.clientContext', side_effect=mock_context)
+@patch('hdforce.utils.apiRequest', side_effect=mock_teams)
+def test_CacheManager_ttl(mock_request, mock_ctx):
+    CacheManager.configure(ttl={"teams": 0})
+    GetTeams()
+    GetTeams()
+    assert mock_request.call_count == 2
+
+    with pytest.raises(ValueError):
+        CacheManager.configure(ttl={"tests": 60})
+
+# entries reused from disk by a new process
+@patch('hdforce.GetTeams.clientContext', side_effect=mock_context)
+@patch('hdforce.utils.apiRequest', side_effect=mock_teams)
+def test_CacheManager_disk(mock_request, mock_ctx, tmp_path):
+    CacheManager.configure(path=str(tmp_path))
+    GetTeams()
+
+    # Check memory entries cleared, disk entry used
+    CacheManager._entries.clear()
+    df = GetTeams()
+    assert mock_request.call_count == 1
+    assert df['id'][0] == "team_1"
+    assert len(list(tmp_path.iterdir())) == 1
+
+# Mocked metrics response with an ETag, 304 when the ETag is sent back
+def mock_metrics(method, url, **kwargs):
+    response = requests.Response()
+    response.url = url
+    if kwargs['headers'].get("If-None-Match") == '"v1"':
+        response.status_code = 304
+        response._content = b""
+        return response
+    response.status_code = 200
+    response.headers["ETag"] = '"v1"'
+    response._content = json.dumps([
+        {"canonicalTestTypeId": "7nNduHeM5zETPjHxvm7s", "testTypeName": "Countermovement Jump",
+         "metrics": [{"id": "jump_height_m", "label": "Jump Height", "units": "m", "description": ""}]}
+    ]).encode()
+    return response
+
+# expired entries revalidated, 304 reuses the parsed DataFrame
+@patch('hdforce.GetMetrics.clientContext', side_effect=mock_context)
+@patch('hdforce.utils.apiRequest', side_effect=mock_metrics)
+def test_CacheManager_conditional(mock_request, mock_ctx):
+    from hdforce.GetMetrics import GetMetrics
+    CacheManager.configure(ttl={"metrics": 60})
+    first = GetMetrics()
+
+    # Expire the entry
+    for entry in CacheManager._entries.values():
+        entry["expires"] = 0
+
+    with patch('hdforce.GetMetrics.pd.json_normalize') as mock_normalize:
+        second = GetMetrics()
+        # Check metrics not parsed again
+        mock_normalize.assert_not_called()
+
+    # Check conditional request sent and same DataFrame returned
+    assert mock_request.call_count == 2
+    assert mock_request.call_args.kwargs['headers']['If-None-Match'] == '"v1"'
+    assert second.equals(first)
+    assert second.attrs['Count'] == 1
+
+# athletes not cached by default, invalidation limited to one organization
+def test_CacheManager_athletes_org(tmp_path):
+    from hdforce.GetAthletes import GetAthletes
+    assert CacheManager.ttl["athletes"] == 0
+    CacheManager.configure(ttl={"athletes": 60}, path=str(tmp_path))
+
+    org_a = MagicMock(refreshToken="org_a", url_cloud="https://cloud.hawkindynamics.com/api/dev", get_token=lambda: "token")
+    org_b = MagicMock(refreshToken="org_b", url_cloud="https://cloud.hawkindynamics.com/api/dev", get_token=lambda: "token")
+    with patch('hdforce.utils.apiRequest', side_effect=mock_teams) as mock_request:
+        for org in (org_a, org_b):
+            with patch('hdforce.GetAthletes.clientContext', return_value=(org, None)):
+                GetAthletes()
+        assert mock_request.call_count == 2
+        assert len(list(tmp_path.iterdir())) == 2
+
+        # Check only the entry of org_a removed
+        CacheManager.invalidate("athletes", org_a)
+        assert [key[1] for key in CacheManager._entries] == [CacheManager.org(org_b)]
+        assert [f.name.split("-")[1] for f in tmp_path.iterdir()] == [CacheManager.org(org_b)]
+        for org in (org_a, org_b):
+            with patch('hdforce.GetAthletes.clientContext', return_value=(org, None)):
+                GetAthletes()
+        assert mock_request.call_count == 3
@@ -20,7 +20,7 @@ def mock_failure_response(formatted_time):
     }
 
 # Successful call with file
-@patch('hdforce.CreateAthletes.requests.post')
+@patch('hdforce.CreateAthletes.apiRequest')
 def test_CreateAthletes_file(mock_post):
     # Get the current time
     current_time = datetime.now()
@@ -55,7 +55,7 @@ def test_CreateAthletes_file(mock_post):
     assert len(response['failures']) == 0
 
 # Successful call with env
-@patch('hdforce.CreateAthletes.requests.post')
+@patch('hdforce.CreateAthletes.apiRequest')
 def test_CreateAthletes_env(mock_post):
     # Get the current time
     current_time = datetime.now()
@@ -90,7 +90,7 @@ def test_CreateAthletes_env(mock_post):
     assert len(response['failures']) == 0
 
 # Test for failure response
-@patch('hdforce.CreateAthletes.requests.post')
+@patch('hdforce.CreateAthletes.apiRequest')
 def test_CreateAthletes_failure(mock_post):
     # Get the current time
     current_time = datetime.now()
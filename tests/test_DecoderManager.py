@@ -0,0 +1,44 @@
+import json
+import numpy as np
+import pytest
+import requests
+from hdforce.utils import DecoderManager, responseJson, numericArray
+
+@pytest.fixture(autouse=True)
+def reset_decoder():
+    yield
+    DecoderManager.configure()
+
+def make_response(data):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(data).encode("utf-8")
+    response.encoding = "utf-8"
+    return response
+
+# every decoder returns the same data
+def test_DecoderManager_decoders():
+    data = {"data": [{"id": "a", "value": 1.5, "tags": [], "name": "Zoë"}], "count": 1}
+    DecoderManager.configure("json")
+    assert DecoderManager.name() == "json"
+    assert responseJson(make_response(data)) == data
+
+    DecoderManager.configure(lambda body: json.loads(body.decode("utf-8")))
+    assert responseJson(make_response(data)) == data
+
+    pytest.importorskip("orjson")
+    DecoderManager.configure("auto")
+    assert DecoderManager.name() == "orjson"
+    assert responseJson(make_response(data)) == data
+
+    with pytest.raises(ValueError):
+        DecoderManager.configure("yaml")
+
+# lists of numbers become arrays, nulls become NaN
+def test_responseJson_arrays():
+    data = {"Time(s)": [0.001, 0.002], "LeftForce(N)": [42, None], "rsi": 0.4, "names": ["a", "b"]}
+    decoded = responseJson(make_response(data), arrays=("Time(s)", "LeftForce(N)", "names", "missing"))
+    assert isinstance(decoded["Time(s)"], np.ndarray) and decoded["Time(s)"].dtype == np.float64
+    assert np.isnan(decoded["LeftForce(N)"][1])
+    assert decoded["names"] == ["a", "b"] and decoded["rsi"] == 0.4
+    assert numericArray([1, 2]).dtype.kind == "i"
@@ -0,0 +1,75 @@
+import pytest
+import numpy as np
+import pandas as pd
+from unittest.mock import patch, MagicMock
+from hdforce.ForceTimeArchive import ForceTimeArchive
+from hdforce.ForceTimeTrace import ForceTimeTrace
+from hdforce.GetForceTime import GetForceTime
+
+# Mocked force-time response at 1000 Hz
+def mock_forcetime_response(testId="test_1", n=1000):
+    return {
+        "id": testId, "timestamp": 1690859091, "rsi": 0.52,
+        "testType": {"id": "7nNduHeM5zETPjHxvm7s", "name": "Countermovement Jump"},
+        "athlete": {"id": "ath_1", "name": "Athlete One"},
+        "Time(s)": [round((i + 1) / 1000, 3) for i in range(n)],
+        "LeftForce(N)": [350.0 + i % 7 for i in range(n)],
+        "RightForce(N)": [351.0 + i % 5 for i in range(n)],
+        "CombinedForce(N)": [701.0 + i % 7 + i % 5 for i in range(n)],
+        "Velocity(m/s)": [0.001 * i for i in range(n)],
+        "Displacement(m)": [0.0001 * i for i in range(n)],
+        "Power(W)": [0.7 * i for i in range(n)]
+    }
+
+# traces read back memory-mapped and unchanged
+def test_ForceTimeArchive_roundtrip(tmp_path):
+    archive = ForceTimeArchive(str(tmp_path))
+    trace = ForceTimeTrace(mock_forcetime_response())
+    archive.put(trace)
+
+    stored = archive.get("test_1")
+    assert isinstance(stored.combined_force, np.memmap)
+    assert "test_1" in archive
+    pd.testing.assert_frame_equal(stored.to_frame(), trace.to_frame())
+    assert stored.to_frame().attrs == trace.to_frame().attrs
+
+    # Check archive found again when reopened
+    assert len(ForceTimeArchive(str(tmp_path))) == 1
+    assert archive.get("test_2") is None
+
+# least recently used traces removed past the size limit
+def test_ForceTimeArchive_lru(tmp_path):
+    archive = ForceTimeArchive(str(tmp_path))
+    archive.put(ForceTimeTrace(mock_forcetime_response("test_1")))
+    size = archive.nbytes
+
+    archive = ForceTimeArchive(str(tmp_path), maxBytes=int(size * 2.5))
+    archive.put(ForceTimeTrace(mock_forcetime_response("test_2")))
+    archive.get("test_1")
+    archive.put(ForceTimeTrace(mock_forcetime_response("test_3")))
+
+    # Check test_2 was least recently used
+    assert "test_1" in archive and "test_3" in archive
+    assert "test_2" not in archive
+    assert archive.nbytes <= size * 2.5
+
+# GetForceTime reads the archive before requesting
+@patch('hdforce.GetForceTime.clientContext', return_value=(MagicMock(url_cloud="https://cloud.hawkindynamics.com/api/dev", get_token=lambda: "token"), None))
+@patch('hdforce.GetForceTime.apiRequest', return_value=MagicMock(status_code=200, json=mock_forcetime_response))
+def test_GetForceTime_archive(mock_request, mock_context, tmp_path):
+    archive = ForceTimeArchive(str(tmp_path))
+
+    first = GetForceTime("test_1", archive=archive)
+    second = GetForceTime("test_1", archive=archive)
+    trace = GetForceTime("test_1", asTrace=True, archive=archive)
+
+    # Check one request made
+    assert mock_request.call_count == 1
+    assert isinstance(first, pd.DataFrame)
+    assert np.allclose(first["CombinedForce(N)"], second["CombinedForce(N)"])
+    assert trace.sample_rate == 1000
+
+# invalid test id
+def test_ForceTimeArchive_invalid(tmp_path):
+    with pytest.raises(ValueError):
+        ForceTimeArchive(str(tmp_path)).get("../test_1")
@@ -0,0 +1,76 @@
+import pytest
+import numpy as np
+import pandas as pd
+from hdforce.ForceTimeTrace import ForceTimeTrace
+
+# Mocked force-time response at 1000 Hz
+def mock_forcetime_response(n=2500):
+    return {
+        "id": "test_1", "timestamp": 1690859091, "rsi": 0.52,
+        "testType": {"id": "7nNduHeM5zETPjHxvm7s", "name": "Countermovement Jump"},
+        "athlete": {"id": "ath_1", "name": "Athlete One"},
+        "Time(s)": [round((i + 1) / 1000, 3) for i in range(n)],
+        "LeftForce(N)": [350.0 + i % 7 for i in range(n)],
+        "RightForce(N)": [351.0 + i % 5 for i in range(n)],
+        "CombinedForce(N)": [701.0 + i % 7 + i % 5 for i in range(n)],
+        "Velocity(m/s)": [0.001 * i for i in range(n)],
+        "Displacement(m)": [None] + [0.0001 * i for i in range(1, n)],
+        "Power(W)": [0.7 * i for i in range(n)]
+    }
+
+# same DataFrame as GetForceTime
+def test_ForceTimeTrace_to_frame():
+    data = mock_forcetime_response()
+    trace = ForceTimeTrace(data)
+    df = trace.to_frame()
+
+    # Check time stored as a sample rate
+    assert trace.sample_rate == 1000
+    assert trace.start == 1
+    assert len(trace) == 2500
+
+    # Check frame matches the GetForceTime layout
+    expected = pd.DataFrame({
+        "Time(s)": data["Time(s)"],
+        "LeftForce(N)": data["LeftForce(N)"],
+        "RightForce(N)": data["RightForce(N)"],
+        "CombinedForce(N)": data["CombinedForce(N)"],
+        "Velocity(m/s)": data["Velocity(m/s)"],
+        "Displacement(m)": [np.nan] + data["Displacement(m)"][1:],
+        "Power(W)": data["Power(W)"],
+        "rsi": [data["rsi"]] * 2500
+    })
+    pd.testing.assert_frame_equal(df, expected)
+    assert np.array_equal(trace.time, data["Time(s)"])
+    assert df.attrs['Test ID'] == "test_1"
+    assert df.attrs['RSI'] == 0.52
+
+# float32 arrays
+def test_ForceTimeTrace_float32():
+    trace = ForceTimeTrace(mock_forcetime_response(), dtype="float32")
+
+    assert trace.combined_force.dtype == np.float32
+    assert trace.combined_force.flags['C_CONTIGUOUS']
+    assert trace.nbytes == 6 * 2500 * 4
+
+# uneven sampling keeps the time array
+def test_ForceTimeTrace_uneven():
+    data = mock_forcetime_response(n=4)
+    data["Time(s)"] = [0.0, 0.001, 0.005, 0.006]
+    trace = ForceTimeTrace(data)
+
+    assert trace.sample_rate is None
+    assert list(trace.time) == data["Time(s)"]
+
+    # one sample off the grid by less than a quarter sample
+    data = mock_forcetime_response(n=200)
+    data["Time(s)"][100] = 0.1012
+    trace = ForceTimeTrace(data)
+    assert trace.sample_rate is None
+    assert trace.time[100] == 0.1012
+    assert trace.to_frame()["Time(s)"][100] == 0.1012
+
+# invalid dtype
+def test_ForceTimeTrace_invalid():
+    with pytest.raises(ValueError):
+        ForceTimeTrace(mock_forcetime_response(), dtype="int32")
@@ -0,0 +1,42 @@
+import pytest
+import pandas as pd
+from unittest.mock import patch
+from hdforce.GetForceTimeBulk import GetForceTimeBulk
+
+# Mocked GetForceTime, failing for one test id
+def mock_GetForceTime(testId, archive=None, client=None):
+    if testId == "bad_id":
+        raise Exception("Error 404: Not Found")
+    df = pd.DataFrame({"Time(s)": [0.001, 0.002], "CombinedForce(N)": [700.0, 701.0]})
+    df.attrs['Test ID'] = testId
+    return df
+
+# successful call with one failure
+@patch('hdforce.GetForceTimeBulk.GetForceTime', side_effect=mock_GetForceTime)
+def test_GetForceTimeBulk(mock_ft):
+    response = GetForceTimeBulk(testIds=["id_1", "bad_id", "id_2", "id_1"], max_workers=4)
+
+    # Check data returned in order, duplicates fetched once
+    assert list(response['data'].keys()) == ["id_1", "id_2"]
+    assert isinstance(response['data']['id_1'], pd.DataFrame)
+    assert mock_ft.call_count == 3
+
+    # Check failure recorded
+    assert list(response['failures'].keys()) == ["bad_id"]
+
+# long format
+@patch('hdforce.GetForceTimeBulk.GetForceTime', side_effect=mock_GetForceTime)
+def test_GetForceTimeBulk_long(mock_ft):
+    response = GetForceTimeBulk(testIds=["id_1", "id_2"], longFormat=True)
+
+    # Check single DataFrame keyed by test id
+    df = response['data']
+    assert isinstance(df, pd.DataFrame)
+    assert df.columns[0] == "testId"
+    assert len(df.index) == 4
+    assert df.attrs['Count'] == 2
+
+# invalid input
+def test_GetForceTimeBulk_invalid():
+    with pytest.raises(ValueError):
+        GetForceTimeBulk(testIds="id_1")
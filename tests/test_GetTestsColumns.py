@@ -0,0 +1,35 @@
+import pytest
+import pandas as pd
+from hdforce.utils import responseHandler, KEY_COLUMNS, columnName
+from hdforce.MockServer import MockServer, MockData
+from hdforce.HawkinClient import HawkinClient
+
+@pytest.fixture(scope="module")
+def client():
+    with MockServer(trials=300) as server:
+        with HawkinClient(refreshToken="mock", region=server.url) as client:
+            yield client
+
+# projected columns have the same values as the full frame
+def test_responseHandler_columns():
+    data = {"data": MockData(trials=200).tests}
+    full = responseHandler(data)
+    df = responseHandler(data, ["Jump Height(m)", "athlete_teams", "tag_names"])
+    kept = [columnName(key) for key in KEY_COLUMNS] + ["Jump Height(m)", "athlete_teams", "tag_names"]
+    assert set(df.columns) == set(kept)
+    assert list(df.columns) == [col for col in full.columns if col in kept]
+    pd.testing.assert_frame_equal(df, full[df.columns])
+
+# metric ids and labels resolve to metric columns
+def test_GetTests_columns(client):
+    df = client.GetTests(columns=["jumpHeight", "Peak Propulsive Force(N)"])
+    assert "Jump Height(m)" in df.columns
+    assert "Peak Propulsive Force(N)" in df.columns
+    assert "System Weight(N)" not in df.columns and "tag_ids" not in df.columns
+    assert len(df.index) == len(client.GetTests().index)
+
+    chunks = list(client.IterTests(columns=["mrsi"], chunkSize=100))
+    assert all("mRSI" in chunk.columns and "Jump Height(m)" not in chunk.columns for chunk in chunks)
+
+    with pytest.raises(ValueError):
+        client.GetTests(columns=[1, 2])
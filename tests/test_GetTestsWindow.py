@@ -0,0 +1,57 @@
+import pytest
+import pandas as pd
+from unittest.mock import patch
+from hdforce.GetTests import GetTests, fetchTestWindows
+
+# Mocked tests request, one test every 10 seconds from 0 to 1000
+def mock_fetchTests(query, client=None):
+    lo, hi = query['from'], query['to']
+    # Window bounds are inclusive, so edge tests are returned twice
+    data = [
+        {
+            'id': f"test_{t}", 'timestamp': t, 'segment': 'Countermovement Jump:1',
+            'testType': {'id': '7nNduHeM5zETPjHxvm7s', 'name': 'Countermovement Jump', 'canonicalId': '7nNduHeM5zETPjHxvm7s', 'tags': []},
+            'athlete': {'id': 'ath_1', 'name': 'Athlete One', 'teams': [], 'groups': [], 'active': True, 'external': {}},
+            'active': True, 'Jump Height(m)': 0.4
+        }
+        for t in range(0, 1001, 10) if lo <= t <= hi
+    ]
+    last = max([d['timestamp'] for d in data], default=0)
+    return {'data': data, 'count': len(data), 'lastSyncTime': last, 'lastTestTime': last}
+
+# windowed call matches a single request
+@patch('hdforce.GetTests.fetchTests', side_effect=mock_fetchTests)
+def test_GetTests_window(mock_fetch):
+    response = GetTests(from_=0, to_=1000, window=100, windowTarget=20, max_workers=2)
+
+    # Check tests returned once each, in time order
+    assert isinstance(response, pd.DataFrame)
+    assert list(response['id']) == [f"test_{t}" for t in range(0, 1001, 10)]
+    assert response.attrs['Count'] == 101
+    assert response.attrs['Rows'] == 101
+    assert response.attrs['Last Test Time'] == 1000
+
+    # Check windows cover the range
+    windows = response.attrs['Windows']
+    assert windows[0][0] == 0
+    assert windows[-1][1] == 1000
+    assert all(a[1] == b[0] for a, b in zip(windows, windows[1:]))
+
+# windows adapt to density
+@patch('hdforce.GetTests.fetchTests', side_effect=mock_fetchTests)
+def test_fetchTestWindows_adapt(mock_fetch):
+    # 1 test per 10 seconds with a target of 5 tests: windows shrink towards 50 seconds
+    windows = [(lo, hi) for lo, hi, _ in fetchTestWindows({}, 0, 1000, 400, windowTarget=5, max_workers=1)]
+    assert windows[0] == (0, 400)
+    assert windows[1][1] - windows[1][0] < 400
+
+# failed window named in error
+@patch('hdforce.GetTests.fetchTests', side_effect=Exception("Error 500: Internal Server Error"))
+def test_GetTests_window_error(mock_fetch):
+    with pytest.raises(Exception, match="from_=0"):
+        GetTests(from_=0, to_=1000, window=100, max_workers=1)
+
+# invalid window
+def test_GetTests_window_invalid():
+    with pytest.raises(ValueError):
+        list(fetchTestWindows({}, 0, 1000, 0))
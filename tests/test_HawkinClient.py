@@ -0,0 +1,45 @@
+import pytest
+import os
+import time
+import pandas as pd
+from unittest.mock import patch, MagicMock
+from hdforce.HawkinClient import HawkinClient
+
+# Mocked TokenManager, one access token per refresh token and region
+def mock_TokenManager(refreshToken, region, fileName, session=None):
+    url = {"Americas": "https://cloud.hawkindynamics.com/api/dev", "Europe": "https://eu.cloud.hawkindynamics.com/api/dev"}[region]
+    return MagicMock(accessToken=f"access_{refreshToken}", ExpirationVal=int(time.time()) + 3600, url_cloud=url)
+
+# Mocked teams response
+def mock_teams(method, url, **kwargs):
+    token = kwargs['headers']['Authorization']
+    return MagicMock(status_code=200, json=lambda: {"data": [{"id": "team_1", "name": f"{token} {url}"}]})
+
+# clients keep separate tokens, URLs and sessions
+@patch('hdforce.utils.TokenManager', side_effect=mock_TokenManager)
+def test_HawkinClient_orgs(mock_tm):
+    env_token = os.environ.get("ACCESS_TOKEN")
+    org_a = HawkinClient(refreshToken="org_a")
+    org_b = HawkinClient(refreshToken="org_b", region="Europe")
+
+    # Check independent state and nothing written to env
+    assert org_a.session is not org_b.session
+    assert org_b.url_cloud == "https://eu.cloud.hawkindynamics.com/api/dev"
+    assert os.environ.get("ACCESS_TOKEN") == env_token
+
+    with patch.object(org_a.session, 'request', side_effect=mock_teams), patch.object(org_b.session, 'request', side_effect=mock_teams):
+        teams_a = org_a.GetTeams()
+        teams_b = org_b.GetTeams()
+
+    # Check each request used its own client
+    assert isinstance(teams_a, pd.DataFrame)
+    assert teams_a['name'][0] == "Bearer access_org_a https://cloud.hawkindynamics.com/api/dev/teams"
+    assert teams_b['name'][0] == "Bearer access_org_b https://eu.cloud.hawkindynamics.com/api/dev/teams"
+
+    org_a.close()
+    org_b.close()
+
+# missing refresh token
+def test_HawkinClient_invalid():
+    with pytest.raises(ValueError):
+        HawkinClient(refreshToken=None)
@@ -0,0 +1,73 @@
+import pytest
+import pandas as pd
+from unittest.mock import patch
+from hdforce.IterTests import IterTests
+
+# Mocked tests request, one test every 10 seconds from 0 to 1000
+def mock_fetchTests(query, client=None):
+    lo, hi = query.get('from', 0), query.get('to', 1000)
+    data = [
+        {
+            'id': f"test_{t}", 'timestamp': t, 'segment': 'Countermovement Jump:1',
+            'testType': {'id': '7nNduHeM5zETPjHxvm7s', 'name': 'Countermovement Jump', 'canonicalId': '7nNduHeM5zETPjHxvm7s', 'tags': []},
+            'athlete': {'id': 'ath_1', 'name': 'Athlete One', 'teams': [], 'groups': [], 'active': True, 'external': {}},
+            'active': t != 500, 'Jump Height(m)': 0.4
+        }
+        for t in range(0, 1001, 10) if lo <= t <= hi
+    ]
+    last = max([d['timestamp'] for d in data], default=0)
+    return {'data': data, 'count': len(data), 'lastSyncTime': last, 'lastTestTime': last}
+
+# Mocked streamed tests request, values sent after the tests
+def mock_streamTestBatches(query, batchSize=1000, client=None):
+    data = mock_fetchTests(query)
+    records = data.pop('data')
+    for i in range(0, len(records), batchSize):
+        yield records[i:i + batchSize], {}
+    yield [], data
+
+# chunks of N trials
+@patch('hdforce.IterTests.streamTestBatches', side_effect=mock_streamTestBatches)
+def test_IterTests_chunks(mock_stream):
+    chunks = list(IterTests(from_=0, to_=1000, chunkSize=30))
+
+    # Check chunks are DataFrames of at most 30 trials, inactive test removed
+    assert all(isinstance(df, pd.DataFrame) for df in chunks)
+    assert [df.attrs['Count'] for df in chunks] == [30, 29, 30, 11]
+    ids = pd.concat(chunks)['id'].tolist()
+    assert len(ids) == 100
+    assert "test_500" not in ids
+    assert chunks[-1].attrs['Last Sync'] == 1000
+
+    # Check a single chunk without chunkSize
+    chunks = list(IterTests(from_=0, to_=1000, includeInactive=True))
+    assert len(chunks) == 1 and len(chunks[0].index) == 101
+    assert chunks[0].attrs['Last Test Time'] == 1000
+
+# streamed response parsed chunk by chunk, never decoded whole
+def test_IterTests_stream():
+    from hdforce.MockServer import MockServer
+    from hdforce.HawkinClient import HawkinClient
+    with MockServer(trials=250) as server:
+        with HawkinClient(refreshToken="mock", region=server.url) as client:
+            expected = client.GetTests(includeInactive=True)
+            with patch('hdforce.GetTests.responseJson', side_effect=AssertionError("decoded whole")):
+                chunks = list(client.IterTests(chunkSize=40, includeInactive=True))
+
+    assert [len(df.index) for df in chunks] == [40] * 6 + [10]
+    assert pd.concat(chunks)['id'].tolist() == expected['id'].tolist()
+    assert chunks[-1].attrs['Last Sync'] == expected.attrs['Last Sync']
+
+# chunks per window, no duplicates on window edges
+@patch('hdforce.GetTests.fetchTests', side_effect=mock_fetchTests)
+def test_IterTests_window(mock_fetch):
+    chunks = list(IterTests(from_=0, to_=1000, window=100, includeInactive=True, max_workers=2))
+
+    ids = pd.concat(chunks)['id'].tolist()
+    assert ids == [f"test_{t}" for t in range(0, 1001, 10)]
+    assert chunks[0].attrs['Window'][0] == 0
+
+# invalid chunk size
+def test_IterTests_invalid():
+    with pytest.raises(ValueError):
+        next(IterTests(chunkSize=0))
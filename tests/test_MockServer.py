@@ -0,0 +1,43 @@
+import pytest
+import pandas as pd
+from hdforce.MockServer import MockServer, MockData
+from hdforce.HawkinClient import HawkinClient
+from hdforce.Classes import NewAthlete
+
+@pytest.fixture(scope="module")
+def server():
+    with MockServer(trials=300) as server:
+        yield server
+
+# client works end to end against the mock server
+def test_MockServer_client(server):
+    with HawkinClient(refreshToken="mock", region=server.url) as client:
+        tests = client.GetTests()
+        athletes = client.GetAthletes(includeInactive=True)
+        ft = client.GetForceTime(tests['id'].iloc[0])
+
+        # Check synthetic data served
+        assert isinstance(tests, pd.DataFrame)
+        assert tests.attrs['Count'] == 300
+        assert len(athletes.index) == 25
+        assert ft.attrs['Test ID'] == tests['id'].iloc[0]
+        assert len(ft.index) == 2000
+        for df in (client.GetTeams(), client.GetGroups(), client.GetTags(), client.GetTypes(), client.GetMetrics()):
+            assert isinstance(df, pd.DataFrame) and len(df.index) > 0
+
+        # Check query filters applied
+        first = tests['timestamp'].iloc[0]
+        window = client.GetTests(from_=first, to_=first + 86400, includeInactive=True)
+        assert window['timestamp'].between(first, first + 86400).all()
+        cmj = client.GetTests(typeId="CMJ", includeInactive=True)
+        assert (cmj['testType_canonicalId'] == "7nNduHeM5zETPjHxvm7s").all()
+
+        # Check athletes created
+        result = client.CreateAthletes([NewAthlete(name="Mock Athlete")])
+        assert result['successful'] == ["Mock Athlete"]
+
+# same seed, same data
+def test_MockData_seed():
+    a, b = MockData(trials=10, seed=3), MockData(trials=10, seed=3)
+    assert a.tests == b.tests
+    assert MockData(trials=10, seed=4).tests != a.tests
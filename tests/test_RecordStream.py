@@ -0,0 +1,47 @@
+import json
+import pandas as pd
+import pytest
+import requests
+from hdforce.utils import RecordStream
+from hdforce.MockServer import MockServer
+from hdforce.HawkinClient import HawkinClient
+
+@pytest.fixture(scope="module")
+def client():
+    with MockServer(trials=500) as server:
+        with HawkinClient(refreshToken="mock", region=server.url) as client:
+            yield client
+
+def make_response(body: bytes):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.encoding = "utf-8"
+    return response
+
+# records and other values are the same whatever the chunk size
+def test_RecordStream_chunks():
+    data = {"count": 3, "data": [{"id": "a", "tags": [{"name": "}]"}]}, {"id": "b é"}, {"id": "c", "n": 12345}], "lastTestTime": 1690000001}
+    body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    for size in (1, 3, 64, 65536):
+        stream = RecordStream(make_response(body), chunkSize=size)
+        assert list(stream) == data["data"]
+        assert stream.values == {"count": 3, "lastTestTime": 1690000001}
+        assert stream.bytes == len(body)
+    assert [len(batch) for batch in RecordStream(make_response(body)).batches(2)] == [2, 1]
+
+# a cut off body is an error
+def test_RecordStream_truncated():
+    with pytest.raises(ValueError):
+        list(RecordStream(make_response(b'{"data": [{"id": "a"}, {"id"'), chunkSize=4))
+    with pytest.raises(ValueError):
+        list(RecordStream(make_response(b'[1, 2]')))
+
+# streamed tests match the decoded response
+def test_GetTests_stream(client):
+    df = client.GetTests()
+    streamed = client.GetTests(stream=True)
+    pd.testing.assert_frame_equal(streamed, df)
+    assert streamed.attrs == df.attrs
+    with pytest.raises(ValueError):
+        client.GetTests(stream=True, window=86400)
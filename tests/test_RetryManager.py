@@ -0,0 +1,82 @@
+import pytest
+import time
+import requests
+from unittest.mock import patch, MagicMock
+from hdforce.utils import RetryManager, RateLimiter, apiRequest
+
+# Build a mocked response
+def mock_response(status, headers=None):
+    return MagicMock(status_code=status, headers=headers or {})
+
+# Fixture restoring default retry settings
+@pytest.fixture(autouse=True)
+def default_retry():
+    RetryManager.configure(backoff_factor=0.001)
+    yield
+    RetryManager.configure()
+
+# 503 is retried until successful
+def test_apiRequest_retry():
+    session = MagicMock()
+    session.request.side_effect = [mock_response(503), mock_response(502), mock_response(200)]
+    response = apiRequest("GET", "https://cloud.hawkindynamics.com/api/dev", session=session)
+
+    # Check final response returned
+    assert response.status_code == 200
+    assert session.request.call_count == 3
+
+# Retries stop after max_retries
+def test_apiRequest_exhausted():
+    RetryManager.configure(max_retries=2, backoff_factor=0.001)
+    session = MagicMock()
+    session.request.return_value = mock_response(503)
+    response = apiRequest("GET", "https://cloud.hawkindynamics.com/api/dev", session=session)
+
+    # Check last error response returned
+    assert response.status_code == 503
+    assert session.request.call_count == 3
+
+# Retry-After is honored
+@patch('hdforce.utils.time.sleep')
+def test_apiRequest_retry_after(mock_sleep):
+    session = MagicMock()
+    session.request.side_effect = [mock_response(429, {"Retry-After": "2"}), mock_response(200)]
+    response = apiRequest("GET", "https://cloud.hawkindynamics.com/api/dev", session=session)
+
+    # Check wait taken from header
+    assert response.status_code == 200
+    mock_sleep.assert_called_once_with(2.0)
+
+# POST not retried on server error
+def test_apiRequest_post():
+    session = MagicMock()
+    session.request.return_value = mock_response(503)
+    response = apiRequest("POST", "https://cloud.hawkindynamics.com/api/dev/athletes/bulk", session=session, json=[])
+
+    # Check single attempt
+    assert response.status_code == 503
+    assert session.request.call_count == 1
+
+# Connection errors are retried
+def test_apiRequest_connection_error():
+    session = MagicMock()
+    session.request.side_effect = [requests.ConnectionError("reset"), mock_response(200)]
+    response = apiRequest("GET", "https://cloud.hawkindynamics.com/api/dev", session=session)
+
+    # Check recovered
+    assert response.status_code == 200
+
+# Token bucket limits request rate
+def test_RateLimiter():
+    limiter = RateLimiter(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+
+    # Check 5 waits of 1/50 s
+    assert time.monotonic() - start >= 0.09
+
+# Invalid rate
+def test_RateLimiter_invalid():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
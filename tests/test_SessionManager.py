@@ -0,0 +1,41 @@
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+from hdforce.utils import SessionManager, apiRequest
+
+# shared session is reused between calls
+def test_SessionManager_reuse():
+    SessionManager.close()
+    session = SessionManager.get_session()
+
+    # Check same session returned
+    assert isinstance(session, requests.Session)
+    assert SessionManager.get_session() is session
+
+# configure rebuilds session with new pool size
+def test_SessionManager_configure():
+    old = SessionManager.get_session()
+    SessionManager.configure(pool_connections=4, pool_maxsize=32)
+    new = SessionManager.get_session()
+
+    # Check new session uses configured pool
+    assert new is not old
+    assert new.get_adapter("https://cloud.hawkindynamics.com")._pool_maxsize == 32
+
+    # Restore defaults
+    SessionManager.configure()
+
+# invalid pool size
+def test_SessionManager_invalid():
+    with pytest.raises(ValueError):
+        SessionManager.configure(pool_maxsize=0)
+
+# requests go through the shared session
+@patch('hdforce.utils.requests.Session.request')
+def test_apiRequest(mock_request):
+    mock_request.return_value = MagicMock(status_code=200)
+    response = apiRequest("GET", "https://cloud.hawkindynamics.com/api/dev", headers={"Authorization": "Bearer x"})
+
+    # Check call passed through
+    assert response.status_code == 200
+    mock_request.assert_called_once_with("GET", "https://cloud.hawkindynamics.com/api/dev", headers={"Authorization": "Bearer x"})
@@ -0,0 +1,76 @@
+import pytest
+from hdforce.utils import StatsManager, stats
+from hdforce.MockServer import MockServer
+from hdforce.HawkinClient import HawkinClient
+
+@pytest.fixture(scope="module")
+def client():
+    with MockServer(trials=200) as server:
+        with HawkinClient(refreshToken="mock", region=server.url) as client:
+            yield client
+
+# Empty stats and no hooks for each test
+@pytest.fixture(autouse=True)
+def reset_stats():
+    StatsManager.configure()
+    yield
+    StatsManager._hooks = []
+    StatsManager.configure()
+
+# calls are recorded with phases, bytes and rows
+def test_StatsManager_record(client):
+    records = []
+    StatsManager.add_hook(records.append)
+    df = client.GetTests()
+    ft = client.GetForceTime(df['id'].iloc[0])
+
+    # Check hook records
+    assert [r.endpoint for r in records] == ["GetTests", "GetForceTime"]
+    tests = records[0]
+    assert tests.rows == len(df.index)
+    assert tests.requests == 1 and tests.bytes > 0 and tests.status == 200
+    assert {"request", "decode", "parse"} <= set(tests.phases)
+    assert sum(tests.phases.values()) <= tests.seconds
+    assert records[1].rows == len(ft.index)
+
+    # Check aggregated stats
+    summary = stats()
+    assert summary["GetTests"]["calls"] == 1
+    assert summary["GetTests"]["rows"] == len(df.index)
+    assert sum(summary["GetTests"]["counts"]) == 1
+    assert len(summary["GetTests"]["counts"]) == len(StatsManager.buckets) + 1
+
+# generator calls are one record, and errors are counted
+def test_StatsManager_iter_and_errors(client):
+    chunks = list(client.IterTests(chunkSize=50, includeInactive=True))
+    with pytest.raises(Exception):
+        client.GetForceTime("missing")
+    summary = stats()
+    assert summary["IterTests"]["calls"] == 1
+    assert summary["IterTests"]["rows"] == sum(len(c.index) for c in chunks)
+    assert summary["GetForceTime"]["errors"] == 1
+
+# failing hooks do not fail calls, and measuring can be turned off
+def test_StatsManager_hooks_and_disable(client):
+    def broken(record):
+        raise RuntimeError("hook failed")
+    StatsManager.add_hook(broken)
+    assert len(client.GetTeams().index) > 0
+    StatsManager.remove_hook(broken)
+
+    StatsManager.configure(enabled=False)
+    client.GetTeams()
+    assert stats() == {}
+    with pytest.raises(ValueError):
+        StatsManager.configure(buckets=[])
+
+# bulk force-time requests are counted in one GetForceTimeBulk call
+def test_StatsManager_bulk(client):
+    ids = list(client.GetTests()['id'].iloc[:5])
+    StatsManager.configure()
+    records = []
+    StatsManager.add_hook(records.append)
+    client.GetForceTimeBulk(ids, max_workers=3)
+    assert [r.endpoint for r in records] == ["GetForceTimeBulk"]
+    assert records[0].requests == len(ids)
+    assert "GetForceTime" not in stats()
@@ -0,0 +1,81 @@
+import pandas as pd
+from unittest.mock import patch
+from hdforce.SyncTests import TestStore, SyncTests
+
+# Mocked test record
+def record(tid, t, active=True, height=0.4):
+    return {
+        'id': tid, 'timestamp': t, 'segment': 'Countermovement Jump:1',
+        'testType': {'id': '7nNduHeM5zETPjHxvm7s', 'name': 'Countermovement Jump', 'canonicalId': '7nNduHeM5zETPjHxvm7s', 'tags': []},
+        'athlete': {'id': 'ath_1', 'name': 'Athlete One', 'teams': [], 'groups': [], 'active': True, 'external': {}},
+        'active': active, 'Jump Height(m)': height
+    }
+
+# Mocked API: full history, then one changed and one new test since sync time 200
+def mock_fetchTests(query, client=None):
+    if 'syncFrom' in query:
+        assert query['syncFrom'] == 200
+        data = [record('test_2', 150, height=0.45), record('test_4', 300), record('test_3', 180, active=False)]
+        return {'data': data, 'count': 3, 'lastSyncTime': 300, 'lastTestTime': 300}
+    data = [record('test_1', 100), record('test_2', 150), record('test_3', 180)]
+    return {'data': data, 'count': 3, 'lastSyncTime': 200, 'lastTestTime': 180}
+
+# full then incremental sync
+@patch('hdforce.SyncTests.fetchTests', side_effect=mock_fetchTests)
+def test_SyncTests(mock_fetch, tmp_path):
+    path = str(tmp_path / "tests.sqlite")
+
+    # First sync fetches everything
+    result = SyncTests(store=path)
+    assert result == {"updated": 3, "lastSync": 200, "total": 3}
+
+    # Second sync fetches changes and upserts by id
+    result = SyncTests(store=path)
+    assert result == {"updated": 3, "lastSync": 300, "total": 4}
+
+    with TestStore(path) as store:
+        df = store.load()
+        # Check inactive test removed and changed test replaced
+        assert isinstance(df, pd.DataFrame)
+        assert df['id'].tolist() == ['test_1', 'test_2', 'test_4']
+        assert df.loc[df['id'] == 'test_2', 'Jump Height(m)'].item() == 0.45
+        assert df.attrs['Last Sync'] == 300
+
+        # Check filters
+        assert store.load(from_=120, to_=200)['id'].tolist() == ['test_2']
+        assert len(store.load(typeId="CMJ", includeInactive=True).index) == 4
+
+# Mocked windows of a first sync: test_1 is changed at 250, after its window was fetched
+def mock_fetchTestWindows(query, start, end, window, client=None):
+    yield 0, 120, {'data': [record('test_1', 100)], 'count': 1, 'lastSyncTime': 200}
+    yield 120, 240, {'data': [], 'count': 0, 'lastSyncTime': 0}
+    yield 240, end, {'data': [record('test_2', 240)], 'count': 1, 'lastSyncTime': 300}
+
+# windowed first sync keeps the oldest window sync time, so later changes are not skipped
+@patch('hdforce.SyncTests.fetchTestWindows', side_effect=mock_fetchTestWindows)
+def test_SyncTests_window_cursor(mock_windows, tmp_path):
+    result = SyncTests(store=str(tmp_path / "tests.sqlite"), window=120)
+    assert result == {"updated": 2, "lastSync": 200, "total": 2}
+
+# empty store
+def test_TestStore_empty(tmp_path):
+    with TestStore(str(tmp_path / "tests.sqlite")) as store:
+        assert store.last_sync is None
+        assert len(store) == 0
+        assert store.load().attrs['Count'] == 0
+
+# clients of different organizations sync into separate default stores
+def test_SyncTests_orgs(tmp_path, monkeypatch):
+    from hdforce.utils import ConfigManager
+    from hdforce.MockServer import MockServer, MockData
+    from hdforce.HawkinClient import HawkinClient
+    monkeypatch.setattr(ConfigManager, "cache_dir", str(tmp_path))
+    with MockServer(data=MockData(trials=120, seed=1)) as a, MockServer(data=MockData(trials=80, seed=2)) as b:
+        with HawkinClient(refreshToken="org-a", region=a.url) as client_a, HawkinClient(refreshToken="org-b", region=b.url) as client_b:
+            assert client_a.SyncTests()["total"] == 120
+            assert client_b.SyncTests()["total"] == 80
+            with TestStore(client=client_a) as store_a, TestStore(client=client_b) as store_b:
+                assert store_a.path != store_b.path
+                ids_a = set(store_a.load(includeInactive=True)['id'])
+                ids_b = set(store_b.load(includeInactive=True)['id'])
+    assert len(ids_a) == 120 and len(ids_b) == 80 and not ids_a & ids_b
@@ -0,0 +1,121 @@
+import pytest
+import os
+import time
+from unittest.mock import patch, MagicMock
+from hdforce.utils import TokenProvider
+
+# Mocked TokenManager session
+def mock_session(expires_in=3600):
+    return MagicMock(
+        accessToken="access_token_1",
+        ExpirationVal=int(time.time()) + expires_in,
+        url_cloud="https://cloud.hawkindynamics.com/api/dev"
+    )
+
+# valid token is served from memory
+@patch('hdforce.utils.load_dotenv')
+@patch('hdforce.utils.TokenManager')
+def test_TokenProvider_memory(mock_tm, mock_load):
+    provider = TokenProvider(refreshToken="refresh", method=None, accessToken="cached", expiration=int(time.time()) + 3600)
+
+    # Check no refresh and no file reads
+    assert provider.get_token() == "cached"
+    mock_tm.assert_not_called()
+    mock_load.assert_not_called()
+
+# expired token is refreshed and persisted to env
+@patch('hdforce.utils.TokenManager', return_value=mock_session())
+def test_TokenProvider_refresh_env(mock_tm):
+    provider = TokenProvider(refreshToken="refresh", method="env", accessToken="old", expiration=0)
+
+    # Check new token retrieved and stored
+    assert provider.get_token() == "access_token_1"
+    assert mock_tm.call_count == 1
+    assert os.environ["ACCESS_TOKEN"] == "access_token_1"
+    assert os.environ["CLOUD_URL"] == "https://cloud.hawkindynamics.com/api/dev"
+
+    # Check second call served from memory
+    provider.get_token()
+    assert mock_tm.call_count == 1
+
+# refreshed token persisted to .env file
+@patch('hdforce.utils.TokenManager', return_value=mock_session())
+def test_TokenProvider_refresh_file(mock_tm, tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("HD_REFRESH_TOKEN=refresh\n")
+    provider = TokenProvider(refreshToken="refresh", method="file", fileName=str(env_file))
+    provider.get_token()
+
+    # Check values written to file
+    assert "ACCESS_TOKEN='access_token_1'" in env_file.read_text()
+
+# failed refresh
+@patch('hdforce.utils.TokenManager', side_effect=ValueError("Error 401: Refresh Token is invalid or expired."))
+def test_TokenProvider_failed(mock_tm):
+    provider = TokenProvider(refreshToken="refresh", method=None)
+    with pytest.raises(Exception, match="Failed to authenticate"):
+        provider.get_token()
+
+# no token available
+def test_TokenProvider_missing():
+    provider = TokenProvider(refreshToken=None, method=None)
+    with pytest.raises(Exception, match="No Access Token found."):
+        provider.get_token()
+
+# concurrent callers share a single refresh
+def test_TokenProvider_single_flight():
+    import threading
+
+    def slow_session(**kwargs):
+        time.sleep(0.05)
+        return mock_session()
+
+    with patch('hdforce.utils.TokenManager', side_effect=slow_session) as mock_tm:
+        provider = TokenProvider(refreshToken="refresh", method=None, accessToken="old", expiration=0)
+        tokens = []
+        threads = [threading.Thread(target=lambda: tokens.append(provider.get_token())) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    # Check one token request for all threads
+    assert mock_tm.call_count == 1
+    assert tokens == ["access_token_1"] * 10
+
+# token renewed in background before expiring
+def test_TokenProvider_background_renewal():
+    with patch('hdforce.utils.TokenManager', return_value=mock_session(expires_in=3600)) as mock_tm:
+        provider = TokenProvider(refreshToken="refresh", method=None, accessToken="old", expiration=int(time.time()) + 2, renewBefore=2)
+        time.sleep(1.3)
+        provider.stop_renewal()
+
+    # Check renewed without a caller
+    assert mock_tm.call_count == 1
+    assert provider.accessToken == "access_token_1"
+
+# renewBefore longer than the token lifetime does not flood the token endpoint
+def test_TokenProvider_renewal_floor():
+    from hdforce.MockServer import MockServer
+    from hdforce.HawkinClient import HawkinClient
+    with MockServer(trials=0, tokenTTL=5) as server:
+        with HawkinClient(refreshToken="mock", region=server.url, renewBefore=10):
+            time.sleep(3.5)
+        requests = server.requests
+
+    # First token, then at most one renewal per second
+    assert 1 < requests <= 5
+
+# renewBefore longer than the token lifetime does not renew on every call
+@patch('hdforce.utils.TokenManager', side_effect=lambda **kwargs: mock_session(expires_in=5))
+def test_TokenProvider_renewal_margin(mock_tm):
+    provider = TokenProvider(refreshToken="refresh", method=None, renewBefore=10)
+    try:
+        tokens = [provider.get_token() for _ in range(20)]
+    finally:
+        provider.stop_renewal()
+
+    # Check one token request, renewal due halfway through the token lifetime
+    assert mock_tm.call_count == 1
+    assert tokens == ["access_token_1"] * 20
+    assert provider._renewal_margin() <= 2.5
@@ -20,7 +20,7 @@ def mock_failure_response(formatted_time):
     }
 
 # Successful call with file
-@patch('hdforce.UpdateAthletes.requests.put')
+@patch('hdforce.UpdateAthletes.apiRequest')
 def test_UpdateAthletes_file(mock_put):
     # Get the current time
     current_time = datetime.now()
@@ -54,7 +54,7 @@ def test_UpdateAthletes_file(mock_put):
     assert response[0].reason == []
 
 # Successful call with env
-@patch('hdforce.UpdateAthletes.requests.put')
+@patch('hdforce.UpdateAthletes.apiRequest')
 def test_UpdateAthletes_env(mock_put):
     # Get the current time
     current_time = datetime.now()
@@ -88,7 +88,7 @@ def test_UpdateAthletes_env(mock_put):
     assert response[0].reason == []
 
 # Test for failure response
-@patch('hdforce.UpdateAthletes.requests.put')
+@patch('hdforce.UpdateAthletes.apiRequest')
 def test_UpdateAthletes_failure(mock_put):
     # Get the current time
     current_time = datetime.now()
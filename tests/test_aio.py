@@ -0,0 +1,53 @@
+import pytest
+import asyncio
+import threading
+import time
+import pandas as pd
+from unittest.mock import patch
+from hdforce import aio
+
+# Tracks the number of calls running at once
+class Tracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def __call__(self, testId, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        df = pd.DataFrame({"Time(s)": [0.0]})
+        df.attrs['Test ID'] = testId
+        return df
+
+# concurrent calls are bounded by max_concurrency
+def test_AsyncClient_bounded():
+    tracker = Tracker()
+
+    async def run():
+        async with aio.AsyncClient(max_concurrency=3) as client:
+            return await asyncio.gather(*[client.GetForceTime(f"test_{i}") for i in range(12)])
+
+    with patch('hdforce.aio._GetForceTime', tracker):
+        results = asyncio.run(run())
+
+    # Check all results returned in order and limit respected
+    assert [df.attrs['Test ID'] for df in results] == [f"test_{i}" for i in range(12)]
+    assert 1 < tracker.peak <= 3
+
+# module level functions use the default client
+def test_aio_module():
+    with patch('hdforce.aio._GetTests', lambda **kwargs: kwargs):
+        result = asyncio.run(aio.GetTests(from_=1690859091, to_=1695688065))
+
+    # Check arguments passed through
+    assert result == {"from_": 1690859091, "to_": 1695688065}
+
+# invalid concurrency
+def test_AsyncClient_invalid():
+    with pytest.raises(ValueError):
+        aio.AsyncClient(max_concurrency=0)
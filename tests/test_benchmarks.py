@@ -0,0 +1,27 @@
+import json
+from benchmarks.run import measure, compare
+from benchmarks import payloads
+
+# synthetic payloads have the requested size
+def test_benchmark_payloads():
+    tests = json.loads(payloads.testsPayload(1200))
+    assert tests['count'] == 1200
+    assert len({t['id'] for t in tests['data']}) == 1200
+    metrics = json.loads(payloads.metricsPayload(250))
+    assert sum(len(t['metrics']) for t in metrics) == 250
+    assert len(json.loads(payloads.forceTimePayload(300))['Time(s)']) == 300
+
+# a case reports time, memory and allocations
+def test_benchmark_measure():
+    result = measure("parse.responseHandler", 100, repeat=1)
+    assert result['size'] == 100
+    assert result['seconds'] > 0
+    assert result['alloc_peak_mb'] > 0
+
+# slower results than the baseline are regressions
+def test_benchmark_compare():
+    baseline = {"results": [{"case": "parse.GetMetrics", "size": 100, "seconds": 1.0, "alloc_peak_mb": 2.0}]}
+    same = [{"case": "parse.GetMetrics", "size": 100, "seconds": 1.1, "alloc_peak_mb": 2.0}]
+    slower = [{"case": "parse.GetMetrics", "size": 100, "seconds": 1.5, "alloc_peak_mb": 2.0}]
+    assert compare(same, baseline, 1.25) == []
+    assert compare(slower, baseline, 1.25)[0][2] == "seconds"
@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+from hdforce.utils import responseHandler, compactFrame
+from hdforce.MockServer import MockData
+
+# compact dtypes keep the values and use less memory
+def test_compactFrame():
+    data = {"data": MockData(trials=500).tests}
+    full = responseHandler(data)
+    df = responseHandler(data, compact=True)
+    assert list(df.columns) == list(full.columns)
+    assert df.memory_usage(deep=True).sum() < full.memory_usage(deep=True).sum()
+
+    assert isinstance(df['timestamp'].dtype, pd.DatetimeTZDtype)
+    assert list((df['timestamp'] - pd.Timestamp(0, tz='UTC')) // pd.Timedelta(seconds=1)) == list(full['timestamp'])
+    assert df['Jump Height(m)'].dtype == np.float32
+    np.testing.assert_allclose(df['Jump Height(m)'], full['Jump Height(m)'], rtol=1e-6)
+    assert isinstance(df['athlete_name'].dtype, pd.CategoricalDtype)
+    assert isinstance(df['testType_canonicalId'].dtype, pd.CategoricalDtype)
+    assert list(df['athlete_name'].astype(str)) == list(full['athlete_name'])
+    assert not isinstance(df['id'].dtype, pd.CategoricalDtype)
+    assert list(df['tag_ids']) == list(full['tag_ids'])
+
+# missing integer and boolean values become nullable dtypes
+def test_compactFrame_nullable():
+    df = pd.DataFrame({"count": pd.Series([1, np.nan, 3], dtype=object), "flag": pd.Series([True, np.nan, False], dtype=object)})
+    df.attrs['Count'] = 3
+    compact = compactFrame(df)
+    assert str(compact['count'].dtype) == "Int64" and compact['count'].isna().tolist() == [False, True, False]
+    assert str(compact['flag'].dtype) == "boolean"
+    assert compact.attrs['Count'] == 3
@@ -0,0 +1,22 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def run(code):
+    return subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True).stdout.split()
+
+# importing the package loads no heavy dependencies
+def test_import_lazy():
+    loaded = run("import sys, hdforce; print(*[m for m in ('pandas', 'requests', 'pydantic') if m in sys.modules] or ['none'])")
+    assert loaded == ["none"]
+    loaded = run("import sys; from hdforce import AuthManager, HawkinClient; print('pandas' in sys.modules, 'pydantic' in sys.modules)")
+    assert loaded == ["False", "False"]
+
+# public names resolve to the functions, also after their modules are imported
+def test_import_names():
+    names = run("import hdforce, hdforce.SyncTests; from hdforce import aio; print(callable(hdforce.GetTests), hdforce.GetTests.__name__, hdforce.SyncTests.__name__, 'GetTests' in dir(hdforce))")
+    assert names == ["True", "GetTests", "SyncTests", "True"]
+    missing = subprocess.run([sys.executable, "-c", "import hdforce; hdforce.Missing"], cwd=ROOT, capture_output=True, text=True)
+    assert "AttributeError" in missing.stderr
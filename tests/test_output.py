@@ -0,0 +1,50 @@
+import importlib.util
+import numpy as np
+import pytest
+from hdforce.utils import checkOutput
+from hdforce.MockServer import MockServer
+from hdforce.HawkinClient import HawkinClient
+
+@pytest.fixture(scope="module")
+def client():
+    with MockServer(trials=200) as server:
+        with HawkinClient(refreshToken="mock", region=server.url) as client:
+            yield client
+
+# unknown outputs and compact tables are rejected before any request
+def test_checkOutput():
+    checkOutput("pandas", compact=True)
+    with pytest.raises(ValueError):
+        checkOutput("csv")
+    with pytest.raises(ValueError):
+        checkOutput("arrow", compact=True)
+
+@pytest.mark.skipif(importlib.util.find_spec("pyarrow") is not None, reason="pyarrow is installed")
+def test_output_missing_pyarrow(client):
+    with pytest.raises(ImportError, match=r"requires pyarrow.*hdforce\[arrow\]"):
+        client.GetTests(output="arrow")
+
+# arrow tables have the columns, values and attributes of the DataFrames
+def test_GetTests_arrow(client):
+    pytest.importorskip("pyarrow")
+    df = client.GetTests()
+    table = client.GetTests(output="arrow")
+    assert table.column_names == list(df.columns)
+    assert table.column("id").to_pylist() == list(df["id"])
+    np.testing.assert_allclose(table.column("Jump Height(m)").to_numpy(zero_copy_only=False), df["Jump Height(m)"])
+    assert table.schema.metadata[b"Count"] == str(df.attrs["Count"]).encode()
+
+    tid = df["id"].iloc[0]
+    ft = client.GetForceTime(tid)
+    ft_table = client.GetForceTime(tid, output="arrow")
+    assert ft_table.column_names == list(ft.columns)
+    np.testing.assert_allclose(ft_table.column("CombinedForce(N)").to_numpy(), ft["CombinedForce(N)"])
+    with pytest.raises(ValueError):
+        client.GetForceTime(tid, asTrace=True, output="arrow")
+
+def test_GetTests_polars(client):
+    pytest.importorskip("polars")
+    pytest.importorskip("pyarrow")
+    df = client.GetTests(columns=["mRSI"])
+    frame = client.GetTests(columns=["mRSI"], output="polars")
+    assert frame.columns == list(df.columns) and frame.height == len(df.index)
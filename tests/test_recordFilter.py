@@ -0,0 +1,95 @@
+import pytest
+from hdforce.utils import responseHandler, recordFilter, ColumnBuilder
+from hdforce.MockServer import MockServer, MockData
+from hdforce.HawkinClient import HawkinClient
+
+@pytest.fixture(scope="module")
+def client():
+    with MockServer(trials=300) as server:
+        with HawkinClient(refreshToken="mock", region=server.url) as client:
+            yield client
+
+# filtering raw records gives the same rows as filtering the frame
+def test_responseHandler_where():
+    data = {"data": MockData(trials=200).tests}
+    full = responseHandler(data)
+    active = responseHandler(data, where=recordFilter(includeInactive=False))
+    expected = full[full['active'] == True].reset_index(drop=True)
+    assert len(active.index) < len(full.index)
+    assert list(active['id']) == list(expected['id'])
+
+    tag = full['tag_ids'].explode().dropna().iloc[0]
+    tagged = responseHandler(data, where=recordFilter(tagId=[tag]))
+    assert list(tagged['id']) == [i for i, tags in zip(full['id'], full['tag_ids']) if tag in tags]
+
+# rejected records are counted, never added
+def test_ColumnBuilder_skipped():
+    records = MockData(trials=100).tests
+    builder = ColumnBuilder(where=lambda record: record['athlete']['id'] == records[0]['athlete']['id']).extend(records)
+    assert builder.rows + builder.skipped == len(records)
+    assert set(builder.columns()['athlete.id']) == {records[0]['athlete']['id']}
+    assert recordFilter() is None
+    with pytest.raises(ValueError):
+        recordFilter(tagId=1)
+    with pytest.raises(ValueError):
+        recordFilter(where="active")
+
+# GetTests and IterTests filter with includeInactive, tagId and where
+def test_GetTests_where(client):
+    everything = client.GetTests(includeInactive=True)
+    active = client.GetTests()
+    assert active['active'].all() and len(active.index) == everything['active'].sum()
+
+    # Count is the server total, Rows what is left after filtering
+    assert active.attrs['Count'] == everything.attrs['Count'] == len(everything.index)
+    assert active.attrs['Rows'] == len(active.index) < active.attrs['Count']
+    assert client.GetTests(window=10**8).attrs['Count'] == active.attrs['Count']
+
+    athlete = everything['athlete_id'].iloc[0]
+    df = client.GetTests(where=lambda record: record['athlete']['id'] == athlete)
+    assert set(df['athlete_id']) == {athlete}
+    assert len(df.index) == len(active[active['athlete_id'] == athlete].index)
+
+    chunks = list(client.IterTests(chunkSize=50, where=lambda record: record['athlete']['id'] == athlete))
+    assert sum(len(chunk.index) for chunk in chunks) == len(df.index)
+
+    # every test filtered out
+    empty = client.GetTests(where=lambda record: False)
+    assert empty.empty
+    assert {'id', 'timestamp', 'active', 'athlete_id', 'athlete_name', 'testType_name'} <= set(empty.columns)
+    assert empty.attrs['Rows'] == 0 and empty.attrs['Count'] > 0
+
+    # projected columns are kept too
+    empty = client.GetTests(columns=['athlete_name', 'Jump Height(m)'], includeInactive=True, tagId=['missing'], compact=True)
+    assert empty.empty and 'Jump Height(m)' in empty.columns and list(empty.columns).count('athlete_name') == 1
+
+# every test inactive: GetTestsAth, GetTestsType, GetTestsTeam and GetTestsGroup keep their columns
+def test_GetTests_by_all_inactive():
+    import json
+    import requests
+    from unittest.mock import patch, MagicMock
+    from hdforce.GetTestsAth import GetTestsAth
+    from hdforce.GetTestsType import GetTestsType
+    from hdforce.GetTestsTeam import GetTestsTeam
+    from hdforce.GetTestsGroup import GetTestsGroup
+
+    tests = [dict(test, active=False) for test in MockData(trials=20).tests]
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps({"data": tests, "count": len(tests), "lastSyncTime": 1, "lastTestTime": 1}).encode()
+    provider = MagicMock(url_cloud="https://cloud.hawkindynamics.com/api/dev", get_token=lambda: "token")
+
+    calls = [
+        ('hdforce.GetTestsAth', lambda: GetTestsAth(athleteId="ath_1")),
+        ('hdforce.GetTestsType', lambda: GetTestsType(typeId="Countermovement Jump")),
+        ('hdforce.GetTestsTeam', lambda: GetTestsTeam(teamId="team_1")),
+        ('hdforce.GetTestsGroup', lambda: GetTestsGroup(groupId="group_1")),
+    ]
+    for module, call in calls:
+        with patch(f'{module}.ConfigManager.get_token_provider', return_value=provider), \
+                patch(f'{module}.apiRequest', return_value=response):
+            df = call()
+        assert not isinstance(df, str), f"{module}: {df}"
+        assert df.empty
+        assert {'id', 'timestamp', 'active', 'athlete_id', 'athlete_name', 'testType_name'} <= set(df.columns)
+        assert df.attrs['Count'] == len(tests)
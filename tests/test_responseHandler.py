@@ -0,0 +1,46 @@
+import pytest
+import pandas as pd
+from hdforce.utils import responseHandler
+
+# Mocked tests response
+def mock_tests_response():
+    return {
+        'data': [
+            {
+                'id': 'test_1', 'timestamp': 1690859091, 'segment': 'Countermovement Jump:1',
+                'testType': {'id': '7nNduHeM5zETPjHxvm7s', 'name': 'Countermovement Jump', 'canonicalId': '7nNduHeM5zETPjHxvm7s', 'tags': [{'id': 'tag_1', 'name': 'Pre', 'description': ''}]},
+                'athlete': {'id': 'ath_1', 'name': 'Athlete One', 'teams': ['team_1'], 'groups': [], 'active': True, 'external': {'GradYear': '2025'}},
+                'active': True, 'Jump Height(m)': 0.41, 'Avg. Propulsive Force(N)': 1500.0
+            },
+            {
+                'id': 'test_2', 'timestamp': 1690859191, 'segment': 'Countermovement Jump:2',
+                'testType': {'id': '7nNduHeM5zETPjHxvm7s', 'name': 'Countermovement Jump', 'canonicalId': '7nNduHeM5zETPjHxvm7s', 'tags': []},
+                'athlete': {'id': 'ath_2', 'name': 'Athlete Two', 'teams': [], 'groups': ['group_1'], 'active': True, 'external': {}},
+                'active': False, 'Jump Height(m)': 0.38
+            }
+        ],
+        'count': 2, 'lastSyncTime': 1690859191, 'lastTestTime': 1690859191
+    }
+
+# column layout
+def test_responseHandler_columns():
+    df = responseHandler(mock_tests_response())
+
+    # Check columns and order
+    assert list(df.columns) == [
+        'id', 'timestamp', 'athlete_id', 'athlete_name', 'athlete_teams', 'athlete_groups', 'athlete_active',
+        'external_GradYear', 'testType_id', 'testType_name', 'testType_canonicalId', 'tag_ids', 'tag_names',
+        'segment', 'Jump Height(m)', 'Avg_ Propulsive Force(N)', 'active'
+    ]
+
+# values, tags and missing metrics
+def test_responseHandler_values():
+    df = responseHandler(mock_tests_response())
+
+    # Check tags split into ids and names
+    assert df['tag_ids'][0] == ['tag_1']
+    assert df['tag_names'][1] == []
+    # Check missing values
+    assert pd.isna(df['Avg_ Propulsive Force(N)'][1])
+    assert pd.isna(df['external_GradYear'][1])
+    assert df['active'].tolist() == [True, False]
@@ -0,0 +1,43 @@
+import pytest
+import pandas as pd
+from hdforce.MockServer import MockServer
+from hdforce.HawkinClient import HawkinClient
+from hdforce.utils import SessionManager, CacheManager
+from hdforce.transport import RecordAdapter, ReplayAdapter, CassetteMiss
+
+@pytest.fixture(autouse=True)
+def reset_session():
+    CacheManager.invalidate()
+    yield
+    SessionManager.configure()
+    CacheManager.invalidate()
+
+# responses recorded from a server are replayed without it
+def test_record_replay(tmp_path):
+    cassette = str(tmp_path / "cassette.json")
+
+    # Record
+    with MockServer(trials=50) as server:
+        SessionManager.configure(transport=RecordAdapter(cassette))
+        with HawkinClient(refreshToken="mock", region=server.url) as client:
+            recorded = client.GetTests()
+            teams = client.GetTeams()
+        url = server.url
+        served = server.requests
+
+    # Replay with the server stopped
+    CacheManager.invalidate()
+    SessionManager.configure(transport=ReplayAdapter(cassette))
+    with HawkinClient(refreshToken="mock", region=url) as client:
+        replayed = client.GetTests()
+        pd.testing.assert_frame_equal(client.GetTeams(), teams)
+
+        # Check unrecorded requests fail
+        with pytest.raises(CassetteMiss):
+            client.GetTags()
+
+    pd.testing.assert_frame_equal(replayed, recorded)
+    assert served == 3
+
+    # Check tokens not written to the cassette
+    assert "Bearer" not in open(cassette).read()